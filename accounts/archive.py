@@ -0,0 +1,110 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from .cache import bump_queue_version
+from .models import Application, ArchivedApplication, ArchivedComplaint, Complaint, Tombstone
+
+ARCHIVES = {
+    Complaint: ArchivedComplaint,
+    Application: ArchivedApplication,
+}
+
+# Items nobody works on any more; pending and in-progress ones stay hot however old
+CLOSED_STATUSES = {
+    Complaint: ['resolved', 'rejected'],
+    Application: ['approved', 'rejected'],
+}
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_SLEEP = 0.5
+
+
+def delete_rows(model, ids):
+    """
+    Delete `model` rows by primary key with one plain DELETE: no collector, no
+    cascades and no delete signals. Only for tables nothing cascades from,
+    whose callers apply the post_delete side effects themselves.
+    """
+    connection = connections[router.db_for_write(model)]
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {quote(model._meta.db_table)} WHERE {quote(model._meta.pk.column)} IN '
+            f'({", ".join(["%s"] * len(ids))})',
+            ids,
+        )
+
+
+def archive_after_days():
+    return getattr(settings, 'ARCHIVE_AFTER_DAYS', 7)
+
+
+def cutoff(days=None):
+    return timezone.now() - timedelta(days=archive_after_days() if days is None else days)
+
+
+def closed(model, before):
+    """Hot rows of `model` closed and untouched since `before`"""
+    return model.objects.filter(status__in=CLOSED_STATUSES[model], updated_at__lt=before)
+
+
+def archive_batch(model, before, after_id, batch_size):
+    """
+    Move up to `batch_size` closed rows with id > `after_id` into the archive
+    table in one short transaction. Returns (moved, last_id); last_id is None
+    when none are left.
+    """
+    archive = ARCHIVES[model]
+    fields = [field.attname for field in archive._meta.concrete_fields if field.name != 'archived_at']
+    with transaction.atomic():
+        # skip_locked: a row a live request is writing is left for the next run
+        rows = list(
+            closed(model, before).filter(id__gt=after_id).order_by('id')
+            .select_for_update(skip_locked=True).values(*fields)[:batch_size]
+        )
+        if not rows:
+            return 0, None
+        ids = [row['id'] for row in rows]
+
+        # Same ids, so C/A numbers keep resolving; counters are untouched since they count both tables
+        archive.objects.bulk_create([archive(**row) for row in rows])
+        Tombstone.record_rows(model, rows)
+        departments = {row['department'] for row in rows}
+        transaction.on_commit(lambda: bump_queue_version(*departments))
+
+        # The rows live on in the archive, so none of the post_delete side effects apply
+        delete_rows(model, ids)
+    return len(ids), ids[-1]
+
+
+def execute(before, batch_size=DEFAULT_BATCH_SIZE, sleep=DEFAULT_SLEEP, dry_run=False, log=None):
+    """
+    Archive every closed item older than `before` in primary-key batches,
+    pausing `sleep` seconds between batches. Moved rows leave the hot table, so
+    an interrupted run simply starts over. Returns {model name: stats}.
+    """
+    stats = {}
+    for model in ARCHIVES:
+        name = model._meta.model_name
+        progress = stats[name] = {'moved': 0, 'batches': 0, 'seconds': 0.0}
+        if dry_run:
+            progress['moved'] = closed(model, before).count()
+            continue
+
+        last_id = 0
+        while True:
+            started = time.monotonic()
+            moved, last_id = archive_batch(model, before, last_id, batch_size)
+            progress['seconds'] = round(progress['seconds'] + time.monotonic() - started, 3)
+            if last_id is None:
+                break
+            progress['moved'] += moved
+            progress['batches'] += 1
+            if log:
+                log(f"{name}: batch {progress['batches']}, {progress['moved']} archived so far")
+            time.sleep(sleep)
+    return stats
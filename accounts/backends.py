@@ -1,16 +1,32 @@
 from django.contrib.auth.backends import ModelBackend
 from django.contrib.auth import get_user_model
+from django.db.models import Q
 
 User = get_user_model()
 
 class CollegeIdBackend(ModelBackend):
+    """
+    Sign in with a college ID or an email address, looked up together in one
+    query over their unique indexes. An unknown user still costs one password
+    hash, so a miss takes as long as a wrong password.
+    """
 
     def authenticate(self, request, username=None, password=None, **kwargs):
-        try:
-            user = User.objects.get(college_id=username)
-        except User.DoesNotExist:
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if username is None or password is None:
             return None
 
-        if user.check_password(password):
+        candidates = list(User._default_manager.filter(Q(college_id=username) | Q(email=username))[:2])
+        # A college ID that happens to equal someone's email wins
+        user = next((candidate for candidate in candidates if candidate.college_id == username), None)
+        if user is None and candidates:
+            user = candidates[0]
+
+        if user is None:
+            User().set_password(password)
+            return None
+        # check_password rehashes with PASSWORD_HASHERS[0] when the stored hash is outdated
+        if user.check_password(password) and self.user_can_authenticate(user):
             return user
         return None
@@ -0,0 +1,60 @@
+from . import serializers, visibility
+from .counters import summarize
+from .notifications import unread_count
+from .pagination import paginate
+from .sync import new_token
+
+
+def _first_page(queryset, format_row):
+    page = paginate(queryset, {})
+    return {'rows': [format_row(row) for row in page.rows], 'next_cursor': page.next_cursor}
+
+
+def student_data(user):
+    """Both of the student's lists and their unread badge"""
+    return {
+        'success': True,
+        # Taken before any list is read, so the first sync covers everything after
+        'sync_token': new_token(),
+        'complaints': [
+            serializers.student_complaint(row)
+            for row in visibility.with_archive(
+                visibility.complaint_queue(user), visibility.complaint_queue(user, archived=True),
+                serializers.STUDENT_COMPLAINT_FIELDS,
+            )
+        ],
+        'applications': [
+            serializers.student_application(row)
+            for row in visibility.with_archive(
+                visibility.application_queue(user), visibility.application_queue(user, archived=True),
+                serializers.STUDENT_APPLICATION_FIELDS,
+            )
+        ],
+        'unread_count': unread_count(user),
+    }
+
+
+def queue_data(user):
+    """The first unfiltered page of both queues and the counter totals"""
+    return {
+        'success': True,
+        'sync_token': new_token(),
+        'complaints': _first_page(
+            visibility.complaint_queue(user).values(*serializers.COMPLAINT_FIELDS), serializers.complaint
+        ),
+        'applications': _first_page(
+            visibility.application_queue(user).values(*serializers.APPLICATION_FIELDS), serializers.application
+        ),
+        'stats': {
+            'complaints': summarize(visibility.complaint_counters(user)),
+            'applications': summarize(visibility.application_counters(user)),
+        },
+    }
+
+
+def dashboard_data(user):
+    """
+    Everything a dashboard shows on first paint, in four queries: embedded in
+    the page with json_script, or fetched from /accounts/bootstrap/ on refresh.
+    """
+    return student_data(user) if user.role == 'student' else queue_data(user)
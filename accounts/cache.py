@@ -0,0 +1,110 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .routers import lag_seconds, reading_replica
+
+# Roles whose queue is a single department; every other staff-side role sees all of them
+DEPARTMENT_ROLES = ['staff', 'dsw', 'exam_controller']
+ALL_DEPARTMENTS = '*'
+
+VERSION_KEY = 'queue-version:{}'
+STATS_KEY = 'queue-cache-stats:{}'
+
+
+def _cache():
+    return caches[getattr(settings, 'QUEUE_CACHE_ALIAS', 'default')]
+
+
+def _timeout():
+    return getattr(settings, 'QUEUE_CACHE_TIMEOUT', 300)
+
+
+def queue_scope(user):
+    """The department a user's queue is drawn from, or ALL_DEPARTMENTS"""
+    return user.role if user.role in DEPARTMENT_ROLES else ALL_DEPARTMENTS
+
+
+def bump_queue_version(*departments):
+    """
+    Invalidate every cached page that could contain rows from these departments.
+    Versions are unique stamps rather than incremented counters, so two workers
+    bumping at once on a non-atomic backend (file cache) can never collapse
+    into one version.
+    """
+    stamp = str(time.time_ns())
+    cache = _cache()
+    cache.set_many(
+        {VERSION_KEY.format(scope): stamp for scope in set(departments) | {ALL_DEPARTMENTS}},
+        timeout=None,
+    )
+
+
+def _version(scope):
+    cache = _cache()
+    key = VERSION_KEY.format(scope)
+    version = cache.get(key)
+    if version is None:
+        version = str(time.time_ns())
+        # add() so a concurrent bump wins over our initial value
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key, version)
+    return version
+
+
+def page_key(kind, user, params):
+    """
+    Cache key for one serialized queue page. Read it before querying so that a
+    write committed mid-request files our result under the superseded version.
+    """
+    scope = queue_scope(user)
+    query = '&'.join(f'{name}={value}' for name, value in sorted(params.items()))
+    digest = hashlib.md5(query.encode()).hexdigest()
+    return f'queue:{kind}:{user.role}:{_version(scope)}:{digest}'
+
+
+def _count(outcome):
+    cache = _cache()
+    key = STATS_KEY.format(outcome)
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Evicted between add() and incr(); statistics are best effort
+        pass
+
+
+def get_page(key):
+    content = _cache().get(key)
+    _count('hits' if content is not None else 'misses')
+    return content
+
+
+def settled(key):
+    """False while the page may come from a replica that has not caught up with the key's version"""
+    return not reading_replica() or time.time_ns() - int(key.split(':')[3]) >= lag_seconds() * 1e9
+
+
+def set_page(key, content):
+    if not settled(key):
+        # The replica may not have the write behind this version yet; serve the page but do not keep it
+        return
+    _cache().set(key, content, timeout=_timeout())
+
+
+def stats():
+    values = _cache().get_many([STATS_KEY.format('hits'), STATS_KEY.format('misses')])
+    hits = values.get(STATS_KEY.format('hits'), 0)
+    misses = values.get(STATS_KEY.format('misses'), 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': hits / total if total else 0.0,
+    }
+
+
+def reset_stats():
+    _cache().delete_many([STATS_KEY.format('hits'), STATS_KEY.format('misses')])
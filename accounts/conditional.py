@@ -0,0 +1,50 @@
+import hashlib
+from collections import namedtuple
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+Validators = namedtuple('Validators', ['etag', 'last_modified'])
+
+
+def validators(*parts, modified=None):
+    """
+    A weak ETag over `parts` and a Last-Modified timestamp from `modified`.
+    Weak, because two bodies for the same state still differ in sync_token.
+    """
+    digest = hashlib.md5(':'.join(str(part) for part in parts).encode()).hexdigest()
+    return Validators(f'W/"{digest}"', int(modified.timestamp()) if modified else None)
+
+
+def list_validators(querysets, tombstones, *scope):
+    """
+    An ETag for a list from the row count and newest updated_at of each of its
+    `querysets` (e.g. hot and archived rows), plus the newest deletion among
+    `tombstones`, without loading any rows. Lists send no Last-Modified: a
+    second-granular date can miss a row archived or purged in the same second,
+    and the count in the ETag cannot.
+    """
+    parts = []
+    for queryset in querysets:
+        summary = queryset.aggregate(count=Count('id'), updated=Max('updated_at'))
+        parts += [summary['count'], summary['updated']]
+    deleted = tombstones.aggregate(deleted=Max('deleted_at'))['deleted']
+    return validators(*scope, *parts, deleted)
+
+
+def set_validators(response, validators):
+    response['ETag'] = validators.etag
+    if validators.last_modified is not None:
+        response['Last-Modified'] = http_date(validators.last_modified)
+    # Browsers keep the body but revalidate it on every reuse
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def not_modified(request, validators):
+    """A 304 when the client's If-None-Match or If-Modified-Since is still current, else None"""
+    response = get_conditional_response(request, etag=validators.etag, last_modified=validators.last_modified)
+    if response is not None:
+        set_validators(response, validators)
+    return response
@@ -0,0 +1,94 @@
+import os
+import threading
+import time
+from collections import Counter
+
+from django.core.cache import caches
+from django.conf import settings
+from django.db import connections
+
+STATS_KEY = 'db-connection-stats:{}'
+WORKERS_KEY = STATS_KEY.format('workers')
+
+# This worker's counters are copied to the cache at most this often (seconds)
+PUBLISH_INTERVAL = 10
+
+_stats = Counter()
+_lock = threading.Lock()
+_last_published = 0.0
+
+
+def _count(name, amount=1):
+    with _lock:
+        _stats[name] += amount
+
+
+def connection_opened(sender, connection, **kwargs):
+    """connection_created receiver: a new server connection (TCP + auth handshake)"""
+    _count('opened')
+
+
+def check_connections(sender, **kwargs):
+    """
+    request_started receiver, run after Django closes expired connections.
+    A connection kept from an earlier request is counted as reused and, when
+    its alias sets CONN_HEALTH_CHECKS, pinged so a connection the server or a
+    pooler dropped is replaced before the view runs instead of failing it.
+    """
+    _count('requests')
+    for conn in connections.all():
+        if conn.connection is None or conn.in_atomic_block:
+            continue
+        _count('reused')
+        if conn.settings_dict.get('CONN_HEALTH_CHECKS') and not conn.is_usable():
+            _count('health_check_failures')
+            conn.close()
+
+
+def close_old_connections():
+    """
+    django.db.close_old_connections() for loops outside the request cycle.
+    A connection inside a caller's transaction (e.g. a test's) is left alone.
+    """
+    for conn in connections.all():
+        if not conn.in_atomic_block:
+            conn.close_if_unusable_or_obsolete()
+
+
+def publish_stats(sender, **kwargs):
+    """request_finished receiver: share this worker's counters through the cache now and then"""
+    global _last_published
+    now = time.monotonic()
+    if now - _last_published < PUBLISH_INTERVAL:
+        return
+    _last_published = now
+    with _lock:
+        snapshot = dict(_stats)
+    cache = caches[getattr(settings, 'QUEUE_CACHE_ALIAS', 'default')]
+    pid = os.getpid()
+    cache.set(STATS_KEY.format(pid), snapshot, timeout=None)
+    # Best effort, like the queue cache statistics: two workers registering at once may race
+    workers = cache.get(WORKERS_KEY, [])
+    if pid not in workers:
+        cache.set(WORKERS_KEY, workers + [pid], timeout=None)
+
+
+def local_stats():
+    with _lock:
+        return dict(_stats)
+
+
+def worker_stats():
+    """{pid: counters} for every worker that has published"""
+    cache = caches[getattr(settings, 'QUEUE_CACHE_ALIAS', 'default')]
+    workers = cache.get(WORKERS_KEY, [])
+    values = cache.get_many([STATS_KEY.format(pid) for pid in workers])
+    return {pid: values[STATS_KEY.format(pid)] for pid in workers if STATS_KEY.format(pid) in values}
+
+
+def reset_stats():
+    cache = caches[getattr(settings, 'QUEUE_CACHE_ALIAS', 'default')]
+    workers = cache.get(WORKERS_KEY, [])
+    cache.delete_many([STATS_KEY.format(pid) for pid in workers] + [WORKERS_KEY])
+    with _lock:
+        _stats.clear()
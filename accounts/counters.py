@@ -0,0 +1,112 @@
+from collections import Counter
+
+from django.db import IntegrityError, transaction
+from django.db.models import Case, Count, F, IntegerField, Q, Value, When
+
+from .models import Application, ArchivedApplication, ArchivedComplaint, Complaint, StatusCounter
+
+KEY_FIELDS = ['record_type', 'department', 'hall', 'category', 'status', 'verified']
+
+
+def counter_key(model, values):
+    """The StatusCounter key for a hot or archived Complaint/Application given its field values by attname"""
+    if model in (Complaint, ArchivedComplaint):
+        return ('complaint', values['department'], values['hall'], values['category'], values['status'], False)
+    return ('application', values['department'], '', values['application_type'], values['status'], values['verified'])
+
+
+def instance_key(instance):
+    return counter_key(type(instance), instance.__dict__)
+
+
+def _key_filter(keys):
+    return Q(*[Q(**dict(zip(KEY_FIELDS, key))) for key in keys], _connector=Q.OR)
+
+
+def adjust(deltas):
+    """
+    Apply {key: delta} to the counters: one UPDATE when every key already has
+    a row (the usual case), plus a SELECT and one INSERT for keys seen for the
+    first time. Call inside the transaction that made the change so counts
+    commit or roll back together with the rows.
+    """
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    increment = Case(
+        *[When(_key_filter([key]), then=Value(delta)) for key, delta in deltas.items()],
+        default=Value(0), output_field=IntegerField(),
+    )
+    if StatusCounter.objects.filter(_key_filter(deltas)).update(count=F('count') + increment) == len(deltas):
+        return
+    existing = set(StatusCounter.objects.filter(_key_filter(deltas)).values_list(*KEY_FIELDS))
+    missing = {key: delta for key, delta in deltas.items() if key not in existing}
+    try:
+        # Savepoint, so losing the insert race to another writer is recoverable
+        with transaction.atomic():
+            StatusCounter.objects.bulk_create([
+                StatusCounter(count=delta, **dict(zip(KEY_FIELDS, key))) for key, delta in missing.items()
+            ])
+    except IntegrityError:
+        # Another writer created some of them first; their rows now take the update
+        adjust(missing)
+
+
+def move(old_key, new_key, amount=1):
+    """Shift `amount` items from one counter to another"""
+    if old_key != new_key:
+        adjust(Counter({old_key: -amount, new_key: amount}))
+
+
+def actual_counts():
+    """
+    Recount every key from the item tables with one GROUP BY per table.
+    Archived items are still counted, so totals do not drop when they move.
+    """
+    counts = Counter()
+    for model, fields in [
+        (Complaint, ['department', 'hall', 'category', 'status']),
+        (ArchivedComplaint, ['department', 'hall', 'category', 'status']),
+        (Application, ['department', 'application_type', 'status', 'verified']),
+        (ArchivedApplication, ['department', 'application_type', 'status', 'verified']),
+    ]:
+        for row in model.objects.order_by().values(*fields).annotate(total=Count('id')):
+            counts[counter_key(model, row)] += row['total']
+    return dict(counts)
+
+
+def reconcile(dry_run=False):
+    """
+    Rewrite any counter that drifted from the item tables. Returns
+    {key: (stored, actual)} for every key that was wrong.
+    """
+    with transaction.atomic():
+        # Hold the counter rows so writers wait instead of racing the recount
+        stored = {
+            tuple(row[field] for field in KEY_FIELDS): row['count']
+            for row in StatusCounter.objects.select_for_update().values(*KEY_FIELDS, 'count')
+        }
+        actual = actual_counts()
+        drift = {
+            key: (stored.get(key, 0), actual.get(key, 0))
+            for key in stored.keys() | actual.keys()
+            if stored.get(key, 0) != actual.get(key, 0)
+        }
+        if not dry_run:
+            for key, (_, count) in drift.items():
+                StatusCounter.objects.update_or_create(defaults={'count': count}, **dict(zip(KEY_FIELDS, key)))
+    return drift
+
+
+def summarize(counters):
+    """Fold a StatusCounter queryset into totals and per-dimension breakdowns"""
+    summary = {'total': 0, 'by_status': {}, 'by_department': {}, 'by_hall': {}, 'by_category': {}}
+    for department, hall, category, status, count in counters.values_list(
+        'department', 'hall', 'category', 'status', 'count'
+    ):
+        summary['total'] += count
+        for breakdown, value in (('by_status', status), ('by_department', department),
+                                 ('by_hall', hall), ('by_category', category)):
+            if value:
+                summary[breakdown][value] = summary[breakdown].get(value, 0) + count
+    return summary
@@ -1,92 +1,90 @@
-from django.http import JsonResponse
+import asyncio
 from functools import wraps
 
+from asgiref.sync import sync_to_async
+from django.contrib.auth.views import redirect_to_login
+from django.http import HttpResponseNotAllowed, JsonResponse
+from django.views.decorators import http
+
+
+def _is_api_request(request):
+    # AJAX, JSON expected, or API path
+    return (
+        request.path.startswith('/api/') or
+        request.META.get('HTTP_X_REQUESTED_WITH') == 'XMLHttpRequest' or
+        'application/json' in request.META.get('HTTP_ACCEPT', '') or
+        request.content_type == 'application/json'
+    )
+
+
+def _denied(request, allowed_roles):
+    """The 401/403 response for a user outside allowed_roles, or None to let them through"""
+    user = request.user
+    if not user.is_authenticated:
+        if _is_api_request(request):
+            return JsonResponse({
+                'success': False,
+                'message': 'Authentication required.'
+            }, status=401)
+        # For regular views, redirect to login and come back afterwards, like login_required
+        return redirect_to_login(request.get_full_path(), 'login')
+
+    # Allow superuser always, then only allowed roles
+    if user.is_superuser or user.role in allowed_roles:
+        return None
+
+    if _is_api_request(request):
+        return JsonResponse({
+            'success': False,
+            'message': 'You do not have permission to access this resource.'
+        }, status=403)
+    from django.shortcuts import render
+    return render(request, 'error/403.html', status=403)
+
+
 def role_required(allowed_roles=None):
+    """
+    Let authenticated users with one of allowed_roles (or superusers) through.
+    Works on async views too; the user is then loaded in a worker thread, since
+    resolving the lazy request.user reads the session and user tables.
+    """
     if allowed_roles is None:
         allowed_roles = []
 
     def decorator(view_func):
+        if asyncio.iscoroutinefunction(view_func):
+            @wraps(view_func)
+            async def _wrapped_view(request, *args, **kwargs):
+                denied = await sync_to_async(_denied)(request, allowed_roles)
+                if denied is not None:
+                    return denied
+                return await view_func(request, *args, **kwargs)
+            return _wrapped_view
+
         @wraps(view_func)
         def _wrapped_view(request, *args, **kwargs):
-            user = request.user
-            if not user.is_authenticated:
-                # Check if this is an API request (AJAX, JSON expected, or API path)
-                is_api_request = (
-                    request.path.startswith('/api/') or
-                    request.META.get('HTTP_X_REQUESTED_WITH') == 'XMLHttpRequest' or
-                    'application/json' in request.META.get('HTTP_ACCEPT', '') or
-                    request.content_type == 'application/json'
-                )
-
-                if is_api_request:
-                    return JsonResponse({
-                        'success': False,
-                        'message': 'Authentication required.'
-                    }, status=401)
-                # For regular views, redirect to login
-                from django.shortcuts import redirect
-                return redirect('login')
-
-            # Allow superuser always
-            if user.is_superuser:
-                return view_func(request, *args, **kwargs)
-
-            # Allow only allowed roles
-            if user.role in allowed_roles:
-                return view_func(request, *args, **kwargs)
-
-            # If none match, deny access
-            is_api_request = (
-                request.path.startswith('/api/') or
-                request.META.get('HTTP_X_REQUESTED_WITH') == 'XMLHttpRequest' or
-                'application/json' in request.META.get('HTTP_ACCEPT', '') or
-                request.content_type == 'application/json'
-            )
-
-            if is_api_request:
-                return JsonResponse({
-                    'success': False,
-                    'message': 'You do not have permission to access this resource.'
-                }, status=403)
-            from django.shortcuts import render
-            return render(request, 'error/403.html', status=403)
+            denied = _denied(request, allowed_roles)
+            if denied is not None:
+                return denied
+            return view_func(request, *args, **kwargs)
         return _wrapped_view
     return decorator
 
-def verified_applications_only(view_func):
-    """
-    Decorator to ensure only verified applications are returned for certain roles.
-    Applies to views that return application querysets.
-    """
+
+def require_POST(view_func):
+    """Django's require_POST, which in Django 3.2 turns an async view into a sync one"""
+    if not asyncio.iscoroutinefunction(view_func):
+        return http.require_POST(view_func)
+
     @wraps(view_func)
-    def _wrapped_view(request, *args, **kwargs):
-        # Call the original view function
-        response = view_func(request, *args, **kwargs)
-
-        # If the response is not a JsonResponse or doesn't have applications data, return as-is
-        if not hasattr(response, 'content'):
-            return response
-
-        try:
-            import json
-            data = json.loads(response.content)
-
-            if 'applications' in data and isinstance(data['applications'], list):
-                user_role = request.user.role
-
-                # Filter applications based on verification status for specific roles
-                if user_role in ['staff', 'exam_controller']:
-                    # Only show verified applications for staff and exam controller
-                    filtered_applications = [
-                        app for app in data['applications']
-                        if app.get('verified', False)
-                    ]
-                    data['applications'] = filtered_applications
-                    return JsonResponse(data)
-
-        except (json.JSONDecodeError, AttributeError):
-            # If we can't parse the response, return it unchanged
-            pass
-
-        return response
+    async def _wrapped_view(request, *args, **kwargs):
+        if request.method != 'POST':
+            return HttpResponseNotAllowed(['POST'])
+        return await view_func(request, *args, **kwargs)
     return _wrapped_view
+
+
+def csrf_exempt(view_func):
+    """Django's csrf_exempt without the sync wrapper, so async views stay async"""
+    view_func.csrf_exempt = True
+    return view_func
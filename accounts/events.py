@@ -0,0 +1,180 @@
+import asyncio
+import json
+import logging
+import threading
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils.module_loading import import_string
+
+from .visibility import VERIFIED_ONLY_ROLES
+
+logger = logging.getLogger(__name__)
+
+# Departments whose staff see everything land in the provost queue as well
+ALL_DEPARTMENTS_QUEUE = 'queue:provost'
+
+
+class Subscription:
+    """One SSE client's view of a set of channels"""
+
+    def __init__(self, broadcaster, channels, maxsize=100):
+        self.broadcaster = broadcaster
+        self.channels = channels
+        self.queue = asyncio.Queue(maxsize=maxsize)
+        self.loop = None
+
+    async def __aenter__(self):
+        self.loop = asyncio.get_running_loop()
+        await self.broadcaster.attach(self)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.broadcaster.detach(self)
+
+    def offer(self, event):
+        # Runs on the subscriber's loop; a slow client loses events rather than
+        # growing memory, and will catch up through the delta-sync endpoint
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            pass
+
+    async def get(self, timeout):
+        return await asyncio.wait_for(self.queue.get(), timeout)
+
+
+class InProcessBroadcaster:
+    """Fan events out to subscribers in this process only (single node / single worker)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = {}
+
+    async def attach(self, subscription):
+        with self._lock:
+            for channel in subscription.channels:
+                self._subscribers.setdefault(channel, set()).add(subscription)
+
+    def detach(self, subscription):
+        with self._lock:
+            for channel in subscription.channels:
+                subscribers = self._subscribers.get(channel)
+                if subscribers:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscribers[channel]
+
+    def publish(self, messages):
+        """Deliver (channel, event) pairs"""
+        for channel, event in messages:
+            self.deliver(channel, event)
+
+    def deliver(self, channel, event):
+        """Hand an event to local subscribers; safe to call from any thread"""
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for subscription in subscribers:
+            subscription.loop.call_soon_threadsafe(subscription.offer, event)
+
+
+class PostgresBroadcaster(InProcessBroadcaster):
+    """
+    Relay events between workers with PostgreSQL LISTEN/NOTIFY.
+    Each process keeps one listening connection and fans out locally.
+    """
+    channel_name = 'cfix_events'
+
+    def __init__(self, using='default'):
+        super().__init__()
+        self.using = using
+        self._listener = None
+
+    def publish(self, messages):
+        """NOTIFY every (channel, event) pair in one statement, however many there are"""
+        payloads = [json.dumps({'channel': channel, 'event': event}) for channel, event in messages]
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(
+                'SELECT pg_notify(%s, payload) FROM unnest(%s::text[]) AS payload', [self.channel_name, payloads]
+            )
+
+    async def attach(self, subscription):
+        if self._listener is None:
+            self._start_listener(subscription.loop)
+        await super().attach(subscription)
+
+    def _start_listener(self, loop):
+        wrapper = connections[self.using]
+        listener = wrapper.get_new_connection(wrapper.get_connection_params())
+        listener.autocommit = True
+        with listener.cursor() as cursor:
+            cursor.execute(f'LISTEN {self.channel_name}')
+        loop.add_reader(listener.fileno(), self._drain)
+        self._listener = listener
+
+    def _drain(self):
+        self._listener.poll()
+        while self._listener.notifies:
+            notify = self._listener.notifies.pop(0)
+            try:
+                message = json.loads(notify.payload)
+            except ValueError:
+                logger.warning('Discarding malformed event payload: %r', notify.payload)
+                continue
+            self.deliver(message['channel'], message['event'])
+
+
+@lru_cache(maxsize=None)
+def get_broadcaster():
+    backend = getattr(settings, 'EVENTS_BACKEND', 'accounts.events.InProcessBroadcaster')
+    return import_string(backend)()
+
+
+def channels_for_user(user):
+    """SSE channels a user may subscribe to: their own items, or their role's queue"""
+    if user.role == 'student':
+        return [f'user:{user.pk}']
+    if user.role in ['staff', 'dsw', 'exam_controller']:
+        return [f'queue:{user.role}']
+    return [ALL_DEPARTMENTS_QUEUE]
+
+
+def _messages(instance, action):
+    """(channel, event) pairs announcing a change to its owner and to every queue that shows it"""
+    kind = instance._meta.model_name
+    event = {
+        'type': f'{kind}.{action}',
+        'id': f'{kind[0].upper()}{instance.pk:03d}',
+        'status': instance.status,
+    }
+    channels = {f'user:{instance.student_id}', ALL_DEPARTMENTS_QUEUE}
+    if kind == 'application':
+        event['verified'] = instance.verified
+    # As in visibility.application_queue: verified-only queues hear of an application once it is verified
+    if kind != 'application' or instance.verified or instance.department not in VERIFIED_ONLY_ROLES:
+        channels.add(f'queue:{instance.department}')
+    return [(channel, event) for channel in channels]
+
+
+def publish_changes(instances, action):
+    """
+    Announce created or updated Complaints/Applications once the surrounding
+    transaction commits, with one broadcaster call for the whole batch.
+    """
+    messages = [message for instance in instances for message in _messages(instance, action)]
+    if not messages:
+        return
+
+    def send():
+        try:
+            get_broadcaster().publish(messages)
+        except Exception:
+            # Push is best effort; clients still converge through delta sync
+            logger.exception('Failed to publish %d %s events', len(messages), action)
+
+    transaction.on_commit(send)
+
+
+def publish_change(instance, action):
+    publish_changes([instance], action)
@@ -0,0 +1,82 @@
+import csv
+
+from django.db.models import Q
+
+from .pagination import InvalidQuery
+from .serializers import dumps
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+# Rows fetched per query; memory is bounded by this, not the table size
+CHUNK_ROWS = 2000
+
+# Lines are joined into chunks of about this many characters before being sent
+FLUSH_SIZE = 64 * 1024
+
+
+class _Echo:
+    """File-like object whose write() hands the line back to the caller"""
+
+    def write(self, value):
+        return value
+
+
+def content_type(fmt):
+    try:
+        return EXPORT_FORMATS[fmt]
+    except KeyError:
+        raise InvalidQuery('Export format must be csv or ndjson.')
+
+
+def export_rows(querysets, format_row):
+    """
+    Format .values() querysets in turn row by row, each oldest first. Rows are
+    read CHUNK_ROWS at a time by keyset on (created_at, id) rather than over
+    a server-side cursor, which PgBouncer's transaction mode rules out
+    (DB_POOLER=pgbouncer) and without which .iterator() loads every row.
+    """
+    for queryset in querysets:
+        queryset = queryset.order_by('created_at', 'id')
+        chunk = list(queryset[:CHUNK_ROWS])
+        while chunk:
+            for row in chunk:
+                yield format_row(row)
+            if len(chunk) < CHUNK_ROWS:
+                break
+            last = chunk[-1]
+            chunk = list(queryset.filter(
+                Q(created_at__gt=last['created_at']) | Q(created_at=last['created_at'], id__gt=last['id'])
+            )[:CHUNK_ROWS])
+
+
+def _csv_lines(rows):
+    writer = csv.writer(_Echo())
+    columns = None
+    for row in rows:
+        if columns is None:
+            # Header from the first row, so the columns always match the formatter
+            columns = list(row)
+            yield writer.writerow(columns)
+        yield writer.writerow([row[column] for column in columns])
+
+
+def _ndjson_lines(rows):
+    for row in rows:
+        yield dumps(row).decode() + '\n'
+
+
+def stream(rows, fmt):
+    """Serialize formatted rows to CSV or NDJSON text chunks"""
+    lines = _csv_lines(rows) if fmt == 'csv' else _ndjson_lines(rows)
+    buffer, size = [], 0
+    for line in lines:
+        buffer.append(line)
+        size += len(line)
+        if size >= FLUSH_SIZE:
+            yield ''.join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield ''.join(buffer)
@@ -0,0 +1,14 @@
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    """
+    Django's PBKDF2 hasher with the work factor taken from PBKDF2_ITERATIONS.
+    Same algorithm name, so existing hashes verify; a changed count is picked
+    up by the rehash on the user's next login.
+    """
+
+    @property
+    def iterations(self):
+        return getattr(settings, 'PBKDF2_ITERATIONS', hashers.PBKDF2PasswordHasher.iterations)
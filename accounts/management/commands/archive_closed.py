@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts import archive
+
+
+class Command(BaseCommand):
+    help = (
+        'Move resolved, approved and rejected items untouched for ARCHIVE_AFTER_DAYS '
+        'into the archive tables, in small throttled batches'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Count what would be archived without moving it')
+        parser.add_argument('--days', type=int, help='Archive items closed this many days ago (default: ARCHIVE_AFTER_DAYS)')
+        parser.add_argument('--batch-size', type=int, default=archive.DEFAULT_BATCH_SIZE)
+        parser.add_argument(
+            '--sleep', type=float, default=archive.DEFAULT_SLEEP,
+            help='Seconds to pause between batches so live requests keep priority'
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1.')
+
+        before = archive.cutoff(options['days'])
+        self.stdout.write(f'Archiving items closed and untouched since {before:%Y-%m-%d %H:%M}.')
+
+        log = self.stdout.write if options['verbosity'] > 1 else None
+        stats = archive.execute(
+            before, batch_size=options['batch_size'], sleep=options['sleep'], dry_run=options['dry_run'], log=log
+        )
+
+        verb = 'would archive' if options['dry_run'] else 'archived'
+        for name, progress in stats.items():
+            line = f"{name}: {verb} {progress['moved']}"
+            if not options['dry_run']:
+                line += f" in {progress['batches']} batches ({progress['seconds']:.2f}s in transactions)"
+            self.stdout.write(line)
+        self.stdout.write(self.style.SUCCESS('Done.'))
@@ -0,0 +1,105 @@
+import os
+import statistics
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+def _children(pid):
+    """PIDs of every live process whose parent is pid"""
+    found = []
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as stat:
+                # Fields after the parenthesised command name: state, ppid, ...
+                fields = stat.read().rsplit(')', 1)[1].split()
+        except OSError:
+            continue
+        if int(fields[1]) == pid:
+            found.append(int(entry))
+    return found
+
+
+def _rss_kib(pid):
+    try:
+        with open(f'/proc/{pid}/status') as status:
+            for line in status:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def server_rss_mib(pid):
+    """Resident memory of a server process and all its descendants (gunicorn master + workers)"""
+    total, pending = 0, [pid]
+    while pending:
+        current = pending.pop()
+        total += _rss_kib(current)
+        pending.extend(_children(current))
+    return total / 1024
+
+
+class Command(BaseCommand):
+    help = (
+        'Send concurrent GETs to a running server and report throughput, latency and the '
+        "server's memory, to compare the WSGI and ASGI setups at the same memory budget"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('url', help='Full URL to request, e.g. http://127.0.0.1:8000/api/complaints/')
+        parser.add_argument('--concurrency', type=int, default=50, help='Requests in flight at once (default: 50)')
+        parser.add_argument('--requests', type=int, default=1000, help='Total requests (default: 1000)')
+        parser.add_argument(
+            '--header', action='append', default=[],
+            help="Extra request header, repeatable, e.g. 'Authorization: Bearer <access token>'"
+        )
+        parser.add_argument('--pid', type=int, help='Server master PID; its RSS and its workers\' is reported (Linux)')
+
+    def handle(self, *args, **options):
+        concurrency, total = options['concurrency'], options['requests']
+        if concurrency < 1 or total < 1:
+            raise CommandError('--concurrency and --requests must be at least 1.')
+        headers = {}
+        for header in options['header']:
+            name, sep, value = header.partition(':')
+            if not sep:
+                raise CommandError(f'Header must look like "Name: value": {header}')
+            headers[name.strip()] = value.strip()
+
+        def fetch(_):
+            request = urllib.request.Request(options['url'], headers=headers)
+            started = time.perf_counter()
+            try:
+                with urllib.request.urlopen(request, timeout=60) as response:
+                    response.read()
+                    ok = response.status < 400
+            except (urllib.error.URLError, OSError):
+                ok = False
+            return ok, time.perf_counter() - started
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(fetch, range(total)))
+        elapsed = time.perf_counter() - started
+
+        latencies = sorted(latency for ok, latency in results if ok)
+        errors = total - len(latencies)
+        self.stdout.write(f'{total} requests, {concurrency} concurrent: {total / elapsed:.1f} req/s, {errors} errors')
+        if latencies:
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            self.stdout.write(
+                f'latency: p50 {statistics.median(latencies) * 1000:.0f} ms, p95 {p95 * 1000:.0f} ms, '
+                f'max {latencies[-1] * 1000:.0f} ms'
+            )
+        if options['pid']:
+            rss = server_rss_mib(options['pid'])
+            if not rss:
+                raise CommandError(f"Cannot read the memory of PID {options['pid']}.")
+            self.stdout.write(f'server RSS: {rss:.0f} MiB, {total / elapsed / rss * 100:.1f} req/s per 100 MiB')
@@ -0,0 +1,48 @@
+import time
+
+from django.conf import settings
+from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth.hashers import get_hasher
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure authenticate() throughput on one core for a good password, a wrong '
+        'password and an unknown user, with the configured hasher'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20, help='Logins timed per case (default: 20)')
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        if iterations < 1:
+            raise CommandError('--iterations must be at least 1.')
+
+        hasher = get_hasher()
+        self.stdout.write(f'Hasher: {settings.PASSWORD_HASHERS[0]} ({hasher.algorithm})')
+
+        User = get_user_model()
+        password = 'benchmark-password'
+        with transaction.atomic():
+            # Throwaway user, rolled back with everything the logins wrote
+            User.objects.create_user(
+                email='login-benchmark@example.invalid', college_id='login-benchmark', password=password
+            )
+            cases = [
+                ('good password', 'login-benchmark', password),
+                ('wrong password', 'login-benchmark', 'not-the-password'),
+                ('unknown user', 'no-such-college-id', password),
+            ]
+            for label, username, attempt in cases:
+                started = time.perf_counter()
+                for _ in range(iterations):
+                    authenticate(None, username=username, password=attempt)
+                elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f'{label}: {iterations / elapsed:.1f} logins/s per core '
+                    f'({elapsed / iterations * 1000:.1f} ms each)'
+                )
+            transaction.set_rollback(True)
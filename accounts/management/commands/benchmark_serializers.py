@@ -0,0 +1,80 @@
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts import serializers
+from accounts.models import Complaint
+
+
+def _inline_complaint(complaint):
+    """The per-view formatting the serializers replaced, kept as the baseline"""
+    return {
+        'id': f'C{complaint["id"]:03d}',
+        'title': complaint['title'],
+        'description': complaint['description'],
+        'category': complaint['category'].replace('-', ' ').title(),
+        'department': complaint['department'].replace('_', ' ').title(),
+        'hall': complaint['hall'].replace('-', ' ').title(),
+        'priority': complaint['priority'].title(),
+        'status': complaint['status'],
+        'version': complaint['version'],
+        'student_name': f"{complaint['student__first_name']} {complaint['student__last_name']}",
+        'student_id': complaint['student__college_id'],
+        'date': complaint['created_at'].strftime('%Y-%m-%d'),
+        'updated_at': complaint['updated_at'].strftime('%Y-%m-%d %H:%M:%S')
+    }
+
+
+class Command(BaseCommand):
+    help = 'Measure the per-row cost of formatting and JSON-encoding queue rows, without the database'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100000, help='Synthetic complaint rows (default: 100000)')
+
+    def handle(self, *args, **options):
+        count = options['rows']
+        if count < 1:
+            raise CommandError('--rows must be at least 1.')
+
+        rng = random.Random(0)
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                'id': pk,
+                'title': f'Complaint {pk}',
+                'description': 'Water leaking from the ceiling of the common room since Monday.',
+                'category': rng.choice(Complaint.CATEGORY_CHOICES)[0],
+                'department': rng.choice(Complaint.DEPARTMENT_CHOICES)[0],
+                'hall': rng.choice(Complaint.HALL_CHOICES)[0],
+                'priority': rng.choice(Complaint.PRIORITY_CHOICES)[0],
+                'status': rng.choice(Complaint.STATUS_CHOICES)[0],
+                'version': 1,
+                'created_at': now - timedelta(minutes=pk),
+                'updated_at': now - timedelta(seconds=pk),
+                'student__first_name': 'Asha',
+                'student__last_name': 'Khan',
+                'student__college_id': f'GK{pk:06d}',
+            }
+            for pk in range(1, count + 1)
+        ]
+
+        formatted = None
+        for label, format_row in [('inline formatting', _inline_complaint), ('serializers.complaint', serializers.complaint)]:
+            started = time.perf_counter()
+            formatted = [format_row(row) for row in rows]
+            self._report(label, time.perf_counter() - started, count)
+
+        encoders = [('json (stdlib)', serializers.stdlib_dumps)]
+        if serializers.orjson is not None:
+            encoders.append(('orjson', serializers.orjson_dumps))
+        else:
+            self.stdout.write('orjson: not installed')
+        for label, encode in encoders:
+            started = time.perf_counter()
+            body = encode({'success': True, 'complaints': formatted})
+            self._report(f'encode with {label}', time.perf_counter() - started, count, f', {len(body) / 1024:.0f} KiB')
+
+    def _report(self, label, elapsed, count, extra=''):
+        self.stdout.write(f'{label}: {elapsed / count * 1e6:.2f} us/row ({elapsed * 1000:.0f} ms for {count} rows{extra})')
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from accounts import connections as db_connections
+
+
+class Command(BaseCommand):
+    help = 'Report database connections opened, reused and replaced by each worker'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help='Zero the counters after reporting')
+
+    def handle(self, *args, **options):
+        workers = db_connections.worker_stats()
+        if not workers:
+            self.stdout.write('No worker has published connection stats yet.')
+        for pid, stats in sorted(workers.items()):
+            requests = stats.get('requests', 0)
+            opened = stats.get('opened', 0)
+            self.stdout.write(
+                f"pid={pid} requests={requests} opened={opened} reused={stats.get('reused', 0)} "
+                f"health_check_failures={stats.get('health_check_failures', 0)} "
+                f"connections_per_request={opened / requests if requests else 0:.3f}"
+            )
+        if options['reset']:
+            db_connections.reset_stats()
+            self.stdout.write('Counters reset.')
@@ -0,0 +1,42 @@
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts import export
+from accounts.pagination import InvalidQuery, apply_filters
+from accounts.views import export_source
+
+
+class Command(BaseCommand):
+    help = 'Stream complaints or applications to CSV or NDJSON without loading them into memory'
+
+    def add_arguments(self, parser):
+        parser.add_argument('kind', choices=['complaints', 'applications'])
+        parser.add_argument('--format', choices=sorted(export.EXPORT_FORMATS), default='csv')
+        parser.add_argument('--output', help='File to write; defaults to stdout')
+        parser.add_argument(
+            '--role', choices=['provost', 'staff', 'dsw', 'exam_controller'], default='provost',
+            help="Export what this role's queue shows (default: provost)"
+        )
+        for name in ['status', 'department', 'hall', 'category', 'priority', 'date-from', 'date-to']:
+            parser.add_argument(f'--{name}')
+
+    def handle(self, *args, **options):
+        querysets, filters, format_row = export_source(SimpleNamespace(role=options['role'], pk=None), options['kind'])
+        params = {
+            name: options[name]
+            for name in ['status', 'department', 'hall', 'category', 'priority', 'date_from', 'date_to']
+            if options[name]
+        }
+        try:
+            querysets = [apply_filters(queryset, params, filters) for queryset in querysets]
+        except InvalidQuery as e:
+            raise CommandError(str(e))
+
+        chunks = export.stream(export.export_rows(querysets, format_row), options['format'])
+        if options['output']:
+            with open(options['output'], 'w', newline='', encoding='utf-8') as output:
+                output.writelines(chunks)
+        else:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending='')
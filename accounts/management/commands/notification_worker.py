@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts import notifications
+
+
+class Command(BaseCommand):
+    help = 'Turn queued status changes into student notifications, in batches, until stopped'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Drain the queue and exit instead of polling')
+        parser.add_argument('--batch-size', type=int, default=notifications.DEFAULT_BATCH_SIZE)
+        parser.add_argument(
+            '--poll', type=float, default=notifications.DEFAULT_POLL,
+            help='Seconds to wait before checking an empty queue again'
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1.')
+
+        log = self.stdout.write if options['verbosity'] > 1 else None
+        try:
+            totals = notifications.run_worker(
+                batch_size=options['batch_size'], poll=options['poll'], once=options['once'], log=log
+            )
+        except KeyboardInterrupt:
+            # Each batch commits on its own, so stopping here loses nothing
+            self.stdout.write('Stopped.')
+            return
+        self.stdout.write(self.style.SUCCESS(
+            f"{totals['jobs']} jobs -> {totals['notifications']} notifications in {totals['batches']} batches."
+        ))
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts import retention
+
+
+class Command(BaseCommand):
+    help = (
+        'Delete finished complaints and applications, read notifications and old '
+        'tombstones past their retention period, in small throttled batches'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Count what would be deleted without deleting')
+        parser.add_argument('--resume', action='store_true', help='Continue the last interrupted run')
+        parser.add_argument('--days', type=int, help='Retention period in days (default: RETENTION_DAYS)')
+        parser.add_argument('--batch-size', type=int, default=retention.DEFAULT_BATCH_SIZE)
+        parser.add_argument(
+            '--sleep', type=float, default=retention.DEFAULT_SLEEP,
+            help='Seconds to pause between batches so live requests keep priority'
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1.')
+
+        if options['resume']:
+            run = retention.resumable_run()
+            if run is None:
+                raise CommandError('No unfinished purge run to resume.')
+            self.stdout.write(f'Resuming run {run.pk} (cutoff {run.cutoff:%Y-%m-%d %H:%M}).')
+        else:
+            run = retention.start_run(dry_run=options['dry_run'], days=options['days'])
+            self.stdout.write(f'Run {run.pk}: removing items untouched since {run.cutoff:%Y-%m-%d %H:%M}.')
+
+        log = self.stdout.write if options['verbosity'] > 1 else None
+        retention.execute(run, batch_size=options['batch_size'], sleep=options['sleep'], log=log)
+
+        verb = 'would delete' if run.dry_run else 'deleted'
+        for name, progress in run.progress.items():
+            line = f"{name}: {verb} {progress['deleted']}"
+            if not run.dry_run:
+                line += f" in {progress['batches']} batches ({progress['seconds']:.2f}s in transactions)"
+            self.stdout.write(line)
+        self.stdout.write(self.style.SUCCESS(f'Run {run.pk} finished.'))
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from accounts import cache as queue_cache
+
+
+class Command(BaseCommand):
+    help = 'Report hit/miss counts for the role-queue page cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help='Zero the counters after reporting')
+
+    def handle(self, *args, **options):
+        stats = queue_cache.stats()
+        self.stdout.write(
+            f"hits={stats['hits']} misses={stats['misses']} hit_ratio={stats['hit_ratio']:.1%}"
+        )
+        if options['reset']:
+            queue_cache.reset_stats()
+            self.stdout.write('Counters reset.')
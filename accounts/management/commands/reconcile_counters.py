@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from accounts.counters import KEY_FIELDS, reconcile
+
+
+class Command(BaseCommand):
+    help = 'Recompute dashboard status counters from the complaint and application tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Report drift without fixing it')
+
+    def handle(self, *args, **options):
+        drift = reconcile(dry_run=options['dry_run'])
+        for key, (stored, actual) in sorted(drift.items()):
+            label = ' '.join(f'{field}={value}' for field, value in zip(KEY_FIELDS, key))
+            self.stdout.write(f'{label}: stored={stored} actual={actual}')
+        if not drift:
+            self.stdout.write('Counters are in sync.')
+        elif options['dry_run']:
+            self.stdout.write(f'{len(drift)} counters drifted (not fixed, dry run).')
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Fixed {len(drift)} counters.'))
@@ -0,0 +1,23 @@
+# Generated by Django 3.2.25 on 2026-10-18 06:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0009_delta_sync'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='complaint',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 3.2.25 on 2026-10-18 06:17
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_counters(apps, schema_editor):
+    """Seed the counters from the existing rows"""
+    Complaint = apps.get_model('accounts', 'Complaint')
+    Application = apps.get_model('accounts', 'Application')
+    StatusCounter = apps.get_model('accounts', 'StatusCounter')
+    counters = [
+        StatusCounter(
+            record_type='complaint', department=row['department'], hall=row['hall'],
+            category=row['category'], status=row['status'], verified=False, count=row['total'],
+        )
+        for row in Complaint.objects.order_by().values('department', 'hall', 'category', 'status').annotate(total=Count('id'))
+    ]
+    counters += [
+        StatusCounter(
+            record_type='application', department=row['department'], hall='',
+            category=row['application_type'], status=row['status'], verified=row['verified'], count=row['total'],
+        )
+        for row in Application.objects.order_by().values(
+            'department', 'application_type', 'status', 'verified'
+        ).annotate(total=Count('id'))
+    ]
+    StatusCounter.objects.bulk_create(counters)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0010_status_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatusCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('record_type', models.CharField(choices=[('complaint', 'Complaint'), ('application', 'Application')], max_length=20)),
+                ('department', models.CharField(max_length=20)),
+                ('hall', models.CharField(blank=True, default='', max_length=50)),
+                ('category', models.CharField(max_length=20)),
+                ('status', models.CharField(max_length=15)),
+                ('verified', models.BooleanField(default=False)),
+                ('count', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='statuscounter',
+            constraint=models.UniqueConstraint(fields=('record_type', 'department', 'hall', 'category', 'status', 'verified'), name='status_counter_key'),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
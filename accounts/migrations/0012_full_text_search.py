@@ -0,0 +1,27 @@
+from django.db import migrations
+
+from accounts import search
+
+
+def install_search(apps, schema_editor):
+    search.install(schema_editor.connection)
+
+
+def uninstall_search(apps, schema_editor):
+    search.uninstall(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+    """
+    Full-text index on title/description: a generated tsvector column with a GIN
+    index on PostgreSQL, an FTS5 table kept in sync by triggers on SQLite.
+    Neither is a model field, so this is done outside the autodetector.
+    """
+
+    dependencies = [
+        ('accounts', '0011_status_counters'),
+    ]
+
+    operations = [
+        migrations.RunPython(install_search, uninstall_search),
+    ]
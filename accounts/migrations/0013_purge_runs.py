@@ -0,0 +1,27 @@
+# Generated by Django 3.2.25 on 2026-10-18 06:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0012_full_text_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PurgeRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('started_at', models.DateTimeField(auto_now_add=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('cutoff', models.DateTimeField()),
+                ('dry_run', models.BooleanField(default=False)),
+                ('progress', models.JSONField(default=dict)),
+            ],
+            options={
+                'ordering': ['-started_at'],
+            },
+        ),
+    ]
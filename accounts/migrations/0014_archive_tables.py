@@ -0,0 +1,48 @@
+# Generated by Django 3.2.25 on 2026-10-18 06:23
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0013_purge_runs'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedComplaint',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=200)),
+                ('description', models.TextField()),
+                ('category', models.CharField(max_length=20)),
+                ('department', models.CharField(max_length=20)),
+                ('hall', models.CharField(max_length=50)),
+                ('priority', models.CharField(max_length=10)),
+                ('status', models.CharField(max_length=15)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('student', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='archived_complaints', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedApplication',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=200)),
+                ('description', models.TextField()),
+                ('application_type', models.CharField(max_length=20)),
+                ('department', models.CharField(max_length=20)),
+                ('status', models.CharField(max_length=15)),
+                ('verified', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('student', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='archived_applications', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 3.2.25 on 2026-10-18 06:26
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0014_archive_tables'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('record_type', models.CharField(choices=[('complaint', 'Complaint'), ('application', 'Application')], max_length=20)),
+                ('record_id', models.PositiveIntegerField()),
+                ('change', models.CharField(choices=[('status', 'Status changed'), ('verified', 'Verified')], default='status', max_length=10)),
+                ('title', models.CharField(max_length=200)),
+                ('department', models.CharField(max_length=20)),
+                ('status', models.CharField(max_length=15)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notification_jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 3.2.25 on 2026-10-18 06:28
+
+from django.db import migrations, models
+from django.db.models import Count
+import django.db.models.deletion
+
+
+def populate_counters(apps, schema_editor):
+    """Seed the unread counters from the existing notifications"""
+    Notification = apps.get_model('accounts', 'Notification')
+    NotificationCounter = apps.get_model('accounts', 'NotificationCounter')
+    NotificationCounter.objects.bulk_create([
+        NotificationCounter(user_id=row['student_id'], unread=row['total'])
+        for row in Notification.objects.filter(is_read=False).order_by().values('student_id').annotate(total=Count('id'))
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0015_notification_jobs'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationCounter',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='notification_counter', serialize=False, to='accounts.customuser')),
+                ('unread', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['student', '-created_at', '-id'], name='notification_list_idx'),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 3.2.25 on 2026-10-18 07:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0016_notification_counters'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='archivedapplication',
+            index=models.Index(fields=['student', 'updated_at'], name='archived_application_sync_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedcomplaint',
+            index=models.Index(fields=['student', 'updated_at'], name='archived_complaint_sync_idx'),
+        ),
+    ]
@@ -102,6 +102,14 @@ class Complaint(models.Model):
         ('rejected', 'Rejected'),
     ]
 
+    # Status workflow: current status -> statuses it may move to
+    TRANSITIONS = {
+        'pending': ['in-progress', 'resolved', 'rejected'],
+        'in-progress': ['pending', 'resolved', 'rejected'],
+        'resolved': ['in-progress'],
+        'rejected': ['pending'],
+    }
+
     title = models.CharField(max_length=200)
     description = models.TextField()
     category = models.CharField(max_length=20, choices=CATEGORY_CHOICES)
@@ -110,6 +118,8 @@ class Complaint(models.Model):
     priority = models.CharField(max_length=10, choices=PRIORITY_CHOICES, default='medium')
     status = models.CharField(max_length=15, choices=STATUS_CHOICES, default='pending')
     student = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='complaints')
+    # Incremented by every status change; clients send it back to detect concurrent edits
+    version = models.PositiveIntegerField(default=1)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -118,6 +128,22 @@ class Complaint(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Role queues: department scope, newest first, keyset tiebreak on id
+            models.Index(fields=['department', '-created_at', '-id'], name='complaint_dept_idx'),
+            models.Index(fields=['student', '-created_at'], name='complaint_student_idx'),
+            # Provost queue spans all departments
+            models.Index(fields=['-created_at', '-id'], name='complaint_created_idx'),
+            models.Index(
+                fields=['department', '-created_at'],
+                name='complaint_open_dept_idx',
+                condition=models.Q(status__in=['pending', 'in-progress']),
+            ),
+            # Delta sync range scans
+            models.Index(fields=['student', 'updated_at'], name='complaint_student_sync_idx'),
+            models.Index(fields=['department', 'updated_at'], name='complaint_dept_sync_idx'),
+            models.Index(fields=['updated_at'], name='complaint_sync_idx'),
+        ]
 
 
 class Application(models.Model):
@@ -143,6 +169,12 @@ class Application(models.Model):
         ('rejected', 'Rejected'),
     ]
 
+    TRANSITIONS = {
+        'pending': ['approved', 'rejected'],
+        'approved': ['pending'],
+        'rejected': ['pending'],
+    }
+
     title = models.CharField(max_length=200)
     description = models.TextField()
     application_type = models.CharField(max_length=20, choices=APPLICATION_TYPES)
@@ -150,6 +182,7 @@ class Application(models.Model):
     status = models.CharField(max_length=15, choices=STATUS_CHOICES, default='pending')
     verified = models.BooleanField(default=False)
     student = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='applications')
+    version = models.PositiveIntegerField(default=1)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -158,6 +191,26 @@ class Application(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['department', '-created_at', '-id'], name='application_dept_idx'),
+            models.Index(fields=['student', '-created_at'], name='application_student_idx'),
+            # Verification queues: provost sees unverified, departments see verified
+            models.Index(fields=['verified', 'department', '-created_at'], name='application_verified_idx'),
+            models.Index(
+                fields=['-created_at', '-id'],
+                name='application_unverified_idx',
+                condition=models.Q(verified=False),
+            ),
+            models.Index(
+                fields=['department', '-created_at'],
+                name='application_pending_idx',
+                condition=models.Q(status='pending'),
+            ),
+            # Delta sync range scans
+            models.Index(fields=['student', 'updated_at'], name='application_student_sync_idx'),
+            models.Index(fields=['department', 'updated_at'], name='application_dept_sync_idx'),
+            models.Index(fields=['updated_at'], name='application_sync_idx'),
+        ]
 
 
 class Notification(models.Model):
@@ -173,10 +226,210 @@ class Notification(models.Model):
     is_read = models.BooleanField(default=False)
     related_id = models.PositiveIntegerField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     student = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='notifications')
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(
+                fields=['student', '-created_at'],
+                name='notification_unread_idx',
+                condition=models.Q(is_read=False),
+            ),
+            models.Index(fields=['student', 'updated_at'], name='notification_sync_idx'),
+            models.Index(fields=['student', '-created_at', '-id'], name='notification_list_idx'),
+        ]
     
     def __str__(self):
         return f"{self.title} - {self.student.first_name}"
+
+
+class NotificationCounter(models.Model):
+    """
+    Unread notification count per student, kept in step with every insert and
+    read so the dashboard badge is a primary-key lookup instead of a COUNT.
+    A side table rather than a user column, so saving a user never overwrites it.
+    """
+    user = models.OneToOneField(
+        CustomUser, on_delete=models.CASCADE, primary_key=True, related_name='notification_counter'
+    )
+    unread = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.user_id}: {self.unread} unread"
+
+
+class NotificationJob(models.Model):
+    """
+    Status change waiting for the notification worker. Written in the same
+    transaction as the change, so it is queued exactly when the change commits.
+    """
+    RECORD_TYPES = [
+        ('complaint', 'Complaint'),
+        ('application', 'Application'),
+    ]
+    CHANGES = [
+        ('status', 'Status changed'),
+        ('verified', 'Verified'),
+    ]
+
+    record_type = models.CharField(max_length=20, choices=RECORD_TYPES)
+    record_id = models.PositiveIntegerField()
+    change = models.CharField(max_length=10, choices=CHANGES, default='status')
+    # Snapshot of the item after the change, so the worker never reads the item tables
+    title = models.CharField(max_length=200)
+    department = models.CharField(max_length=20)
+    status = models.CharField(max_length=15)
+    student = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='notification_jobs')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['id']
+
+    def __str__(self):
+        return f"{self.record_type} {self.record_id} {self.change} -> {self.status}"
+
+
+class Tombstone(models.Model):
+    """Marker left behind when a complaint or application is deleted, for delta sync"""
+    RECORD_TYPES = [
+        ('complaint', 'Complaint'),
+        ('application', 'Application'),
+    ]
+
+    record_type = models.CharField(max_length=20, choices=RECORD_TYPES)
+    record_id = models.PositiveIntegerField()
+    department = models.CharField(max_length=20)
+    student = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='tombstones')
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-deleted_at']
+        indexes = [
+            models.Index(fields=['student', 'deleted_at'], name='tombstone_student_idx'),
+            models.Index(fields=['department', 'deleted_at'], name='tombstone_dept_idx'),
+            models.Index(fields=['deleted_at'], name='tombstone_deleted_idx'),
+        ]
+
+    @classmethod
+    def record(cls, instance):
+        """Create the tombstone for a Complaint or Application about to be deleted"""
+        return cls.objects.create(
+            record_type=instance._meta.model_name,
+            record_id=instance.pk,
+            department=instance.department,
+            student_id=instance.student_id,
+        )
+
+    @classmethod
+    def record_rows(cls, model, rows):
+        """Bulk-create tombstones for .values() rows of `model` removed in one batch"""
+        return cls.objects.bulk_create([
+            cls(
+                record_type=model._meta.model_name,
+                record_id=row['id'],
+                department=row['department'],
+                student_id=row['student_id'],
+            )
+            for row in rows
+        ])
+
+    def __str__(self):
+        return f"{self.record_type} {self.record_id} deleted"
+
+
+class StatusCounter(models.Model):
+    """
+    Running count of complaints or applications per (department, hall, category, status),
+    kept in step with every write so dashboard totals never scan the item tables
+    """
+    record_type = models.CharField(max_length=20, choices=Tombstone.RECORD_TYPES)
+    department = models.CharField(max_length=20)
+    # Applications have no hall; category is the application type for them
+    hall = models.CharField(max_length=50, blank=True, default='')
+    category = models.CharField(max_length=20)
+    status = models.CharField(max_length=15)
+    # Department queues only count verified applications; always False for complaints
+    verified = models.BooleanField(default=False)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['record_type', 'department', 'hall', 'category', 'status', 'verified'],
+                name='status_counter_key',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.record_type} {self.department}/{self.hall}/{self.category}/{self.status}: {self.count}"
+
+
+class PurgeRun(models.Model):
+    """One run of the retention purge: where each table got to, and what it removed"""
+    started_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    # Fixed for the run, so a resumed run deletes exactly what the original would have
+    cutoff = models.DateTimeField()
+    dry_run = models.BooleanField(default=False)
+    # Model name -> {'last_id': ..., 'deleted': ..., 'batches': ..., 'seconds': ...}
+    progress = models.JSONField(default=dict)
+
+    class Meta:
+        ordering = ['-started_at']
+
+    def __str__(self):
+        state = 'finished' if self.finished_at else 'unfinished'
+        return f"Purge {self.started_at:%Y-%m-%d %H:%M} ({state})"
+
+
+class ArchivedComplaint(models.Model):
+    """
+    Closed complaint moved out of the hot table by archive_closed. Keeps its
+    original id so C-numbers still resolve; besides the primary key only the
+    student's own list (and its delta sync) is indexed.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    title = models.CharField(max_length=200)
+    description = models.TextField()
+    category = models.CharField(max_length=20)
+    department = models.CharField(max_length=20)
+    hall = models.CharField(max_length=50)
+    priority = models.CharField(max_length=10)
+    status = models.CharField(max_length=15)
+    student = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='archived_complaints', db_index=False)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['student', 'updated_at'], name='archived_complaint_sync_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.title} (archived)"
+
+
+class ArchivedApplication(models.Model):
+    """Closed application moved out of the hot table by archive_closed"""
+    id = models.BigIntegerField(primary_key=True)
+    title = models.CharField(max_length=200)
+    description = models.TextField()
+    application_type = models.CharField(max_length=20)
+    department = models.CharField(max_length=20)
+    status = models.CharField(max_length=15)
+    verified = models.BooleanField(default=False)
+    student = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='archived_applications', db_index=False)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['student', 'updated_at'], name='archived_application_sync_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.title} (archived)"
@@ -0,0 +1,164 @@
+import logging
+import time
+from collections import Counter
+
+from django.db import DatabaseError, IntegrityError, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .connections import close_old_connections
+from .models import Notification, NotificationCounter, NotificationJob
+
+logger = logging.getLogger(__name__)
+
+# Jobs claimed per worker transaction; changes to the same item within a batch collapse into one row
+DEFAULT_BATCH_SIZE = 500
+
+# Seconds an idle worker waits before polling the queue again
+DEFAULT_POLL = 1.0
+
+STATUS_PHRASES = {
+    'complaint': {
+        'pending': 'is pending again',
+        'in-progress': 'is now being worked on',
+        'resolved': 'has been resolved',
+        'rejected': 'has been rejected',
+    },
+    'application': {
+        'pending': 'is pending again',
+        'approved': 'has been approved',
+        'rejected': 'has been rejected',
+    },
+}
+
+
+def enqueue(model, rows, change='status'):
+    """
+    Queue a notification for each changed Complaint/Application row (field
+    values by attname, after the change). Call inside the transaction that
+    made the change; this is one INSERT, the notifications are written later.
+    """
+    NotificationJob.objects.bulk_create([
+        NotificationJob(
+            record_type=model._meta.model_name,
+            record_id=row['id'],
+            change=change,
+            title=row['title'],
+            department=row['department'],
+            status=row['status'],
+            student_id=row['student_id'],
+        )
+        for row in rows
+    ])
+
+
+def add_unread(deltas):
+    """
+    Apply {student_id: delta} to the unread counters. Call inside the
+    transaction that inserted or read the notifications.
+    """
+    for student_id, delta in deltas.items():
+        if not delta:
+            continue
+        counter = NotificationCounter.objects.filter(user_id=student_id)
+        # Clamped at zero, so a counter that drifted low cannot break the write;
+        # with no counter row there is nothing to take away from
+        if counter.update(unread=Greatest(F('unread') + delta, Value(0))) or delta < 0:
+            continue
+        try:
+            # Savepoint, so losing the insert race to another writer is recoverable
+            with transaction.atomic():
+                NotificationCounter.objects.create(user_id=student_id, unread=max(delta, 0))
+        except IntegrityError:
+            counter.update(unread=Greatest(F('unread') + delta, Value(0)))
+
+
+def unread_count(user):
+    """The badge number: one primary-key lookup, no COUNT over notifications"""
+    return NotificationCounter.objects.filter(user_id=user.pk).values_list('unread', flat=True).first() or 0
+
+
+def mark_read(user, ids=None):
+    """
+    Mark the user's notifications read (only `ids`, if given) with one UPDATE
+    and take exactly the rows it changed off their counter. Returns that number.
+    """
+    notifications = Notification.objects.filter(student_id=user.pk, is_read=False)
+    if ids is not None:
+        notifications = notifications.filter(id__in=ids)
+    with transaction.atomic():
+        changed = notifications.update(is_read=True, updated_at=timezone.now())
+        add_unread({user.pk: -changed})
+    return changed
+
+
+def build_notification(job):
+    """The Notification a student receives for a job's change"""
+    kind = job['record_type']
+    if job['change'] == 'verified':
+        department = job['department'].replace('_', ' ').title()
+        phrase = f'has been verified and forwarded to {department}'
+    else:
+        phrase = STATUS_PHRASES[kind].get(job['status'], f"is now {job['status']}")
+    return Notification(
+        title=f"{kind.title()} update: {job['title']}",
+        message=f"Your {kind} \"{job['title']}\" {phrase}.",
+        notification_type=kind,
+        related_id=job['record_id'],
+        student_id=job['student_id'],
+    )
+
+
+def drain_batch(batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Turn up to `batch_size` queued jobs into notifications in one transaction.
+    Returns (jobs, notifications); a failure rolls back and leaves the jobs queued.
+    """
+    with transaction.atomic():
+        # skip_locked: several workers can drain the queue side by side
+        jobs = list(NotificationJob.objects.order_by('id').select_for_update(skip_locked=True).values()[:batch_size])
+        if not jobs:
+            return 0, 0
+
+        # Oldest first, so the last change to each item wins and is the one reported
+        latest = {}
+        for job in jobs:
+            latest[(job['record_type'], job['record_id'])] = job
+        created = Notification.objects.bulk_create([build_notification(job) for job in latest.values()])
+        # bulk_create skips post_save, so the unread counters are raised here
+        add_unread(Counter(notification.student_id for notification in created))
+        # No cascades or signals, so this is a single DELETE
+        NotificationJob.objects.filter(id__in=[job['id'] for job in jobs]).delete()
+    return len(jobs), len(latest)
+
+
+def run_worker(batch_size=DEFAULT_BATCH_SIZE, poll=DEFAULT_POLL, once=False, log=None):
+    """
+    Drain the queue batch after batch; when it is empty, stop if `once`,
+    otherwise sleep `poll` seconds and look again. Returns totals.
+    """
+    totals = {'jobs': 0, 'notifications': 0, 'batches': 0}
+    while True:
+        # As Django does between requests: drop a connection that is past
+        # CONN_MAX_AGE or broke in the last batch, so this one reconnects
+        close_old_connections()
+        try:
+            jobs, created = drain_batch(batch_size)
+        except DatabaseError:
+            if once:
+                raise
+            # E.g. the server or a pooler dropped the connection; the jobs stay queued
+            logger.exception('Notification batch failed, retrying in %s seconds', poll)
+            time.sleep(poll)
+            continue
+        if jobs:
+            totals['jobs'] += jobs
+            totals['notifications'] += created
+            totals['batches'] += 1
+            if log:
+                log(f'{jobs} jobs -> {created} notifications')
+            continue
+        if once:
+            return totals
+        time.sleep(poll)
@@ -0,0 +1,123 @@
+import base64
+import json
+from collections import namedtuple
+
+from django.db.models import Q
+from django.utils.dateparse import parse_date, parse_datetime
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Query parameter -> model field for the server-side queue filters
+COMPLAINT_FILTERS = {
+    'status': 'status',
+    'hall': 'hall',
+    'category': 'category',
+    'priority': 'priority',
+    'department': 'department',
+}
+
+APPLICATION_FILTERS = {
+    'status': 'status',
+    'category': 'application_type',
+    'department': 'department',
+}
+
+Page = namedtuple('Page', ['rows', 'next_cursor', 'prev_cursor'])
+
+
+class InvalidQuery(ValueError):
+    """Raised when a cursor, page size or filter value cannot be used."""
+
+
+def encode_cursor(row, direction):
+    """Build an opaque token pointing at the (created_at, id) key of a row"""
+    raw = json.dumps([row['created_at'].isoformat(), row['id'], direction])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    """Return (created_at, id, direction) for a token built by encode_cursor"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        created_at, pk, direction = json.loads(base64.urlsafe_b64decode(padded))
+        created_at = parse_datetime(created_at)
+    except (ValueError, TypeError):
+        raise InvalidQuery('Invalid cursor.')
+    if created_at is None or not isinstance(pk, int) or direction not in ('next', 'prev'):
+        raise InvalidQuery('Invalid cursor.')
+    return created_at, pk, direction
+
+
+def page_size(params):
+    try:
+        size = int(params.get('limit', DEFAULT_PAGE_SIZE))
+    except (TypeError, ValueError):
+        raise InvalidQuery('Invalid page size.')
+    return max(1, min(size, MAX_PAGE_SIZE))
+
+
+def apply_filters(queryset, params, fields):
+    """Narrow a queryset with the equality and date-range query parameters"""
+    lookups = {}
+    for param, field in fields.items():
+        value = params.get(param)
+        if value:
+            lookups[field] = value
+
+    for param, lookup in (('date_from', 'created_at__date__gte'), ('date_to', 'created_at__date__lte')):
+        value = params.get(param)
+        if value:
+            try:
+                parsed = parse_date(value)
+            except ValueError:
+                parsed = None
+            if parsed is None:
+                raise InvalidQuery(f'Invalid {param}, expected YYYY-MM-DD.')
+            lookups[lookup] = parsed
+
+    return queryset.filter(**lookups) if lookups else queryset
+
+
+def paginate(queryset, params):
+    """
+    Keyset-paginate a .values() queryset on (created_at, id), newest first.
+    The rows must include 'created_at' and 'id'.
+    """
+    limit = page_size(params)
+    cursor = params.get('cursor')
+
+    if cursor:
+        created_at, pk, direction = decode_cursor(cursor)
+        if direction == 'next':
+            queryset = queryset.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+            ).order_by('-created_at', '-id')
+        else:
+            queryset = queryset.filter(
+                Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+            ).order_by('created_at', 'id')
+    else:
+        direction = 'next'
+        queryset = queryset.order_by('-created_at', '-id')
+
+    rows = list(queryset[:limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if direction == 'prev':
+        rows.reverse()
+
+    # Walking forward from a cursor implies there is a page behind us, and vice versa
+    if direction == 'next':
+        has_next, has_prev = has_more, bool(cursor)
+    else:
+        has_next, has_prev = True, has_more
+
+    next_cursor = prev_cursor = None
+    if rows:
+        if has_next:
+            next_cursor = encode_cursor(rows[-1], 'next')
+        if has_prev:
+            prev_cursor = encode_cursor(rows[0], 'prev')
+
+    return Page(rows, next_cursor, prev_cursor)
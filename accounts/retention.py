@@ -0,0 +1,130 @@
+import time
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .cache import bump_queue_version
+from .archive import ARCHIVES, CLOSED_STATUSES, delete_rows
+from .counters import adjust, counter_key
+from .models import (
+    Application, ArchivedApplication, ArchivedComplaint, Complaint, Notification, PurgeRun, Tombstone,
+)
+from .sync import SYNC_TOKEN_TTL
+
+# Finished or abandoned items; anything in progress is kept however old it is
+RETENTION_STATUSES = {
+    Complaint: ['pending', 'resolved', 'rejected'],
+    Application: ['pending', 'approved', 'rejected'],
+    # Only closed items are ever archived
+    ArchivedComplaint: CLOSED_STATUSES[Complaint],
+    ArchivedApplication: CLOSED_STATUSES[Application],
+}
+
+# The hot model each archive table takes rows from
+ARCHIVED_FROM = {archive: model for model, archive in ARCHIVES.items()}
+
+# Tombstones go last: the markers written for this run's deletions are new and stay
+PURGED_MODELS = [Complaint, Application, ArchivedComplaint, ArchivedApplication, Notification, Tombstone]
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_SLEEP = 0.5
+
+
+def retention_days():
+    return getattr(settings, 'RETENTION_DAYS', 10)
+
+
+def expired(model, run):
+    """Rows of `model` that `run` may delete"""
+    if model is Tombstone:
+        # Only sync tokens younger than their TTL can still ask for these
+        return Tombstone.objects.filter(deleted_at__lt=run.started_at - SYNC_TOKEN_TTL)
+    if model is Notification:
+        return Notification.objects.filter(is_read=True, created_at__lt=run.cutoff)
+    return model.objects.filter(status__in=RETENTION_STATUSES[model], updated_at__lt=run.cutoff)
+
+
+def purge_batch(model, run, after_id, batch_size):
+    """
+    Delete up to `batch_size` expired rows with id > `after_id` in one short
+    transaction. Returns (deleted, last_id); last_id is None when none are left.
+    """
+    with transaction.atomic():
+        # skip_locked: a row a live request is writing is left for the next run
+        rows = list(
+            expired(model, run).filter(id__gt=after_id).order_by('id')
+            .select_for_update(skip_locked=True).values()[:batch_size]
+        )
+        if not rows:
+            return 0, None
+        ids = [row['id'] for row in rows]
+
+        if model in RETENTION_STATUSES:
+            adjust(Counter({key: -count for key, count in Counter(counter_key(model, row) for row in rows).items()}))
+        if model in ARCHIVES:
+            Tombstone.record_rows(model, rows)
+            departments = {row['department'] for row in rows}
+            transaction.on_commit(lambda: bump_queue_version(*departments))
+        elif model in ARCHIVED_FROM:
+            # Archived rows left the queues when they moved, but stay in their students' lists until now
+            Tombstone.record_rows(ARCHIVED_FROM[model], rows)
+
+        # Nothing cascades from these tables and the side effects of post_delete
+        # are applied above for the whole batch, so skip the per-row collector
+        delete_rows(model, ids)
+    return len(ids), ids[-1]
+
+
+def start_run(dry_run=False, days=None):
+    now = timezone.now()
+    return PurgeRun.objects.create(
+        cutoff=now - timedelta(days=retention_days() if days is None else days),
+        dry_run=dry_run,
+    )
+
+
+def resumable_run():
+    """The most recent unfinished real run, if any"""
+    return PurgeRun.objects.filter(finished_at__isnull=True, dry_run=False).first()
+
+
+def execute(run, batch_size=DEFAULT_BATCH_SIZE, sleep=DEFAULT_SLEEP, log=None):
+    """
+    Work through every purged table in primary-key batches, pausing `sleep`
+    seconds between batches. Progress is saved after each batch so an
+    interrupted run can be resumed where it stopped.
+    """
+    for model in PURGED_MODELS:
+        name = model._meta.model_name
+        progress = run.progress.setdefault(name, {'last_id': 0, 'deleted': 0, 'batches': 0, 'seconds': 0.0})
+        if progress.get('done'):
+            continue
+
+        if run.dry_run:
+            progress['deleted'] = expired(model, run).count()
+            progress['done'] = True
+            run.save(update_fields=['progress'])
+            continue
+
+        while True:
+            started = time.monotonic()
+            deleted, last_id = purge_batch(model, run, progress['last_id'], batch_size)
+            progress['seconds'] = round(progress['seconds'] + time.monotonic() - started, 3)
+            if last_id is None:
+                progress['done'] = True
+                run.save(update_fields=['progress'])
+                break
+            progress['last_id'] = last_id
+            progress['deleted'] += deleted
+            progress['batches'] += 1
+            run.save(update_fields=['progress'])
+            if log:
+                log(f"{name}: batch {progress['batches']}, {progress['deleted']} deleted so far")
+            time.sleep(sleep)
+
+    run.finished_at = timezone.now()
+    run.save(update_fields=['finished_at'])
+    return run
@@ -0,0 +1,135 @@
+import asyncio
+import random
+import time
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+PIN_KEY = 'replica-pin:{}'
+
+# A replica that failed to connect is skipped for this many seconds
+RETRY_SECONDS = 30
+
+# Alias the current request reads from; unset outside @replica_reads views
+_read_alias = ContextVar('read_alias', default=None)
+_down_until = {}
+
+
+def replicas():
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+def lag_seconds():
+    return getattr(settings, 'REPLICA_LAG_SECONDS', 5)
+
+
+def _cache():
+    return caches[getattr(settings, 'QUEUE_CACHE_ALIAS', 'default')]
+
+
+def pin(user):
+    """
+    Send this user's reads to the primary until replicas have caught up with
+    their write. Kept in the cache every worker shares (see settings).
+    """
+    _cache().set(PIN_KEY.format(user.pk), 1, timeout=lag_seconds())
+
+
+def is_pinned(user):
+    return _cache().get(PIN_KEY.format(user.pk)) is not None
+
+
+def healthy_replica():
+    """A replica that accepts connections, or None to stay on the primary"""
+    candidates = [alias for alias in replicas() if _down_until.get(alias, 0) <= time.monotonic()]
+    random.shuffle(candidates)
+    for alias in candidates:
+        try:
+            connections[alias].ensure_connection()
+        except DatabaseError:
+            _down_until[alias] = time.monotonic() + RETRY_SECONDS
+            continue
+        return alias
+    return None
+
+
+def reading_replica():
+    """True while the current request reads from a replica"""
+    return _read_alias.get() is not None
+
+
+def _replica_for(request):
+    """The replica a read-only request may use, or None"""
+    if request.method not in ('GET', 'HEAD') or not replicas() or is_pinned(request.user):
+        return None
+    return healthy_replica()
+
+
+def replica_reads(view_func):
+    """
+    Serve a read-only view's GETs from a replica, unless the user wrote
+    recently or no replica is reachable. Wrap it inside the auth decorators
+    so the session and user are still read from the primary.
+    """
+    if asyncio.iscoroutinefunction(view_func):
+        @wraps(view_func)
+        async def _wrapped_async_view(request, *args, **kwargs):
+            alias = await sync_to_async(_replica_for)(request)
+            if alias is None:
+                return await view_func(request, *args, **kwargs)
+            # sync_to_async copies this context, so the view's queries see the alias
+            token = _read_alias.set(alias)
+            try:
+                return await view_func(request, *args, **kwargs)
+            finally:
+                _read_alias.reset(token)
+        return _wrapped_async_view
+
+    @wraps(view_func)
+    def _wrapped_view(request, *args, **kwargs):
+        alias = _replica_for(request)
+        if alias is None:
+            return view_func(request, *args, **kwargs)
+        token = _read_alias.set(alias)
+        try:
+            return view_func(request, *args, **kwargs)
+        finally:
+            _read_alias.reset(token)
+    return _wrapped_view
+
+
+class ReplicaRouter:
+    """Reads inside @replica_reads views go to the chosen replica; everything else to the primary"""
+
+    def db_for_read(self, model, **hints):
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        # Explicit, or a write to an instance loaded from a replica would follow it there
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        pool = {DEFAULT_DB_ALIAS, *replicas()}
+        if obj1._state.db in pool and obj2._state.db in pool:
+            return True
+        return None
+
+
+class ReplicaPinMiddleware:
+    """Pin a user to the primary after any successful non-GET request"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if (
+            replicas() and request.method not in ('GET', 'HEAD', 'OPTIONS')
+            and response.status_code < 400 and request.user.is_authenticated
+        ):
+            pin(request.user)
+        return response
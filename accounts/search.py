@@ -0,0 +1,172 @@
+import base64
+import json
+import re
+
+from django.db import connection
+from django.db.models import BooleanField, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+from .pagination import InvalidQuery, Page, page_size
+
+# Title and description of these tables are indexed for full-text search
+SEARCH_TABLES = ['accounts_complaint', 'accounts_application']
+
+# Longer queries add little to ranking but cost a term per match check
+MAX_TERMS = 8
+
+
+def search_terms(query):
+    """Split free text into plain word tokens; operators and quotes are dropped"""
+    return re.findall(r'\w+', query.lower())[:MAX_TERMS]
+
+
+def _postgres_sql(table):
+    index = table.replace('accounts_', '') + '_search_idx'
+    return [
+        # Generated column: PostgreSQL recomputes it on every insert and update
+        f"""ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(description, '')), 'B')
+            ) STORED""",
+        f'CREATE INDEX IF NOT EXISTS {index} ON {table} USING GIN (search_vector)',
+    ]
+
+
+def _sqlite_sql(table):
+    fts = f'{table}_fts'
+    return [
+        # External-content FTS5 table: stores only the index, reads text from the base table
+        f"""CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+                title, description, content='{table}', content_rowid='id', tokenize='porter unicode61'
+            )""",
+        f"""CREATE TRIGGER IF NOT EXISTS {fts}_insert AFTER INSERT ON {table} BEGIN
+                INSERT INTO {fts}(rowid, title, description) VALUES (new.id, new.title, new.description);
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {fts}_delete AFTER DELETE ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, title, description)
+                VALUES ('delete', old.id, old.title, old.description);
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {fts}_update AFTER UPDATE OF title, description ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, title, description)
+                VALUES ('delete', old.id, old.title, old.description);
+                INSERT INTO {fts}(rowid, title, description) VALUES (new.id, new.title, new.description);
+            END""",
+    ]
+
+
+def _sqlite_triggers(cursor):
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'accounts_%_fts_%'")
+    return {name for (name,) in cursor.fetchall()}
+
+
+def install(conn):
+    """
+    Create the search index for the connection's database vendor. Idempotent;
+    on SQLite it is also re-run after migrate, because rebuilding a table for an
+    ALTER drops its triggers, and the FTS table is resynced when that happened.
+    """
+    with conn.cursor() as cursor:
+        if conn.vendor == 'postgresql':
+            for table in SEARCH_TABLES:
+                for sql in _postgres_sql(table):
+                    cursor.execute(sql)
+        elif conn.vendor == 'sqlite':
+            before = _sqlite_triggers(cursor)
+            for table in SEARCH_TABLES:
+                for sql in _sqlite_sql(table):
+                    cursor.execute(sql)
+            if _sqlite_triggers(cursor) != before:
+                for table in SEARCH_TABLES:
+                    cursor.execute(f"INSERT INTO {table}_fts({table}_fts) VALUES ('rebuild')")
+
+
+def restore(conn):
+    """Re-create SQLite triggers lost to a table rebuild, if search is installed"""
+    if conn.vendor != 'sqlite':
+        return
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [f'{SEARCH_TABLES[0]}_fts'])
+        installed = cursor.fetchone() is not None
+    if installed:
+        install(conn)
+
+
+def uninstall(conn):
+    with conn.cursor() as cursor:
+        for table in SEARCH_TABLES:
+            if conn.vendor == 'postgresql':
+                cursor.execute(f'ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector')
+            elif conn.vendor == 'sqlite':
+                for suffix in ('insert', 'delete', 'update'):
+                    cursor.execute(f'DROP TRIGGER IF EXISTS {table}_fts_{suffix}')
+                cursor.execute(f'DROP TABLE IF EXISTS {table}_fts')
+
+
+def search(queryset, query):
+    """
+    Narrow a Complaint/Application queryset to rows whose title or description
+    match `query`, annotated with a `rank` where higher is more relevant.
+    """
+    terms = search_terms(query)
+    if not terms:
+        raise InvalidQuery('Enter at least one word to search for.')
+    table = queryset.model._meta.db_table
+
+    if connection.vendor == 'postgresql':
+        tsquery = ' & '.join(f'{term}:*' for term in terms)
+        vector = f'"{table}"."search_vector"'
+        matches = RawSQL(f"{vector} @@ to_tsquery('english', %s)", [tsquery], output_field=BooleanField())
+        rank = RawSQL(f"ts_rank({vector}, to_tsquery('english', %s))", [tsquery], output_field=FloatField())
+    elif connection.vendor == 'sqlite':
+        fts = f'{table}_fts'
+        match = ' '.join(f'"{term}"*' for term in terms)
+        matches = RawSQL(
+            f'"{table}"."id" IN (SELECT rowid FROM {fts} WHERE {fts} MATCH %s)', [match],
+            output_field=BooleanField(),
+        )
+        # bm25() is lower for better matches; title hits weigh more than description hits
+        rank = RawSQL(
+            f'(SELECT -bm25({fts}, 4.0, 1.0) FROM {fts} WHERE {fts} MATCH %s AND rowid = "{table}"."id")',
+            [match], output_field=FloatField(),
+        )
+    else:
+        # No full-text index on other backends: unranked substring match
+        matches = Q()
+        for term in terms:
+            matches &= Q(title__icontains=term) | Q(description__icontains=term)
+        rank = Value(0.0, output_field=FloatField())
+
+    return queryset.filter(matches).annotate(rank=rank)
+
+
+def _encode_cursor(row):
+    raw = json.dumps([row['rank'], row['id']])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def _decode_cursor(token):
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        rank, pk = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError):
+        raise InvalidQuery('Invalid cursor.')
+    if not isinstance(rank, (int, float)) or not isinstance(pk, int):
+        raise InvalidQuery('Invalid cursor.')
+    return rank, pk
+
+
+def paginate_ranked(queryset, params):
+    """
+    Keyset-paginate a searched .values() queryset on (rank, id), best match first.
+    Forward only: search results are read top down.
+    """
+    limit = page_size(params)
+    cursor = params.get('cursor')
+    if cursor:
+        rank, pk = _decode_cursor(cursor)
+        queryset = queryset.filter(Q(rank__lt=rank) | Q(rank=rank, id__lt=pk))
+
+    rows = list(queryset.order_by('-rank', '-id')[:limit + 1])
+    next_cursor = _encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+    return Page(rows[:limit], next_cursor, None)
@@ -0,0 +1,184 @@
+import json
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+from django.utils.module_loading import import_string
+
+from .models import Application, Complaint
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+STUDENT_COMPLAINT_FIELDS = (
+    'id', 'title', 'description', 'category', 'hall', 'priority',
+    'status', 'created_at', 'updated_at'
+)
+
+STUDENT_APPLICATION_FIELDS = (
+    'id', 'title', 'description', 'application_type', 'department',
+    'status', 'created_at', 'updated_at'
+)
+
+COMPLAINT_FIELDS = (
+    'id', 'title', 'description', 'category', 'department', 'hall', 'priority',
+    'status', 'version', 'created_at', 'updated_at', 'student__first_name',
+    'student__last_name', 'student__college_id'
+)
+
+APPLICATION_FIELDS = (
+    'id', 'title', 'description', 'application_type', 'department',
+    'status', 'version', 'created_at', 'updated_at', 'student__first_name',
+    'student__last_name', 'student__college_id', 'verified'
+)
+
+NOTIFICATION_FIELDS = ('id', 'title', 'message', 'notification_type', 'is_read', 'related_id', 'created_at')
+
+
+def _title(value):
+    return value.replace('-', ' ').replace('_', ' ').title()
+
+
+def _labels(*choice_lists):
+    # The title-cased keys clients already display, not the choices' display names
+    return {value: _title(value) for choices in choice_lists for value, _ in choices}
+
+
+CATEGORY_LABELS = _labels(Complaint.CATEGORY_CHOICES)
+HALL_LABELS = _labels(Complaint.HALL_CHOICES)
+PRIORITY_LABELS = _labels(Complaint.PRIORITY_CHOICES)
+APPLICATION_TYPE_LABELS = _labels(Application.APPLICATION_TYPES)
+DEPARTMENT_LABELS = _labels(Complaint.DEPARTMENT_CHOICES, Application.DEPARTMENTS)
+
+
+def label(labels, value):
+    """Display label for a choice key; values outside the choices are title-cased on the fly"""
+    try:
+        return labels[value]
+    except KeyError:
+        return _title(value)
+
+
+def format_date(value):
+    """YYYY-MM-DD; isoformat() is several times cheaper than strftime()"""
+    return value.isoformat()[:10]
+
+
+def format_timestamp(value):
+    """YYYY-MM-DD HH:MM:SS, without the UTC offset"""
+    return value.isoformat(' ', 'seconds')[:19]
+
+
+def student_complaint(row):
+    """A complaint in the student's own list (STUDENT_COMPLAINT_FIELDS row)"""
+    return {
+        'id': f'C{row["id"]:03d}',
+        'title': row['title'],
+        'description': row['description'],
+        'category': label(CATEGORY_LABELS, row['category']),
+        'hall': label(HALL_LABELS, row['hall']),
+        'priority': label(PRIORITY_LABELS, row['priority']),
+        'status': row['status'],
+        'date': format_date(row['created_at']),
+        'updated_at': format_timestamp(row['updated_at'])
+    }
+
+
+def student_application(row):
+    """An application in the student's own list (STUDENT_APPLICATION_FIELDS row)"""
+    return {
+        'id': f'A{row["id"]:03d}',
+        'title': row['title'],
+        'description': row['description'],
+        'category': label(APPLICATION_TYPE_LABELS, row['application_type']),
+        'department': label(DEPARTMENT_LABELS, row['department']),
+        'status': row['status'],
+        'date': format_date(row['created_at']),
+        'updated_at': format_timestamp(row['updated_at'])
+    }
+
+
+def complaint(row):
+    """A complaint in a staff queue, search result, export or sync (COMPLAINT_FIELDS row)"""
+    return {
+        'id': f'C{row["id"]:03d}',
+        'title': row['title'],
+        'description': row['description'],
+        'category': label(CATEGORY_LABELS, row['category']),
+        'department': label(DEPARTMENT_LABELS, row['department']),
+        'hall': label(HALL_LABELS, row['hall']),
+        'priority': label(PRIORITY_LABELS, row['priority']),
+        'status': row['status'],
+        'version': row['version'],
+        'student_name': f"{row['student__first_name']} {row['student__last_name']}",
+        'student_id': row['student__college_id'],
+        'date': format_date(row['created_at']),
+        'updated_at': format_timestamp(row['updated_at'])
+    }
+
+
+def application(row):
+    """An application in a staff queue, search result, export or sync (APPLICATION_FIELDS row)"""
+    return {
+        'id': f'A{row["id"]:03d}',
+        'title': row['title'],
+        'description': row['description'],
+        'category': label(APPLICATION_TYPE_LABELS, row['application_type']),
+        'department': label(DEPARTMENT_LABELS, row['department']),
+        'status': row['status'],
+        'version': row['version'],
+        'student_name': f"{row['student__first_name']} {row['student__last_name']}",
+        'student_id': row['student__college_id'],
+        'date': format_date(row['created_at']),
+        'updated_at': format_timestamp(row['updated_at']),
+        'verified': row['verified']
+    }
+
+
+def complaint_detail(row, archived):
+    """The details view: the queue shape plus whether the complaint was archived"""
+    data = complaint(row)
+    data['archived'] = archived
+    return data
+
+
+def application_detail(row, archived):
+    """The details view names the type 'application_type' and leaves out 'verified'"""
+    data = application(row)
+    data['application_type'] = data.pop('category')
+    del data['verified']
+    data['archived'] = archived
+    return data
+
+
+def notification(row):
+    """A NOTIFICATION_FIELDS row, formatted in place"""
+    row['created_at'] = format_timestamp(row['created_at'])
+    return row
+
+
+def stdlib_dumps(data):
+    return json.dumps(data, cls=DjangoJSONEncoder, separators=(',', ':')).encode()
+
+
+def orjson_dumps(data):
+    return orjson.dumps(data)
+
+
+@lru_cache(maxsize=None)
+def _encoder(path):
+    if path:
+        return import_string(path)
+    return orjson_dumps if orjson is not None else stdlib_dumps
+
+
+def dumps(data):
+    """Encode to JSON bytes with JSON_ENCODER, or orjson when it is installed"""
+    return _encoder(getattr(settings, 'JSON_ENCODER', None))(data)
+
+
+def json_response(data, status=200):
+    return HttpResponse(dumps(data), content_type='application/json', status=status)
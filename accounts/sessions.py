@@ -0,0 +1,48 @@
+import time
+
+from django.conf import settings
+from django.contrib.sessions.backends.cached_db import SessionStore as CachedDBStore
+from django.contrib.sessions.middleware import SessionMiddleware
+
+# When the session was last written, in epoch seconds
+REFRESHED_KEY = '_refreshed_at'
+
+
+def refresh_fraction():
+    return getattr(settings, 'SESSION_REFRESH_FRACTION', 0.5)
+
+
+class SessionStore(CachedDBStore):
+    """
+    Cache-first session store with the database behind it. Every save stamps
+    the session, so the middleware can tell how much of its age is left
+    without a write on each request.
+    """
+
+    def save(self, must_create=False):
+        self._get_session()[REFRESHED_KEY] = int(time.time())
+        super().save(must_create)
+
+    def needs_refresh(self):
+        """True once less than SESSION_REFRESH_FRACTION of the cookie age remains"""
+        refreshed_at = self.get(REFRESHED_KEY)
+        if refreshed_at is None:
+            return True
+        return time.time() - refreshed_at > self.get_session_cookie_age() * (1 - refresh_fraction())
+
+
+class RefreshingSessionMiddleware(SessionMiddleware):
+    """
+    SessionMiddleware that extends an unchanged session only when it is close
+    to expiring, instead of SESSION_SAVE_EVERY_REQUEST writing on every poll.
+    Sessions nothing touched, such as anonymous GETs, are never loaded or created.
+    """
+
+    def process_response(self, request, response):
+        session = getattr(request, 'session', None)
+        if (
+            session is not None and session.accessed and not session.modified
+            and session.session_key and hasattr(session, 'needs_refresh') and session.needs_refresh()
+        ):
+            session.modified = True
+        return super().process_response(request, response)
@@ -0,0 +1,82 @@
+from django.core.signals import request_finished, request_started
+from django.db import connections, transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_migrate, post_save, pre_save
+from django.dispatch import receiver
+
+from .cache import bump_queue_version
+from . import connections as db_connections
+from . import search
+from .counters import adjust, counter_key, instance_key, move
+from .models import Application, Complaint, Notification
+from .notifications import add_unread
+
+
+@receiver(post_save, sender=Complaint)
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Complaint)
+@receiver(post_delete, sender=Application)
+def invalidate_queue_cache(sender, instance, **kwargs):
+    # Bump after commit; bumping earlier would let a concurrent reader cache
+    # the pre-commit rows under the new version
+    department = instance.department
+    transaction.on_commit(lambda: bump_queue_version(department))
+
+
+@receiver(pre_save, sender=Complaint)
+@receiver(pre_save, sender=Application)
+def remember_counter_key(sender, instance, **kwargs):
+    # Only full saves of existing rows (e.g. the admin) need the stored values;
+    # workflow changes go through transitions.py, which moves counters itself
+    if not instance._state.adding:
+        stored = sender.objects.filter(pk=instance.pk).values().first()
+        instance._counter_key = counter_key(sender, stored) if stored else None
+
+
+@receiver(post_save, sender=Complaint)
+@receiver(post_save, sender=Application)
+def count_saved(sender, instance, created, **kwargs):
+    old_key = None if created else getattr(instance, '_counter_key', None)
+    if old_key is None:
+        adjust({instance_key(instance): 1})
+    else:
+        move(old_key, instance_key(instance))
+
+
+@receiver(post_delete, sender=Complaint)
+@receiver(post_delete, sender=Application)
+def count_deleted(sender, instance, **kwargs):
+    adjust({instance_key(instance): -1})
+
+
+@receiver(pre_save, sender=Notification)
+def remember_read_state(sender, instance, **kwargs):
+    # The worker and the read endpoints keep the counters themselves; this
+    # covers notifications saved one at a time, e.g. from the admin
+    if not instance._state.adding:
+        instance._was_unread = sender.objects.filter(pk=instance.pk, is_read=False).exists()
+
+
+@receiver(post_save, sender=Notification)
+def count_unread_saved(sender, instance, created, **kwargs):
+    was_unread = not created and getattr(instance, '_was_unread', False)
+    add_unread({instance.student_id: int(not instance.is_read) - int(was_unread)})
+
+
+@receiver(post_delete, sender=Notification)
+def count_unread_deleted(sender, instance, **kwargs):
+    if not instance.is_read:
+        add_unread({instance.student_id: -1})
+
+
+@receiver(post_migrate)
+def restore_search_index(sender, using, **kwargs):
+    if sender.label == 'accounts':
+        search.restore(connections[using])
+
+
+# Connection reuse, health checks and per-worker stats (accounts/connections.py);
+# request_started runs after Django's own close_old_connections receiver
+connection_created.connect(db_connections.connection_opened)
+request_started.connect(db_connections.check_connections)
+request_finished.connect(db_connections.publish_stats)
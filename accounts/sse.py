@@ -0,0 +1,90 @@
+import asyncio
+import json
+from importlib import import_module
+from types import SimpleNamespace
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user
+from django.db import close_old_connections
+from django.http.cookie import parse_cookie
+
+from .events import Subscription, channels_for_user, get_broadcaster
+
+EVENTS_PATH = '/events/'
+HEARTBEAT_SECONDS = 15
+
+
+@sync_to_async
+def _authenticate(headers):
+    """Resolve the session cookie to a user, the same way AuthenticationMiddleware does"""
+    close_old_connections()
+    try:
+        cookies = parse_cookie(headers.get(b'cookie', b'').decode('latin-1'))
+        session_key = cookies.get(settings.SESSION_COOKIE_NAME)
+        if not session_key:
+            return None
+        engine = import_module(settings.SESSION_ENGINE)
+        user = get_user(SimpleNamespace(session=engine.SessionStore(session_key)))
+        return user if user.is_authenticated else None
+    finally:
+        close_old_connections()
+
+
+async def _reject(send, status, message):
+    body = json.dumps({'success': False, 'message': message}).encode()
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode())],
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def sse_application(scope, receive, send):
+    """
+    Server-Sent Events stream of status changes and new submissions.
+    Students get their own items; staff-side roles get their department queue.
+    """
+    if scope['method'] != 'GET':
+        await _reject(send, 405, 'Method not allowed.')
+        return
+
+    user = await _authenticate(dict(scope['headers']))
+    if user is None:
+        await _reject(send, 401, 'Authentication required.')
+        return
+
+    async def wait_for_disconnect():
+        while (await receive())['type'] != 'http.disconnect':
+            pass
+
+    disconnect = asyncio.ensure_future(wait_for_disconnect())
+    try:
+        async with Subscription(get_broadcaster(), channels_for_user(user)) as subscription:
+            await send({
+                'type': 'http.response.start',
+                'status': 200,
+                'headers': [
+                    (b'content-type', b'text/event-stream'),
+                    (b'cache-control', b'no-cache'),
+                    (b'x-accel-buffering', b'no'),
+                ],
+            })
+            # Tell the client how long to wait before reconnecting
+            await send({'type': 'http.response.body', 'body': b'retry: 5000\n\n', 'more_body': True})
+
+            while True:
+                getter = asyncio.ensure_future(subscription.get(HEARTBEAT_SECONDS))
+                await asyncio.wait({getter, disconnect}, return_when=asyncio.FIRST_COMPLETED)
+                if disconnect.done():
+                    getter.cancel()
+                    return
+                try:
+                    chunk = f'data: {json.dumps(getter.result())}\n\n'.encode()
+                except asyncio.TimeoutError:
+                    # Comment line keeps proxies from closing an idle stream
+                    chunk = b': keepalive\n\n'
+                await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+    finally:
+        disconnect.cancel()
@@ -0,0 +1,75 @@
+import base64
+from collections import namedtuple
+from datetime import timedelta
+
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+# Rows committed by a transaction that started before the previous poll can carry an
+# older updated_at than the token; re-send this window so they are never missed.
+# Clients upsert by id, so the overlap is harmless.
+SYNC_OVERLAP = timedelta(seconds=5)
+
+# Tokens older than this may predate purged tombstones; the client must reload in full
+SYNC_TOKEN_TTL = timedelta(days=30)
+
+Changes = namedtuple('Changes', ['complaints', 'applications', 'notifications', 'deleted'])
+
+
+class InvalidSyncToken(ValueError):
+    """Raised for a sync token that is malformed or too old to resume from."""
+
+
+def encode_token(moment):
+    return base64.urlsafe_b64encode(moment.isoformat().encode()).decode().rstrip('=')
+
+
+def decode_token(token):
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        moment = parse_datetime(base64.urlsafe_b64decode(padded).decode())
+    except (ValueError, UnicodeDecodeError):
+        moment = None
+    if moment is None or timezone.is_naive(moment):
+        raise InvalidSyncToken('Invalid sync token.')
+    if moment < timezone.now() - SYNC_TOKEN_TTL:
+        raise InvalidSyncToken('Sync token has expired.')
+    return moment
+
+
+def new_token():
+    return encode_token(timezone.now())
+
+
+def changed(queryset, since):
+    """Rows of `queryset` touched after `since`, overlap included"""
+    return queryset.filter(updated_at__gt=since - SYNC_OVERLAP)
+
+
+def changes_since(since, complaints, applications, notifications, tombstones, departed=()):
+    """
+    Filter already role-scoped querysets down to rows touched after `since`.
+    Each filter is a single range scan on the (scope, updated_at) indexes.
+    Rows changed in a `departed` queryset have left the scope without being
+    deleted (e.g. verified out of the provost queue) and are reported as deleted.
+    """
+    cutoff = since - SYNC_OVERLAP
+    deleted = {'complaints': [], 'applications': []}
+    # An archived item purged later has two tombstones: one per move
+    markers = tombstones.filter(deleted_at__gt=cutoff).order_by().values_list('record_type', 'record_id').distinct()
+    for record_type, record_id in markers:
+        if record_type == 'complaint':
+            deleted['complaints'].append(f'C{record_id:03d}')
+        else:
+            deleted['applications'].append(f'A{record_id:03d}')
+    for queryset in departed:
+        kind = queryset.model._meta.model_name
+        for record_id in queryset.filter(updated_at__gt=cutoff).values_list('id', flat=True):
+            deleted[f'{kind}s'].append(f'{kind[0].upper()}{record_id:03d}')
+
+    return Changes(
+        complaints=changed(complaints, since),
+        applications=changed(applications, since),
+        notifications=changed(notifications, since),
+        deleted=deleted,
+    )
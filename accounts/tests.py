@@ -1,3 +1,926 @@
-from django.test import TestCase
+import json
+import re
+import shutil
+import tempfile
+import time
+from copy import deepcopy
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+from urllib.parse import quote
 
-# Create your tests here.
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import authenticate
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.signals import request_started
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connection, connections
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import http_date
+
+from . import cache as queue_cache
+from . import connections as db_connections
+from . import archive, counters, events, export, notifications, retention, routers, serializers, signals, sync
+from .models import (
+    Application, ArchivedComplaint, Complaint, CustomUser, Notification, NotificationJob, StatusCounter, Tombstone,
+)
+
+# A full-table read in EXPLAIN output
+SEQUENTIAL_SCAN = {
+    'sqlite': re.compile(r'\bSCAN (TABLE )?accounts_\w+\s*$', re.MULTILINE),
+    'postgresql': re.compile(r'Seq Scan on accounts_\w+'),
+}
+# SQLite walking a whole index, which only a LIMITed read in index order should do
+SQLITE_FULL_INDEX_SCAN = re.compile(r'\bSCAN (TABLE )?accounts_\w+ USING (COVERING )?INDEX')
+
+
+class QueryPlanTests(TestCase):
+    """Fail when a hot-path dashboard query falls back to a sequential scan"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = CustomUser.objects.create_user(
+            email='plan@example.com', college_id='PLAN001', password='plan-pass-123'
+        )
+
+    def hot_path_queries(self):
+        """Map query name to (queryset, whether an ordered full-index walk is acceptable)"""
+        page = slice(0, 51)
+        staff_queue = Complaint.objects.filter(department='staff').select_related('student')
+        provost_queue = Complaint.objects.select_related('student')
+        open_complaints = Complaint.objects.filter(department='dsw', status__in=['pending', 'in-progress'])
+        department_applications = Application.objects.filter(verified=True, department='dsw')
+        verification_queue = Application.objects.filter(verified=False)
+        pending_applications = Application.objects.filter(department='dsw', status='pending')
+        since = timezone.now()
+        return {
+            'staff complaint queue': (staff_queue.order_by('-created_at', '-id')[page], False),
+            'provost complaint queue': (provost_queue.order_by('-created_at', '-id')[page], True),
+            'open complaints by department': (open_complaints.order_by('-created_at'), False),
+            'student complaints': (Complaint.objects.filter(student=self.student), False),
+            'department application queue': (department_applications.order_by('-created_at', '-id')[page], False),
+            'provost verification queue': (verification_queue.order_by('-created_at', '-id')[page], True),
+            'pending applications by department': (pending_applications.order_by('-created_at'), False),
+            'student applications': (Application.objects.filter(student=self.student), False),
+            'student archived complaints': (ArchivedComplaint.objects.filter(student=self.student), False),
+            'unread notifications': (Notification.objects.filter(student=self.student, is_read=False)[:5], False),
+            'notification list': (
+                Notification.objects.filter(student=self.student).order_by('-created_at', '-id')[page], False),
+            'student complaint changes': (
+                Complaint.objects.filter(student=self.student, updated_at__gt=since), False),
+            'department complaint changes': (
+                Complaint.objects.filter(department='staff', updated_at__gt=since), False),
+            'verified application changes': (
+                Application.objects.filter(department='dsw', verified=True, updated_at__gt=since), False),
+            'verified-out application changes': (
+                Application.objects.filter(verified=True, updated_at__gt=since), False),
+            'notification changes': (
+                Notification.objects.filter(student=self.student, updated_at__gt=since), False),
+            'department tombstones': (
+                Tombstone.objects.filter(department='staff', deleted_at__gt=since), False),
+        }
+
+    def explain(self, queryset):
+        if connection.vendor == 'postgresql':
+            # Tiny test tables always look cheapest to seq-scan; make the planner show its index choice
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+        return queryset.explain()
+
+    def test_hot_paths_use_indexes(self):
+        pattern = SEQUENTIAL_SCAN.get(connection.vendor)
+        if pattern is None:
+            self.skipTest(f'No query-plan expectations for {connection.vendor}')
+
+        for name, (queryset, ordered_walk) in self.hot_path_queries().items():
+            with self.subTest(query=name):
+                plan = self.explain(queryset)
+                self.assertIsNone(
+                    pattern.search(plan),
+                    f'{name} fell back to a sequential scan:\n{plan}\n\n{queryset.query}'
+                )
+                if connection.vendor == 'sqlite' and not ordered_walk:
+                    self.assertIsNone(
+                        SQLITE_FULL_INDEX_SCAN.search(plan),
+                        f'{name} walks a whole index instead of searching it:\n{plan}\n\n{queryset.query}'
+                    )
+
+
+class ConnectionReuseTests(TransactionTestCase):
+    """
+    Persistent connections are reused across requests and replaced when they go bad.
+    In-memory SQLite connections are never closed, so with an in-memory test
+    database a throwaway SQLite file stands in for the connection under test.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.alias, cls.database_dir = DEFAULT_DB_ALIAS, None
+        if connection.vendor == 'sqlite' and connection.is_in_memory_db():
+            cls.alias, cls.database_dir = 'reuse', tempfile.mkdtemp()
+            connections.settings[cls.alias] = {
+                **deepcopy(connections.settings[DEFAULT_DB_ALIAS]),
+                'NAME': str(Path(cls.database_dir) / 'reuse.sqlite3'),
+            }
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls.database_dir:
+            connections[cls.alias].close()
+            del connections[cls.alias]
+            del connections.settings[cls.alias]
+            shutil.rmtree(cls.database_dir)
+        super().tearDownClass()
+
+    def setUp(self):
+        self.connection = connections[self.alias]
+        self.connection.close()
+        # The request signals only see the connection under test
+        patch = mock.patch.object(connections, 'all', return_value=[self.connection])
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def persistent(self, **options):
+        """Reconnect with CONN_MAX_AGE=None (and `options`), then start counting"""
+        patch = mock.patch.dict(self.connection.settings_dict, {'CONN_MAX_AGE': None, **options})
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.addCleanup(self.connection.close)
+        self.connection.ensure_connection()
+        db_connections.reset_stats()
+
+    def query(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+
+    def test_open_connection_is_reused(self):
+        self.persistent()
+        for _ in range(3):
+            request_started.send(sender=self.__class__)
+            self.query()
+        stats = db_connections.local_stats()
+        self.assertEqual((stats['requests'], stats['reused']), (3, 3))
+        self.assertNotIn('opened', stats)
+
+    def test_expired_connection_is_replaced(self):
+        self.persistent(CONN_MAX_AGE=0)
+        request_started.send(sender=self.__class__)
+        self.assertIsNone(self.connection.connection)
+        self.query()
+        self.assertEqual(db_connections.local_stats()['opened'], 1)
+
+    def test_dropped_connection_is_replaced(self):
+        self.persistent(CONN_HEALTH_CHECKS=True)
+        with mock.patch.object(self.connection, 'is_usable', return_value=False):
+            request_started.send(sender=self.__class__)
+        self.assertIsNone(self.connection.connection)
+        self.assertEqual(db_connections.local_stats()['health_check_failures'], 1)
+        self.query()
+        self.assertEqual(db_connections.local_stats()['opened'], 1)
+
+    def test_health_checks_are_opt_in(self):
+        self.persistent(CONN_HEALTH_CHECKS=False)
+        with mock.patch.object(self.connection, 'is_usable', return_value=False) as is_usable:
+            request_started.send(sender=self.__class__)
+        is_usable.assert_not_called()
+        self.assertIsNotNone(self.connection.connection)
+
+
+@override_settings(DATABASE_REPLICAS=['replica'], REPLICA_LAG_SECONDS=60, SECURE_SSL_REDIRECT=False)
+class ReplicaRouterTests(TransactionTestCase):
+    """
+    A throwaway SQLite file stands in for a replica that has not replicated
+    anything yet, so which database answered shows in the response.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Registered after the test case has locked down the configured aliases
+        cls.replica_dir = tempfile.mkdtemp()
+        connections.settings['replica'] = {
+            **deepcopy(connections.settings['default']),
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': str(Path(cls.replica_dir) / 'replica.sqlite3'),
+            'OPTIONS': {},
+        }
+        call_command('migrate', database='replica', verbosity=0)
+
+    @classmethod
+    def tearDownClass(cls):
+        connections['replica'].close()
+        del connections['replica']
+        del connections.settings['replica']
+        shutil.rmtree(cls.replica_dir)
+        super().tearDownClass()
+
+    def setUp(self):
+        cache.clear()
+        routers._down_until.clear()
+        self.student = CustomUser.objects.create_user(
+            email='replica@example.com', college_id='REPL001', password='replica-pass-123'
+        )
+        # The user row has replicated; their complaints have not
+        self.student.save(using='replica', force_insert=True)
+        Complaint.objects.create(
+            title='Fan broken', description='d', category='other', hall='aftab', student=self.student
+        )
+        self.client.force_login(self.student)
+        self.addCleanup(call_command, 'flush', database='replica', interactive=False, verbosity=0)
+
+    def my_complaints(self):
+        return len(self.client.get('/accounts/complaints/my/').json()['complaints'])
+
+    def test_reads_go_to_replica(self):
+        self.assertEqual(self.my_complaints(), 0)
+
+    def test_writer_is_pinned_to_primary(self):
+        response = self.client.post('/accounts/complaints/submit/', json.dumps({
+            'title': 'Leaking tap', 'description': 'd', 'category': 'other', 'hall': 'aftab', 'priority': 'low',
+        }), content_type='application/json')
+        self.assertTrue(response.json()['success'])
+        self.assertEqual(self.my_complaints(), 2)
+
+        cache.delete(routers.PIN_KEY.format(self.student.pk))
+        self.assertEqual(self.my_complaints(), 0)
+
+    def test_unreachable_replica_falls_back_to_primary(self):
+        with mock.patch.object(connections['replica'], 'ensure_connection', side_effect=OperationalError):
+            self.assertEqual(self.my_complaints(), 1)
+        # Skipped without another attempt until the retry interval passes
+        self.assertEqual(self.my_complaints(), 1)
+        routers._down_until.clear()
+        self.assertEqual(self.my_complaints(), 0)
+
+    def test_writes_always_go_to_primary(self):
+        replica_copy = Complaint.objects.using('default').get()
+        replica_copy.save(using='replica', force_insert=True)
+        complaint = Complaint.objects.using('replica').get()
+        complaint.title = 'Fan fixed'
+        complaint.save()
+        self.assertEqual(Complaint.objects.using('default').get().title, 'Fan fixed')
+        self.assertEqual(Complaint.objects.using('replica').get().title, 'Fan broken')
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class QueuePaginationTests(TestCase):
+    """Role scoping is part of the page query, so pages come back full"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = CustomUser.objects.create_user(
+            email='queue-staff@example.com', college_id='QSTAFF1', password='queue-pass-123', role='staff'
+        )
+        student = CustomUser.objects.create_user(
+            email='queue-student@example.com', college_id='QSTU001', password='queue-pass-123'
+        )
+        # Unverified applications interleaved with the ones the staff queue shows
+        for number in range(10):
+            Application.objects.create(
+                title=f'Application {number}', description='d', application_type='other',
+                department='staff', verified=number % 2 == 0, student=student
+            )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.staff)
+
+    def test_pages_are_full_and_scoped(self):
+        seen, cursor = [], ''
+        for expected in (2, 2, 1):
+            data = self.client.get('/accounts/applications/', {'limit': 2, 'cursor': cursor}).json()
+            self.assertEqual(len(data['applications']), expected)
+            self.assertTrue(all(application['verified'] for application in data['applications']))
+            seen += [application['id'] for application in data['applications']]
+            cursor = data['next_cursor']
+        self.assertIsNone(cursor)
+        self.assertEqual(len(set(seen)), 5)
+
+    # The manifest storage needs collectstatic output, which tests never build
+    @override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+    def test_dashboard_embeds_first_page(self):
+        response = self.client.get('/accounts/dashboard/staff/')
+        self.assertContains(response, 'id="dashboard-bootstrap"')
+        applications = response.context['bootstrap']['applications']['rows']
+        self.assertEqual(len(applications), 5)
+        self.assertTrue(all(application['verified'] for application in applications))
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class QueueCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = CustomUser.objects.create_user(
+            email='cache-staff@example.com', college_id='CACHE01', password='cache-pass-123', role='staff'
+        )
+        student = CustomUser.objects.create_user(
+            email='cache-student@example.com', college_id='CACHE02', password='cache-pass-123'
+        )
+        cls.complaint = Complaint.objects.create(title='Broken bulb', description='d', student=student)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.staff)
+
+    def test_repeat_request_is_a_hit(self):
+        first = self.client.get('/accounts/complaints/all/')
+        self.assertEqual(self.client.get('/accounts/complaints/all/').content, first.content)
+        self.assertEqual(queue_cache.stats(), {'hits': 1, 'misses': 1, 'hit_ratio': 0.5})
+
+    def test_save_and_delete_change_the_page_key(self):
+        keys = [queue_cache.page_key('complaints', self.staff, {})]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.complaint.title = 'Broken bulb in corridor'
+            self.complaint.save()
+        keys.append(queue_cache.page_key('complaints', self.staff, {}))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.complaint.delete()
+        keys.append(queue_cache.page_key('complaints', self.staff, {}))
+        self.assertEqual(len(set(keys)), 3)
+
+    def test_stats_command_reports_the_ratio(self):
+        page = queue_cache.page_key('complaints', self.staff, {})
+        queue_cache.set_page(page, b'{}')
+        for key in (page, 'missing', 'missing', 'missing'):
+            queue_cache.get_page(key)
+        out = StringIO()
+        call_command('queue_cache_stats', '--reset', stdout=out)
+        self.assertIn('hits=1 misses=3 hit_ratio=25.0%', out.getvalue())
+        self.assertEqual(queue_cache.stats()['hits'], 0)
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class CounterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.provost = CustomUser.objects.create_user(
+            email='count-provost@example.com', college_id='COUNT01', password='count-pass-123', role='provost'
+        )
+        cls.student = CustomUser.objects.create_user(
+            email='count-student@example.com', college_id='COUNT02', password='count-pass-123'
+        )
+
+    def setUp(self):
+        self.client.force_login(self.provost)
+
+    def complaint_stats(self):
+        stored = {
+            tuple(row[field] for field in counters.KEY_FIELDS): row['count']
+            for row in StatusCounter.objects.filter(count__gt=0).values(*counters.KEY_FIELDS, 'count')
+        }
+        self.assertEqual(stored, counters.actual_counts())
+        return self.client.get('/accounts/stats/').json()['complaints']
+
+    def post(self, url, data):
+        return self.client.post(url, json.dumps(data), content_type='application/json').json()
+
+    def test_counters_follow_create_transition_and_delete(self):
+        moved, deleted = [
+            Complaint.objects.create(title=title, description='d', student=self.student)
+            for title in ('Cracked window', 'Loose tile')
+        ]
+        self.assertEqual(self.complaint_stats()['by_status'], {'pending': 2})
+        self.post('/accounts/complaints/update-status/', {'complaint_id': f'C{moved.pk:03d}', 'status': 'in-progress'})
+        self.assertEqual(self.complaint_stats()['by_status'], {'pending': 1, 'in-progress': 1})
+        self.client.force_login(self.student)
+        self.assertTrue(self.post('/accounts/complaints/delete/', {'complaint_id': f'C{deleted.pk:03d}'})['success'])
+        self.client.force_login(self.provost)
+        self.assertEqual(self.complaint_stats()['by_status'], {'pending': 0, 'in-progress': 1})
+
+    def test_reconcile_repairs_drift(self):
+        Complaint.objects.create(title='Cracked window', description='d', student=self.student)
+        StatusCounter.objects.filter(record_type='complaint').update(count=42)
+        out = StringIO()
+        call_command('reconcile_counters', stdout=out)
+        self.assertIn('stored=42 actual=1', out.getvalue())
+        self.assertEqual(self.complaint_stats()['total'], 1)
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class SearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = CustomUser.objects.create_user(
+            email='search@example.com', college_id='FIND001', password='find-pass-123'
+        )
+        other = CustomUser.objects.create_user(
+            email='search-other@example.com', college_id='FIND002', password='find-pass-123'
+        )
+        cls.provost = CustomUser.objects.create_user(
+            email='search-provost@example.com', college_id='FIND003', password='find-pass-123', role='provost'
+        )
+        cls.in_title = Complaint.objects.create(title='Window latch broken', description='d', student=cls.student)
+        cls.in_description = Complaint.objects.create(
+            title='Cold room', description='The window leaks at night', student=cls.student
+        )
+        cls.other = Complaint.objects.create(title='Window cracked', description='d', student=other)
+
+    def search(self, **params):
+        return self.client.get('/accounts/search/', {'type': 'complaints', 'q': 'window', **params}).json()
+
+    def ids(self, data):
+        return [complaint['id'] for complaint in data['complaints']]
+
+    def test_students_only_find_their_own(self):
+        self.client.force_login(self.student)
+        self.assertEqual(
+            set(self.ids(self.search())), {f'C{self.in_title.pk:03d}', f'C{self.in_description.pk:03d}'}
+        )
+
+    def test_title_matches_rank_first(self):
+        if connection.vendor not in ('sqlite', 'postgresql'):
+            self.skipTest(f'No ranked search on {connection.vendor}')
+        self.client.force_login(self.student)
+        self.assertEqual(self.ids(self.search())[0], f'C{self.in_title.pk:03d}')
+
+    def test_cursor_continues_the_ranking(self):
+        self.client.force_login(self.provost)
+        expected = self.ids(self.search())
+        seen, cursor = [], ''
+        while cursor is not None:
+            data = self.search(limit=1, cursor=cursor)
+            seen += self.ids(data)
+            cursor = data['next_cursor']
+        self.assertEqual((seen, len(expected)), (expected, 3))
+
+    def test_restored_trigger_indexes_edits(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('Only SQLite search relies on triggers')
+        # As a migration that rebuilds the table would leave it
+        with connection.cursor() as cursor:
+            cursor.execute('DROP TRIGGER accounts_complaint_fts_update')
+        signals.restore_search_index(sender=apps.get_app_config('accounts'), using=DEFAULT_DB_ALIAS)
+        self.in_description.title = 'Draughty room'
+        self.in_description.save()
+        self.client.force_login(self.student)
+        self.assertEqual(self.ids(self.search(q='draughty')), [f'C{self.in_description.pk:03d}'])
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class DeltaSyncTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = CustomUser.objects.create_user(
+            email='sync-student@example.com', college_id='SYNC001', password='sync-pass-123'
+        )
+        cls.provost = CustomUser.objects.create_user(
+            email='sync-provost@example.com', college_id='SYNC002', password='sync-pass-123', role='provost'
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.token = sync.encode_token(timezone.now() - timedelta(minutes=1))
+
+    def changes(self, user):
+        self.client.force_login(user)
+        return self.client.get('/accounts/sync/', {'token': self.token}).json()
+
+    def test_students_get_their_list_shape(self):
+        Complaint.objects.create(
+            title='Fan broken', description='d', category='other', hall='aftab', student=self.student
+        )
+        complaint, = self.changes(self.student)['complaints']
+        self.assertNotIn('student_id', complaint)
+        self.assertEqual(complaint['title'], 'Fan broken')
+
+    def test_verified_application_leaves_provost_queue(self):
+        application = Application.objects.create(
+            title='Room change', description='d', application_type='room-change', department='dsw',
+            student=self.student
+        )
+        self.assertEqual(self.changes(self.provost)['applications'][0]['id'], f'A{application.pk:03d}')
+        application.verified = True
+        application.save()
+        data = self.changes(self.provost)
+        self.assertEqual(data['applications'], [])
+        self.assertEqual(data['deleted']['applications'], [f'A{application.pk:03d}'])
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class BulkUpdateTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.provost = CustomUser.objects.create_user(
+            email='bulk-provost@example.com', college_id='BULK001', password='bulk-pass-123', role='provost'
+        )
+        student = CustomUser.objects.create_user(
+            email='bulk-student@example.com', college_id='BULK002', password='bulk-pass-123'
+        )
+        halls = [hall for hall, _ in Complaint.HALL_CHOICES]
+        categories = [category for category, _ in Complaint.CATEGORY_CHOICES]
+        cls.complaints = [
+            Complaint.objects.create(
+                title=f'Complaint {number}', description='d', student=student,
+                hall=halls[number % len(halls)], category=categories[number % len(categories)]
+            )
+            for number in range(12)
+        ]
+        cls.application = Application.objects.create(
+            title='Room change', description='d', application_type='room-change', department='dsw', student=student
+        )
+
+    def setUp(self):
+        self.client.force_login(self.provost)
+
+    def post(self, url, data):
+        return self.client.post(url, json.dumps(data), content_type='application/json').json()
+
+    def bulk_update(self, complaints, status):
+        ids = [f'C{complaint.pk:03d}' for complaint in complaints]
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+            data = self.post('/accounts/complaints/bulk-update-status/', {'complaint_ids': ids, 'status': status})
+        self.assertEqual(data['updated'], len(ids))
+        return len(queries)
+
+    def test_query_count_does_not_grow_with_counter_keys(self):
+        # Two items' counter keys against ten, each batch creating its new ones
+        self.assertEqual(
+            self.bulk_update(self.complaints[:2], 'in-progress'),
+            self.bulk_update(self.complaints[2:], 'in-progress'),
+        )
+        by_status = counters.summarize(StatusCounter.objects.filter(record_type='complaint'))['by_status']
+        self.assertEqual(by_status, {'pending': 0, 'in-progress': 12})
+
+    def test_malformed_bodies_are_rejected(self):
+        for body in ([], {'complaint_ids': [[1]]}, {'complaint_ids': [{'a': 1}]}, {'complaint_ids': [True]}):
+            with self.subTest(body=body):
+                response = self.client.post(
+                    '/accounts/complaints/bulk-update-status/', json.dumps(body), content_type='application/json'
+                )
+                self.assertEqual(response.status_code, 400)
+                self.assertFalse(response.json()['success'])
+
+    def test_bulk_verify_reports_already_verified(self):
+        ids = [f'A{self.application.pk:03d}']
+        self.assertTrue(self.post('/accounts/applications/bulk-verify/', {'application_ids': ids})['success'])
+        result, = self.post('/accounts/applications/bulk-verify/', {'application_ids': ids})['results']
+        self.assertEqual(result['message'], 'Application is already verified.')
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class TransitionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = CustomUser.objects.create_user(
+            email='move-staff@example.com', college_id='MOVE001', password='move-pass-123', role='staff'
+        )
+        student = CustomUser.objects.create_user(
+            email='move-student@example.com', college_id='MOVE002', password='move-pass-123'
+        )
+        cls.complaint = Complaint.objects.create(title='Leaking tap', description='d', student=student)
+
+    def setUp(self):
+        self.client.force_login(self.staff)
+
+    def post(self, url, data):
+        return self.client.post(url, json.dumps(data), content_type='application/json').json()
+
+    def update_status(self, status, version=None):
+        data = {'complaint_id': f'C{self.complaint.pk:03d}', 'status': status}
+        if version is not None:
+            data['version'] = version
+        return self.client.post('/accounts/complaints/update-status/', json.dumps(data), content_type='application/json')
+
+    def test_writes_are_not_limited_to_the_listed_queue(self):
+        provost = CustomUser.objects.create_user(
+            email='move-provost@example.com', college_id='MOVE003', password='move-pass-123', role='provost'
+        )
+        dsw = CustomUser.objects.create_user(
+            email='move-dsw@example.com', college_id='MOVE004', password='move-pass-123', role='dsw'
+        )
+        application = Application.objects.create(
+            title='Hostel seat', description='d', application_type='other', department='dsw',
+            student=self.complaint.student
+        )
+        application_id = f'A{application.pk:03d}'
+        self.client.force_login(provost)
+        self.assertTrue(self.post('/accounts/applications/verify/', {'application_id': application_id})['success'])
+        # Verified applications leave the provost's queue but can still be updated
+        data = self.post(
+            '/accounts/applications/update-status/', {'application_id': application_id, 'status': 'approved'}
+        )
+        self.assertTrue(data['success'], data)
+        # A staff-department complaint, outside the DSW queue
+        self.client.force_login(dsw)
+        complaint_id = f'C{self.complaint.pk:03d}'
+        data = self.post('/accounts/complaints/update-status/', {'complaint_id': complaint_id, 'status': 'in-progress'})
+        self.assertTrue(data['success'], data)
+
+    def test_stale_version_conflicts(self):
+        self.assertEqual(self.update_status('in-progress', version=1).json()['version'], 2)
+        response = self.update_status('resolved', version=1)
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual((response.json()['status'], response.json()['version']), ('in-progress', 2))
+        self.complaint.refresh_from_db()
+        self.assertEqual((self.complaint.status, self.complaint.version), ('in-progress', 2))
+
+    def test_illegal_transition_is_rejected(self):
+        self.assertEqual(self.update_status('bogus').status_code, 400)
+        self.complaint.refresh_from_db()
+        self.assertEqual((self.complaint.status, self.complaint.version), ('pending', 1))
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class RetentionTests(TestCase):
+    """Purging and archiving leave a tombstone for every row that leaves the hot table"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = student = CustomUser.objects.create_user(
+            email='purge@example.com', college_id='PURGE01', password='purge-pass-123'
+        )
+        cls.complaints = [
+            Complaint.objects.create(title=f'Old {number}', description='d', status='resolved', student=student)
+            for number in range(3)
+        ]
+        Complaint.objects.create(title='Being fixed', description='d', status='in-progress', student=student)
+        Complaint.objects.update(updated_at=timezone.now() - timedelta(days=30))
+        counters.reconcile()
+
+    def assertTombstones(self, complaints):
+        self.assertEqual(
+            set(Tombstone.objects.filter(record_type='complaint').values_list('record_id', flat=True)),
+            {complaint.pk for complaint in complaints},
+        )
+
+    def test_purge_batch(self):
+        run = retention.start_run()
+        self.assertEqual(retention.purge_batch(Complaint, run, 0, 2), (2, self.complaints[1].pk))
+        self.assertEqual(retention.purge_batch(Complaint, run, self.complaints[1].pk, 2), (1, self.complaints[2].pk))
+        self.assertEqual(retention.purge_batch(Complaint, run, self.complaints[2].pk, 2), (0, None))
+        self.assertEqual(list(Complaint.objects.values_list('status', flat=True)), ['in-progress'])
+        self.assertTombstones(self.complaints)
+        by_status = counters.summarize(StatusCounter.objects.filter(record_type='complaint'))['by_status']
+        self.assertEqual(by_status, {'resolved': 0, 'in-progress': 1})
+
+    def test_archive_batch(self):
+        moved, _ = archive.archive_batch(Complaint, archive.cutoff(), 0, 100)
+        self.assertEqual(moved, 3)
+        self.assertEqual(
+            set(ArchivedComplaint.objects.values_list('id', flat=True)), {complaint.pk for complaint in self.complaints}
+        )
+        self.assertEqual(Complaint.objects.count(), 1)
+        self.assertTombstones(self.complaints)
+
+    def test_students_keep_archived_items_until_purged(self):
+        self.client.force_login(self.student)
+        token = sync.new_token()
+        archive.archive_batch(Complaint, archive.cutoff(), 0, 100)
+        self.assertEqual(len(self.client.get('/accounts/complaints/my/').json()['complaints']), 4)
+        self.assertEqual(len(self.client.get('/accounts/bootstrap/').json()['complaints']), 4)
+        self.assertEqual(self.client.get('/accounts/sync/', {'token': token}).json()['deleted']['complaints'], [])
+
+        retention.purge_batch(ArchivedComplaint, retention.start_run(), 0, 100)
+        self.assertEqual(len(self.client.get('/accounts/complaints/my/').json()['complaints']), 1)
+        deleted = self.client.get('/accounts/sync/', {'token': token}).json()['deleted']['complaints']
+        self.assertEqual(sorted(deleted), sorted(f'C{complaint.pk:03d}' for complaint in self.complaints))
+
+
+class NotificationWorkerTests(TestCase):
+    def test_failed_batch_is_retried_on_a_fresh_connection(self):
+        with mock.patch.object(notifications, 'drain_batch', side_effect=[OperationalError('gone'), (0, 0)]), \
+                mock.patch.object(notifications, 'close_old_connections') as close_old, \
+                mock.patch.object(notifications.time, 'sleep', side_effect=[None, KeyboardInterrupt]):
+            with self.assertRaises(KeyboardInterrupt):
+                notifications.run_worker(poll=0)
+        self.assertEqual(close_old.call_count, 2)
+
+    def test_changes_to_one_item_coalesce(self):
+        student = CustomUser.objects.create_user(
+            email='worker@example.com', college_id='WORK001', password='work-pass-123'
+        )
+        complaint = Complaint.objects.create(title='Broken door', description='d', student=student)
+        NotificationJob.objects.all().delete()
+        row = Complaint.objects.filter(pk=complaint.pk).values()[0]
+        for status in ('in-progress', 'resolved'):
+            notifications.enqueue(Complaint, [dict(row, status=status)])
+        self.assertEqual(notifications.drain_batch(), (2, 1))
+        notification, = Notification.objects.filter(student=student)
+        self.assertIn('has been resolved', notification.message)
+        self.assertEqual(notifications.unread_count(student), 1)
+        self.assertFalse(NotificationJob.objects.exists())
+
+
+class ExportTests(TestCase):
+    def test_rows_are_read_in_keyset_chunks(self):
+        student = CustomUser.objects.create_user(
+            email='export@example.com', college_id='EXPO001', password='export-pass-123'
+        )
+        complaints = [
+            Complaint.objects.create(title=f'Complaint {number}', description='d', student=student)
+            for number in range(5)
+        ]
+        # Ties on created_at are broken by id
+        Complaint.objects.filter(pk__in=[complaint.pk for complaint in complaints[1:3]]).update(
+            created_at=complaints[1].created_at
+        )
+        rows = Complaint.objects.values(*serializers.COMPLAINT_FIELDS)
+        with mock.patch.object(export, 'CHUNK_ROWS', 2), self.assertNumQueries(3):
+            exported = list(export.export_rows([rows], serializers.complaint))
+        self.assertEqual([row['title'] for row in exported], [f'Complaint {number}' for number in range(5)])
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class NotificationApiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = CustomUser.objects.create_user(
+            email='inbox@example.com', college_id='INBOX01', password='inbox-pass-123'
+        )
+        cls.notifications = [
+            Notification.objects.create(title=f'Update {number}', message='m', student=cls.student)
+            for number in range(3)
+        ]
+
+    def setUp(self):
+        self.client.force_login(self.student)
+
+    def mark_read(self, data):
+        return self.client.post(
+            '/accounts/notifications/mark-read/', json.dumps(data), content_type='application/json'
+        ).json()
+
+    def assertBadge(self, expected):
+        actual = Notification.objects.filter(student=self.student, is_read=False).count()
+        self.assertEqual((notifications.unread_count(self.student), actual), (expected, expected))
+
+    def test_list_pages_and_reports_unread(self):
+        first = self.client.get('/accounts/notifications/', {'limit': 2}).json()
+        second = self.client.get('/accounts/notifications/', {'limit': 2, 'cursor': first['next_cursor']}).json()
+        titles = [notification['title'] for notification in first['notifications'] + second['notifications']]
+        self.assertEqual(titles, ['Update 2', 'Update 1', 'Update 0'])
+        self.assertEqual(first['unread_count'], 3)
+
+    def test_marking_read_updates_the_counter(self):
+        data = self.mark_read({'notification_ids': [self.notifications[0].pk]})
+        self.assertEqual((data['marked'], data['unread_count']), (1, 2))
+        self.assertBadge(2)
+        data = self.mark_read({})
+        self.assertEqual((data['marked'], data['unread_count']), (2, 0))
+        self.assertBadge(0)
+        self.assertEqual(self.mark_read({})['marked'], 0)
+
+
+@override_settings(PBKDF2_ITERATIONS=1000)
+class LoginBackendTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = CustomUser.objects.create_user(
+            email='login@example.com', college_id='LOGIN01', password='login-pass-123'
+        )
+
+    def test_email_or_college_id_in_one_query(self):
+        for username in ('login@example.com', 'LOGIN01'):
+            with self.subTest(username=username), self.assertNumQueries(1):
+                self.assertEqual(authenticate(username=username, password='login-pass-123'), self.student)
+        self.assertIsNone(authenticate(username='LOGIN01', password='wrong-pass'))
+
+    def test_unknown_user_still_hashes(self):
+        with mock.patch.object(CustomUser, 'set_password', autospec=True) as set_password:
+            self.assertIsNone(authenticate(username='nobody@example.com', password='login-pass-123'))
+        set_password.assert_called_once_with(mock.ANY, 'login-pass-123')
+
+    def test_outdated_hash_is_replaced_on_login(self):
+        for settings_change, prefix in (
+            ({'PBKDF2_ITERATIONS': 2000}, 'pbkdf2_sha256$2000$'),
+            ({'PASSWORD_HASHERS': ['django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+                                   'accounts.hashers.PBKDF2PasswordHasher']}, 'pbkdf2_sha1$'),
+        ):
+            with self.subTest(change=settings_change), self.settings(**settings_change):
+                self.assertIsNotNone(authenticate(username='LOGIN01', password='login-pass-123'))
+                self.student.refresh_from_db()
+                self.assertTrue(self.student.password.startswith(prefix), self.student.password)
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class ApiAuthTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = CustomUser.objects.create_user(
+            email='bearer@example.com', college_id='BEAR001', password='bearer-pass-123'
+        )
+        Complaint.objects.create(title='Noisy fan', description='d', student=cls.student)
+
+    def test_bearer_request_reads_no_session_or_user(self):
+        tokens = self.client.post(
+            '/api/token/', json.dumps({'email': 'bearer@example.com', 'password': 'bearer-pass-123'}),
+            content_type='application/json',
+        ).json()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/complaints/my/', HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        self.assertEqual(len(response.json()['complaints']), 1)
+        tables = [query['sql'].split('WHERE')[0] for query in queries.captured_queries]
+        self.assertFalse([sql for sql in tables if 'django_session' in sql or 'accounts_customuser' in sql])
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class SessionRefreshTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = CustomUser.objects.create_user(
+            email='session@example.com', college_id='SESS001', password='session-pass-123'
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.student)
+
+    def session_writes(self, when):
+        with mock.patch('accounts.sessions.time.time', return_value=when), \
+                CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get('/accounts/complaints/my/').status_code, 200)
+        return [query for query in queries.captured_queries
+                if 'django_session' in query['sql'] and not query['sql'].startswith('SELECT')]
+
+    def test_session_is_saved_only_near_expiry(self):
+        self.assertEqual(self.session_writes(time.time()), [])
+        self.assertEqual(self.session_writes(time.time() + 60), [])
+        # Past the refresh window: one write pushes the expiry forward
+        self.assertEqual(len(self.session_writes(time.time() + settings.SESSION_COOKIE_AGE * 0.6)), 1)
+
+
+class EventChannelTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = CustomUser.objects.create_user(
+            email='events@example.com', college_id='EVNT001', password='events-pass-123'
+        )
+
+    def channels(self, department, verified):
+        application = Application.objects.create(
+            title='Lab access', description='d', application_type='other', department=department,
+            verified=verified, student=self.student
+        )
+        return {channel for channel, _ in events._messages(application, 'updated')}
+
+    def test_verified_only_queues_wait_for_verification(self):
+        base = {f'user:{self.student.pk}', events.ALL_DEPARTMENTS_QUEUE}
+        self.assertEqual(self.channels('staff', verified=False), base)
+        self.assertEqual(self.channels('staff', verified=True), base | {'queue:staff'})
+        self.assertEqual(self.channels('dsw', verified=False), base | {'queue:dsw'})
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class AsgiTests(TestCase):
+    def test_anonymous_deep_link_returns_after_login(self):
+        for path in ['/accounts/complaints/my/', '/accounts/complaints/7/', '/accounts/dashboard/student/']:
+            with self.subTest(path=path):
+                response = self.client.get(path, {'tab': 'open'})
+                self.assertRedirects(
+                    response, f'/accounts/login/?next={quote(path)}%3Ftab%3Dopen', fetch_redirect_response=False
+                )
+
+    def test_exports_are_streamed_under_every_mount(self):
+        from cFix import asgi
+
+        for path in ['/accounts/export/complaints/', '/api/export/applications/']:
+            self.assertTrue(asgi._streams_from_database(path), path)
+        for path in ['/accounts/complaints/my/', '/api/complaints/', '/no/such/page/']:
+            self.assertFalse(asgi._streams_from_database(path), path)
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class ConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = CustomUser.objects.create_user(
+            email='etag@example.com', college_id='ETAG001', password='etag-pass-123'
+        )
+        cls.complaint = Complaint.objects.create(
+            title='Fan broken', description='d', status='resolved', student=cls.student
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.student)
+
+    def test_unchanged_list_is_not_modified(self):
+        response = self.client.get('/accounts/complaints/my/')
+        self.assertNotIn('Last-Modified', response)
+        again = self.client.get('/accounts/complaints/my/', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual((again.status_code, again.content), (304, b''))
+        # A date alone never revalidates a list
+        later = http_date(time.time() + 60)
+        self.assertEqual(self.client.get('/accounts/complaints/my/', HTTP_IF_MODIFIED_SINCE=later).status_code, 200)
+
+    def test_archiving_changes_the_list_etag(self):
+        etag = self.client.get('/accounts/complaints/my/')['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(archive.archive_batch(Complaint, timezone.now() + timedelta(days=1), 0, 100)[0], 1)
+        response = self.client.get('/accounts/complaints/my/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        # Students keep their archived items
+        self.assertEqual([complaint['title'] for complaint in response.json()['complaints']], ['Fan broken'])
+
+    def test_unchanged_detail_is_not_modified(self):
+        url = f'/accounts/complaints/{self.complaint.pk}/'
+        response = self.client.get(url)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified']).status_code, 304)
+        Complaint.objects.filter(pk=self.complaint.pk).update(title='Fan fixed')
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 200)
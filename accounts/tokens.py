@@ -0,0 +1,71 @@
+from django.http import JsonResponse
+from django.utils.functional import cached_property
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTTokenUserAuthentication
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.views import TokenObtainPairView
+
+API_PREFIX = '/api/'
+
+
+class ClaimsUser(TokenUser):
+    """Request user rebuilt from an access token's claims, without loading the user row"""
+
+    @cached_property
+    def role(self):
+        return self.token.get('role', '')
+
+    @cached_property
+    def college_id(self):
+        return self.token.get('college_id', '')
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Adds the fields the views read from request.user to the token pair"""
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token['role'] = user.role
+        token['college_id'] = user.college_id
+        token['is_staff'] = user.is_staff
+        token['is_superuser'] = user.is_superuser
+        return token
+
+
+class ClaimsTokenObtainPairView(TokenObtainPairView):
+    serializer_class = ClaimsTokenObtainPairSerializer
+
+
+class ClaimsAuthentication(JWTTokenUserAuthentication):
+    def get_user(self, validated_token):
+        if 'role' not in validated_token:
+            raise AuthenticationFailed('Token has no role claim.')
+        return ClaimsUser(validated_token)
+
+
+class JWTAuthenticationMiddleware:
+    """
+    Authenticate /api/ requests that carry an `Authorization: Bearer` access
+    token from its claims alone, so they touch neither the session nor the
+    user table. Requests without the header keep the session user.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.authentication = ClaimsAuthentication()
+
+    def __call__(self, request):
+        if request.path.startswith(API_PREFIX) and request.META.get('HTTP_AUTHORIZATION', '').startswith('Bearer '):
+            try:
+                user, _ = self.authentication.authenticate(request)
+            except AuthenticationFailed:
+                return JsonResponse({
+                    'success': False,
+                    'message': 'Invalid or expired token.'
+                }, status=401)
+            request.user = user
+            # A bearer token is never sent implicitly by a browser, so there is nothing for CSRF to protect
+            request._dont_enforce_csrf_checks = True
+        return self.get_response(request)
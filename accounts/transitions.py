@@ -0,0 +1,85 @@
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .cache import bump_queue_version
+from .counters import counter_key, move
+from .events import publish_change
+from .notifications import enqueue
+
+
+class InvalidTransition(ValueError):
+    """Raised when the workflow does not allow the requested change."""
+
+
+class TransitionConflict(Exception):
+    """Raised when the row changed after the client read it; carries the current row."""
+
+    def __init__(self, current):
+        super().__init__('This item was changed by someone else.')
+        self.current = current
+
+
+def _current(scope, pk):
+    return scope.filter(pk=pk).values().get()
+
+
+def _check_version(row, version):
+    if version is not None and version != row['version']:
+        raise TransitionConflict(row)
+
+
+def _conditional_update(scope, row, **changes):
+    """
+    Write only the changed columns, and only if status and version are still what
+    we read; a concurrent writer makes this match zero rows instead of being clobbered.
+    """
+    model = scope.model
+    old_key = counter_key(model, row)
+    with transaction.atomic():
+        updated = scope.filter(pk=row['id'], status=row['status'], version=row['version']).update(
+            version=F('version') + 1, updated_at=timezone.now(), **changes
+        )
+        if not updated:
+            raise TransitionConflict(_current(scope, row['id']))
+
+        row.update(changes, version=row['version'] + 1)
+        move(old_key, counter_key(model, row))
+        # Only queued here; the notification worker writes the student's notification
+        enqueue(model, [row], change='verified' if 'verified' in changes else 'status')
+
+    # update() skips post_save, so invalidate and announce here
+    department = row['department']
+    transaction.on_commit(lambda: bump_queue_version(department))
+    publish_change(model(**row), 'updated')
+    return row
+
+
+def transition_error(model, current_status, new_status):
+    """Why `model` cannot move from `current_status` to `new_status`, or None if it can"""
+    if new_status not in model.TRANSITIONS.get(current_status, []):
+        return f'Cannot change status from {current_status} to {new_status}.'
+    return None
+
+
+def transition(scope, pk, new_status, version=None):
+    """
+    Move one row in `scope` to `new_status` if the model's TRANSITIONS allow it.
+    `version` is the one the client last saw; without it the current row is used.
+    Returns the updated row values.
+    """
+    row = _current(scope, pk)
+    _check_version(row, version)
+    error = transition_error(scope.model, row['status'], new_status)
+    if error:
+        raise InvalidTransition(error)
+    return _conditional_update(scope, row, status=new_status)
+
+
+def verify(scope, pk, version=None):
+    """Mark one application in `scope` verified, under the same concurrency check"""
+    row = _current(scope, pk)
+    _check_version(row, version)
+    if row['verified']:
+        raise InvalidTransition('Application is already verified.')
+    return _conditional_update(scope, row, verified=True)
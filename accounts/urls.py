@@ -19,6 +19,7 @@ urlpatterns = [
     path('complaints/delete/', views.delete_complaint, name='delete_complaint'),
     path('complaints/all/', views.all_complaints, name='all_complaints'),
     path('complaints/update-status/', views.update_complaint_status, name='update_complaint_status'),
+    path('complaints/bulk-update-status/', views.bulk_update_complaint_status, name='bulk_update_complaint_status'),
     path('complaints/<int:complaint_id>/', views.complaint_details, name='complaint_details'),
 
     # Application system URLs
@@ -28,8 +29,24 @@ urlpatterns = [
     # path('applications/all/', views.all_applications, name='all_applications'),
     path('applications/update-status/', views.update_application_status, name='update_application_status'),
     path('applications/verify/', views.verify_application, name='verify_application'),
+    path('applications/bulk-update-status/', views.bulk_update_application_status, name='bulk_update_application_status'),
+    path('applications/bulk-verify/', views.bulk_verify_applications, name='bulk_verify_applications'),
     path('applications/<str:application_id>/', views.application_details, name='application_details'),
 
+    # Delta sync for dashboard polling
+    path('sync/', views.sync_changes, name='sync_changes'),
+    # Student notifications: keyset list and mark read (all when no IDs are sent)
+    path('notifications/', views.notification_list, name='notification_list'),
+    path('notifications/mark-read/', views.mark_notifications_read, name='mark_notifications_read'),
+    # Dashboard header totals
+    path('stats/', views.queue_stats, name='queue_stats'),
+    # Everything a dashboard shows on first paint, for refreshes
+    path('bootstrap/', views.bootstrap, name='bootstrap'),
+    # Streaming CSV/NDJSON dumps (?format=csv|ndjson plus the queue filters)
+    path('export/<str:kind>/', views.export_items, name='export_items'),
+    # Ranked full-text search (?type=complaints|applications&q=...)
+    path('search/', views.search_items, name='search_items'),
+
     # API endpoints
     path('complaints/', views.api_all_complaints, name='api_complaints'),
     path('complaints/<str:complaint_id>/', views.complaint_details, name='api_complaint_details'),
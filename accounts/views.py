@@ -1,19 +1,38 @@
 
 
+from asgiref.sync import sync_to_async
 from django.shortcuts import render, redirect
 from django.contrib.auth import authenticate, login, logout
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.utils import timezone
 from datetime import timedelta
-from django.http import JsonResponse
-from django.views.decorators.csrf import csrf_exempt
-from django.views.decorators.http import require_POST
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.db.models import F, IntegerField, Value
 import json
 import random
+from collections import Counter
 from .forms import CustomUserCreationForm, CustomAuthenticationForm, ComplaintForm, ApplicationForm
-from .decorators import role_required, verified_applications_only
-from .models import Complaint, Application, Notification
+from . import cache as queue_cache
+from .bootstrap import dashboard_data
+from . import conditional
+from . import export
+from .counters import adjust, counter_key, summarize
+from . import visibility
+from .decorators import csrf_exempt, require_POST, role_required
+from .events import publish_change, publish_changes
+from .models import ArchivedApplication, ArchivedComplaint, Complaint, Application, CustomUser, Tombstone
+from .notifications import enqueue, mark_read, unread_count
+from .pagination import (
+    APPLICATION_FILTERS, COMPLAINT_FILTERS, InvalidQuery, apply_filters, paginate,
+)
+from .routers import replica_reads
+from . import serializers
+from .search import paginate_ranked, search
+from .sync import InvalidSyncToken, changed, changes_since, decode_token, new_token
+from .transitions import InvalidTransition, TransitionConflict, transition, transition_error, verify
 
 def register_view(request):
     if request.method == 'POST':
@@ -36,8 +55,7 @@ def register_view(request):
 
 def login_view(request):
     if request.method == 'POST':
-        request.session.flush()
-
+        # login() rotates the session key, so there is nothing to flush first
         form = CustomAuthenticationForm(request, data=request.POST)
         if form.is_valid():
             user = form.get_user()
@@ -61,7 +79,9 @@ def login_view(request):
         else:
             pass  # Let the form handle the error message
     else:
-        request.session.flush()
+        # Opening the login page ends a signed-in session; anonymous visits touch no session at all
+        if request.user.is_authenticated:
+            logout(request)
         form = CustomAuthenticationForm()
     return render(request, 'accounts/login.html', {'form': form})
 
@@ -77,27 +97,23 @@ def logout_view(request):
 @login_required
 @role_required(['student'])
 def student_dashboard(request):
-    notifications = request.user.notifications.filter(is_read=False)[:5]  # Get latest 5 unread notifications
-    context = {
-        'notifications': notifications,
-        'unread_count': request.user.notifications.filter(is_read=False).count(),
-    }
-    return render(request, 'dashboard/student.html', context)
+    # Lists and badge are embedded with json_script, so the page needs no follow-up fetches
+    return render(request, 'dashboard/student.html', {'bootstrap': dashboard_data(request.user)})
 
 @login_required
 @role_required(['staff'])
 def staff_dashboard(request):
-    return render(request, 'dashboard/staff.html')
+    return render(request, 'dashboard/staff.html', {'bootstrap': dashboard_data(request.user)})
 
 @login_required
 @role_required(['provost'])
 def provost_dashboard(request):
-    return render(request, 'dashboard/provost.html')
+    return render(request, 'dashboard/provost.html', {'bootstrap': dashboard_data(request.user)})
 
 @login_required
 @role_required(['dsw'])
 def dsw_dashboard(request):
-    return render(request, 'dashboard/dsw.html')
+    return render(request, 'dashboard/dsw.html', {'bootstrap': dashboard_data(request.user)})
 
 @login_required
 @role_required(['exam_controller'])
@@ -105,19 +121,33 @@ def exam_dashboard(request):
     return render(request, 'dashboard/exam.html')
 
 
-@login_required
+def _create(item):
+    """Save a new submission, committing the row and its dashboard counter together, and announce it"""
+    with transaction.atomic():
+        item.save()
+    publish_change(item, 'created')
+
+
+# The list, details and submit views are async: under ASGI a slow query holds a
+# thread, not the worker. Django 3.2 has no async ORM, so queries go through
+# sync_to_async, which runs them in the request's own database thread.
+
+# Evaluate a queryset off the event loop
+_fetch = sync_to_async(list)
+
+
 @role_required(['student'])
 @csrf_exempt
 @require_POST
-def submit_complaint(request):
+async def submit_complaint(request):
     """Handle AJAX complaint submission"""
     try:
         data = json.loads(request.body)
         form = ComplaintForm(data)
-        if form.is_valid():
+        if await sync_to_async(form.is_valid)():
             complaint = form.save(commit=False)
-            complaint.student = request.user
-            complaint.save()
+            complaint.student_id = request.user.pk
+            await sync_to_async(_create)(complaint)
 
             return JsonResponse({
                 'success': True,
@@ -136,19 +166,18 @@ def submit_complaint(request):
         })
 
 
-@login_required
 @role_required(['student'])
 @csrf_exempt
 @require_POST
-def submit_application(request):
+async def submit_application(request):
     """Handle AJAX application submission"""
     try:
         data = json.loads(request.body)
         form = ApplicationForm(data)
-        if form.is_valid():
+        if await sync_to_async(form.is_valid)():
             application = form.save(commit=False)
-            application.student = request.user
-            application.save()
+            application.student_id = request.user.pk
+            await sync_to_async(_create)(application)
 
             return JsonResponse({
                 'success': True,
@@ -167,174 +196,254 @@ def submit_application(request):
         })
 
 
-@login_required
 @role_required(['student'])
-def my_complaints(request):
+@replica_reads
+async def my_complaints(request):
     """Return JSON data for student's complaints"""
-    complaints = Complaint.objects.filter(student=request.user).values(
-        'id', 'title', 'description', 'category', 'hall', 'priority',
-        'status', 'created_at', 'updated_at'
+    sync_token = new_token()
+    complaints = visibility.complaint_queue(request.user)
+    archived = visibility.complaint_queue(request.user, archived=True)
+    validators = await sync_to_async(conditional.list_validators)(
+        [complaints, archived], visibility.tombstone_queue(request.user).filter(record_type='complaint'),
+        'complaints', request.user.pk
     )
+    response = conditional.not_modified(request, validators)
+    if response is not None:
+        return response
 
-    # Format data for frontend
-    complaints_data = []
-    for complaint in complaints:
-        complaints_data.append({
-            'id': f'C{complaint["id"]:03d}',  # Format as C001, C002, etc.
-            'title': complaint['title'],
-            'description': complaint['description'],
-            'category': complaint['category'].replace('-', ' ').title(),
-            'hall': complaint['hall'].replace('-', ' ').title(),
-            'priority': complaint['priority'].title(),
-            'status': complaint['status'],
-            'date': complaint['created_at'].strftime('%Y-%m-%d'),
-            'updated_at': complaint['updated_at'].strftime('%Y-%m-%d %H:%M:%S')
-        })
-
-    return JsonResponse({
+    complaints = await _fetch(visibility.with_archive(complaints, archived, serializers.STUDENT_COMPLAINT_FIELDS))
+    return conditional.set_validators(serializers.json_response({
         'success': True,
-        'complaints': complaints_data
-    })
+        'complaints': [serializers.student_complaint(complaint) for complaint in complaints],
+        'sync_token': sync_token
+    }), validators)
 
 
-@login_required
 @role_required(['student'])
-def my_applications(request):
+@replica_reads
+async def my_applications(request):
     """Return JSON data for student's applications"""
-    applications = Application.objects.filter(student=request.user).values(
-        'id', 'title', 'description', 'application_type', 'department',
-        'status', 'created_at', 'updated_at'
+    sync_token = new_token()
+    applications = visibility.application_queue(request.user)
+    archived = visibility.application_queue(request.user, archived=True)
+    validators = await sync_to_async(conditional.list_validators)(
+        [applications, archived], visibility.tombstone_queue(request.user).filter(record_type='application'),
+        'applications', request.user.pk
     )
+    response = conditional.not_modified(request, validators)
+    if response is not None:
+        return response
 
-    # Format data for frontend
-    applications_data = []
-    for application in applications:
-        applications_data.append({
-            'id': f'A{application["id"]:03d}',  # Format as A001, A002, etc.
-            'title': application['title'],
-            'description': application['description'],
-            'category': application['application_type'].replace('-', ' ').title(),
-            'department': application['department'].replace('-', ' ').title(),
-            'status': application['status'],
-            'date': application['created_at'].strftime('%Y-%m-%d'),
-            'updated_at': application['updated_at'].strftime('%Y-%m-%d %H:%M:%S')
-        })
-
-    return JsonResponse({
+    applications = await _fetch(
+        visibility.with_archive(applications, archived, serializers.STUDENT_APPLICATION_FIELDS)
+    )
+    return conditional.set_validators(serializers.json_response({
         'success': True,
-        'applications': applications_data
-    })
+        'applications': [serializers.student_application(application) for application in applications],
+        'sync_token': sync_token
+    }), validators)
+
+
+async def _queue_page(request, kind, page_response):
+    """
+    Serve a queue page with an ETag taken from its cache key, which changes
+    whenever the queue version is bumped: a 304, else the cached page, else
+    `await page_response()`, which is then cached.
+    """
+    cache_key = await sync_to_async(queue_cache.page_key)(kind, request.user, request.GET)
+    validators = None
+    if queue_cache.settled(cache_key):
+        # ETag only, like the other lists (see conditional.list_validators)
+        validators = conditional.validators(cache_key)
+        response = conditional.not_modified(request, validators)
+        if response is not None:
+            return response
+
+    # Every user with the same role sees the same page; serve it from cache
+    cached = await sync_to_async(queue_cache.get_page)(cache_key)
+    if cached is not None:
+        response = HttpResponse(cached, content_type='application/json')
+    else:
+        response = await page_response()
+        if response.status_code != 200:
+            return response
+        await sync_to_async(queue_cache.set_page)(cache_key, response.content)
+    if validators is not None:
+        conditional.set_validators(response, validators)
+    return response
 
 
-@login_required
 @role_required(['staff', 'provost', 'dsw', 'exam_controller'])
-def all_complaints(request):
-    """Return JSON data for complaints based on user role"""
-    user_role = request.user.role
-
-    # Filter complaints based on user role
-    if user_role == 'staff':
-        complaints = Complaint.objects.filter(department='staff').select_related('student')
-    elif user_role == 'provost':
-        complaints = Complaint.objects.all().select_related('student')
-    elif user_role == 'dsw':
-        complaints = Complaint.objects.filter(department='dsw').select_related('student')
-    elif user_role == 'exam_controller':
-        complaints = Complaint.objects.filter(department='exam_controller').select_related('student')
-    else:
-        # Fallback for any other admin roles
-        complaints = Complaint.objects.all().select_related('student')
-
-    complaints_values = complaints.values(
-        'id', 'title', 'description', 'category', 'department', 'hall', 'priority',
-        'status', 'created_at', 'updated_at', 'student__first_name',
-        'student__last_name', 'student__college_id'
-    )
+@replica_reads
+async def all_complaints(request):
+    """Return one keyset page of complaints based on user role and query filters"""
+    async def page_response():
+        sync_token = new_token()
+        complaints = visibility.complaint_queue(request.user)
+
+        complaints_values = complaints.values(*serializers.COMPLAINT_FIELDS)
+
+        try:
+            complaints_values = apply_filters(complaints_values, request.GET, COMPLAINT_FILTERS)
+            page = await sync_to_async(paginate)(complaints_values, request.GET)
+        except InvalidQuery as e:
+            return JsonResponse({
+                'success': False,
+                'message': str(e)
+            }, status=400)
 
-    # Format data for frontend
-    complaints_data = []
-    for complaint in complaints_values:
-        complaints_data.append({
-            'id': f'C{complaint["id"]:03d}',
-            'title': complaint['title'],
-            'description': complaint['description'],
-            'category': complaint['category'].replace('-', ' ').title(),
-            'department': complaint['department'].replace('_', ' ').title(),
-            'hall': complaint['hall'].replace('-', ' ').title(),
-            'priority': complaint['priority'].title(),
-            'status': complaint['status'],
-            'student_name': f"{complaint['student__first_name']} {complaint['student__last_name']}",
-            'student_id': complaint['student__college_id'],
-            'date': complaint['created_at'].strftime('%Y-%m-%d'),
-            'updated_at': complaint['updated_at'].strftime('%Y-%m-%d %H:%M:%S')
+        return serializers.json_response({
+            'success': True,
+            'complaints': [serializers.complaint(complaint) for complaint in page.rows],
+            'next_cursor': page.next_cursor,
+            'prev_cursor': page.prev_cursor,
+            'sync_token': sync_token
         })
 
-    return JsonResponse({
-        'success': True,
-        'complaints': complaints_data
-    })
+    return await _queue_page(request, 'complaints', page_response)
 
 
-@login_required
 @role_required(['staff', 'provost', 'dsw', 'exam_controller'])
 @csrf_exempt
-def api_all_complaints(request):
+async def api_all_complaints(request):
     """API endpoint for all complaints (admin/staff roles)"""
-    return all_complaints(request)
+    return await all_complaints(request)
 
 
-@login_required
 @role_required(['staff', 'provost', 'dsw', 'exam_controller'])
 @csrf_exempt
-@verified_applications_only
-def api_all_applications(request):
-    """API endpoint for all applications (admin/staff roles)"""
-    user_role = request.user.role
-
-    # Filter applications based on user role
-    if user_role == 'staff':
-        applications = Application.objects.filter(department='staff').select_related('student')
-    elif user_role == 'provost':
-        applications = Application.objects.filter(verified=False).select_related('student')
-    elif user_role == 'dsw':
-        # DSW can see all applications for their department (filtering happens in decorator)
-        applications = Application.objects.filter(department='dsw').select_related('student')
-    elif user_role == 'exam_controller':
-        # Exam controller can see all applications for their department (filtering happens in decorator)
-        applications = Application.objects.filter(department='exam_controller').select_related('student')
-    else:
-        # Fallback for any other admin roles
-        applications = Application.objects.all().select_related('student')
-
-    applications_values = applications.values(
-        'id', 'title', 'description', 'application_type', 'department',
-        'status', 'created_at', 'updated_at', 'student__first_name',
-        'student__last_name', 'student__college_id', 'verified'
-    )
+@replica_reads
+async def api_all_applications(request):
+    """API endpoint for a keyset page of applications (admin/staff roles)"""
+    async def page_response():
+        sync_token = new_token()
+        applications = visibility.application_queue(request.user)
+
+        applications_values = applications.values(*serializers.APPLICATION_FIELDS)
+
+        try:
+            applications_values = apply_filters(applications_values, request.GET, APPLICATION_FILTERS)
+            page = await sync_to_async(paginate)(applications_values, request.GET)
+        except InvalidQuery as e:
+            return JsonResponse({
+                'success': False,
+                'message': str(e)
+            }, status=400)
 
-    # Format data for frontend
-    applications_data = []
-    for application in applications_values:
-        applications_data.append({
-            'id': f'A{application["id"]:03d}',
-            'title': application['title'],
-            'description': application['description'],
-            'category': application['application_type'].replace('-', ' ').title(),
-            'department': application['department'].replace('_', ' ').title(),
-            'status': application['status'],
-            'student_name': f"{application['student__first_name']} {application['student__last_name']}",
-            'student_id': application['student__college_id'],
-            'date': application['created_at'].strftime('%Y-%m-%d'),
-            'updated_at': application['updated_at'].strftime('%Y-%m-%d %H:%M:%S'),
-            'verified': application['verified']
+        return serializers.json_response({
+            'success': True,
+            'applications': [serializers.application(application) for application in page.rows],
+            'next_cursor': page.next_cursor,
+            'prev_cursor': page.prev_cursor,
+            'sync_token': sync_token
         })
 
-    return JsonResponse({
+    return await _queue_page(request, 'applications', page_response)
+
+
+def _version(data):
+    """The row version the client last saw, or None for clients that do not send one"""
+    version = data.get('version')
+    return version if isinstance(version, int) else None
+
+
+def _conflict_response(conflict):
+    """409 with the row's current state so the client can retry without reloading"""
+    current = conflict.current
+    data = {
+        'success': False,
+        'conflict': True,
+        'message': str(conflict),
+        'status': current['status'],
+        'version': current['version']
+    }
+    if 'verified' in current:
+        data['verified'] = current['verified']
+    return JsonResponse(data, status=409)
+
+
+@login_required
+@role_required(['student', 'staff', 'provost', 'dsw', 'exam_controller'])
+def search_items(request):
+    """Ranked full-text search over the complaints or applications the caller can see"""
+    kind = request.GET.get('type', 'complaints')
+    if kind == 'complaints':
+        queryset = visibility.complaint_queue(request.user).values(*serializers.COMPLAINT_FIELDS)
+        filters, format_row = COMPLAINT_FILTERS, serializers.complaint
+    elif kind == 'applications':
+        queryset = visibility.application_queue(request.user).values(*serializers.APPLICATION_FIELDS)
+        filters, format_row = APPLICATION_FILTERS, serializers.application
+    else:
+        return JsonResponse({
+            'success': False,
+            'message': 'Search type must be complaints or applications.'
+        }, status=400)
+
+    try:
+        queryset = search(apply_filters(queryset, request.GET, filters), request.GET.get('q', ''))
+        page = paginate_ranked(queryset, request.GET)
+    except InvalidQuery as e:
+        return JsonResponse({
+            'success': False,
+            'message': str(e)
+        }, status=400)
+
+    return serializers.json_response({
         'success': True,
-        'applications': applications_data
+        kind: [format_row(row) for row in page.rows],
+        'next_cursor': page.next_cursor
     })
 
 
+def _archived_values(queryset, fields):
+    """values(*fields) over an archive table; archived rows are final and carry no version"""
+    return queryset.values(
+        *[field for field in fields if field != 'version'], version=Value(None, output_field=IntegerField())
+    )
+
+
+def export_source(user, kind):
+    """
+    The role-scoped querysets, filter map and row formatter behind an export:
+    the hot table first, then the archive, so a dump still has every item.
+    """
+    if kind == 'complaints':
+        queue, fields, filters, format_row = (
+            visibility.complaint_queue, serializers.COMPLAINT_FIELDS, COMPLAINT_FILTERS, serializers.complaint
+        )
+    elif kind == 'applications':
+        queue, fields, filters, format_row = (
+            visibility.application_queue, serializers.APPLICATION_FIELDS, APPLICATION_FILTERS, serializers.application
+        )
+    else:
+        raise Http404
+    querysets = [queue(user).values(*fields), _archived_values(queue(user, archived=True), fields)]
+    return querysets, filters, format_row
+
+
+@login_required
+@role_required(['staff', 'provost', 'dsw', 'exam_controller'])
+def export_items(request, kind):
+    """Stream every complaint or application in the caller's queue as CSV or NDJSON"""
+    querysets, filters, format_row = export_source(request.user, kind)
+    fmt = request.GET.get('format', 'csv')
+    try:
+        content_type = export.content_type(fmt)
+        querysets = [apply_filters(queryset, request.GET, filters) for queryset in querysets]
+    except InvalidQuery as e:
+        return JsonResponse({
+            'success': False,
+            'message': str(e)
+        }, status=400)
+
+    # Rows are read and written one chunk at a time while the response is sent
+    response = StreamingHttpResponse(
+        export.stream(export.export_rows(querysets, format_row), fmt), content_type=content_type
+    )
+    response['Content-Disposition'] = f'attachment; filename="{kind}-{timezone.localdate():%Y%m%d}.{fmt}"'
+    return response
+
+
 @login_required
 @role_required(['staff', 'provost', 'dsw', 'exam_controller'])
 @require_POST
@@ -355,22 +464,30 @@ def update_complaint_status(request):
         if isinstance(complaint_id, str) and complaint_id.startswith('C'):
             complaint_id = int(complaint_id[1:])
 
-        complaint = Complaint.objects.get(id=complaint_id)
-        complaint.status = new_status
-        complaint.save()
+        complaint = transition(
+            visibility.actionable_complaints(request.user), complaint_id, new_status, _version(data)
+        )
 
         return JsonResponse({
             'success': True,
             'message': 'Complaint status updated successfully.',
-            'complaint_id': f'C{complaint.id:03d}',
-            'new_status': new_status
+            'complaint_id': f'C{complaint["id"]:03d}',
+            'new_status': new_status,
+            'version': complaint['version']
         })
 
-    except Complaint.DoesNotExist:
+    except (ArchivedComplaint.DoesNotExist, Complaint.DoesNotExist):
         return JsonResponse({
             'success': False,
             'message': 'Complaint not found.'
         })
+    except TransitionConflict as e:
+        return _conflict_response(e)
+    except InvalidTransition as e:
+        return JsonResponse({
+            'success': False,
+            'message': str(e)
+        }, status=400)
     except Exception as e:
         return JsonResponse({
             'success': False,
@@ -398,22 +515,30 @@ def update_application_status(request):
         if isinstance(application_id, str) and application_id.startswith('A'):
             application_id = int(application_id[1:])
 
-        application = Application.objects.get(id=application_id)
-        application.status = new_status
-        application.save()
+        application = transition(
+            visibility.actionable_applications(request.user), application_id, new_status, _version(data)
+        )
 
         return JsonResponse({
             'success': True,
             'message': 'Application status updated successfully.',
-            'application_id': f'A{application.id:03d}',
-            'new_status': new_status
+            'application_id': f'A{application["id"]:03d}',
+            'new_status': new_status,
+            'version': application['version']
         })
 
-    except Application.DoesNotExist:
+    except (ArchivedApplication.DoesNotExist, Application.DoesNotExist):
         return JsonResponse({
             'success': False,
             'message': 'Application not found.'
         })
+    except TransitionConflict as e:
+        return _conflict_response(e)
+    except InvalidTransition as e:
+        return JsonResponse({
+            'success': False,
+            'message': str(e)
+        }, status=400)
     except Exception as e:
         return JsonResponse({
             'success': False,
@@ -440,21 +565,27 @@ def verify_application(request):
         if isinstance(application_id, str) and application_id.startswith('A'):
             application_id = int(application_id[1:])
 
-        application = Application.objects.get(id=application_id)
-        application.verified = True
-        application.save()
+        application = verify(visibility.actionable_applications(request.user), application_id, _version(data))
 
         return JsonResponse({
             'success': True,
             'message': 'Application verified successfully.',
-            'application_id': f'A{application.id:03d}'
+            'application_id': f'A{application["id"]:03d}',
+            'version': application['version']
         })
 
-    except Application.DoesNotExist:
+    except (ArchivedApplication.DoesNotExist, Application.DoesNotExist):
         return JsonResponse({
             'success': False,
             'message': 'Application not found.'
         })
+    except TransitionConflict as e:
+        return _conflict_response(e)
+    except InvalidTransition as e:
+        return JsonResponse({
+            'success': False,
+            'message': str(e)
+        }, status=400)
     except Exception as e:
         return JsonResponse({
             'success': False,
@@ -463,43 +594,217 @@ def verify_application(request):
 
 
 @login_required
-def complaint_details(request, complaint_id):
+@role_required(['staff', 'provost', 'dsw', 'exam_controller'])
+def queue_stats(request):
+    """Status totals for the caller's queues, read from the maintained counters"""
+    return JsonResponse({
+        'success': True,
+        'complaints': summarize(visibility.complaint_counters(request.user)),
+        'applications': summarize(visibility.application_counters(request.user))
+    })
+
+
+@role_required(['student', 'staff', 'provost', 'dsw', 'exam_controller'])
+@replica_reads
+async def bootstrap(request):
+    """The caller's dashboard data in one response: lists or first queue pages, counters and badge"""
+    return serializers.json_response(await sync_to_async(dashboard_data)(request.user))
+
+
+# Upper bound on IDs per bulk request, keeping the IN (...) list and the response small
+BULK_MAX_IDS = 200
+
+
+def _parse_bulk_ids(raw_ids, prefix):
+    """Map each submitted ID ('C001' or 1) to its integer key, or None if malformed"""
+    parsed = {}
+    for raw_id in raw_ids:
+        value = str(raw_id)
+        if value.startswith(prefix):
+            value = value[1:]
+        parsed[raw_id] = int(value) if value.isdigit() else None
+    return parsed
+
+
+def _bulk_update(scope, raw_ids, prefix, changes, check):
+    """
+    Apply `changes` to every submitted ID inside `scope` that passes `check`
+    (which returns an error message or None) with one UPDATE, and return
+    per-ID results. update() skips save() and its signals, so the cache bump
+    and change events are issued here.
+    """
+    parsed = _parse_bulk_ids(raw_ids, prefix)
+    model = scope.model
+    label = model._meta.verbose_name.capitalize()
+
+    with transaction.atomic():
+        rows = {
+            row['id']: row
+            for row in scope.select_for_update().filter(
+                id__in=[pk for pk in parsed.values() if pk is not None]
+            ).values()
+        }
+        errors = {pk: check(row) for pk, row in rows.items()}
+        eligible = [pk for pk, error in errors.items() if error is None]
+        if eligible:
+            model.objects.filter(id__in=eligible).update(
+                version=F('version') + 1, updated_at=timezone.now(), **changes
+            )
+            departments = {rows[pk]['department'] for pk in eligible}
+            transaction.on_commit(lambda: queue_cache.bump_queue_version(*departments))
+            moves = Counter()
+            for pk in eligible:
+                old_key = counter_key(model, rows[pk])
+                rows[pk].update(changes, version=rows[pk]['version'] + 1)
+                new_key = counter_key(model, rows[pk])
+                moves[old_key] -= 1
+                moves[new_key] += 1
+            adjust(moves)
+            publish_changes([model(**rows[pk]) for pk in eligible], 'updated')
+            enqueue(model, [rows[pk] for pk in eligible], change='verified' if 'verified' in changes else 'status')
+
+    results = []
+    for raw_id, pk in parsed.items():
+        if pk is None:
+            results.append({'id': raw_id, 'success': False, 'message': f'Invalid {label.lower()} ID.'})
+        elif pk in rows and errors[pk] is None:
+            results.append({'id': f'{prefix}{pk:03d}', 'success': True, 'version': rows[pk]['version']})
+        elif pk in rows:
+            results.append({'id': f'{prefix}{pk:03d}', 'success': False, 'message': errors[pk]})
+        else:
+            results.append({'id': f'{prefix}{pk:03d}', 'success': False, 'message': f'{label} not found.'})
+    return results
+
+
+def _bulk_request(request, ids_key):
+    """Decode a bulk request body; returns (data, ids) or raises ValueError with a message"""
+    try:
+        data = json.loads(request.body)
+    except ValueError:
+        raise ValueError('Invalid request body.')
+    if not isinstance(data, dict):
+        raise ValueError('Invalid request body.')
+    ids = data.get(ids_key)
+    # IDs are 'C001'-style strings or plain numbers; anything else cannot be looked up
+    if not isinstance(ids, list) or not ids or not all(
+        isinstance(raw_id, (str, int)) and not isinstance(raw_id, bool) for raw_id in ids
+    ):
+        raise ValueError(f'A non-empty {ids_key} list is required.')
+    if len(ids) > BULK_MAX_IDS:
+        raise ValueError(f'At most {BULK_MAX_IDS} IDs can be updated at once.')
+    return data, ids
+
+
+def _bulk_response(results, message):
+    updated = sum(1 for result in results if result['success'])
+    return JsonResponse({
+        'success': updated > 0,
+        'message': message.format(updated=updated, total=len(results)),
+        'updated': updated,
+        'results': results
+    })
+
+
+@login_required
+@role_required(['staff', 'provost', 'dsw', 'exam_controller'])
+@require_POST
+def bulk_update_complaint_status(request):
+    """Update the status of many complaints at once"""
+    try:
+        data, complaint_ids = _bulk_request(request, 'complaint_ids')
+    except ValueError as e:
+        return JsonResponse({'success': False, 'message': str(e)}, status=400)
+
+    new_status = data.get('status')
+    if new_status not in dict(Complaint.STATUS_CHOICES):
+        return JsonResponse({'success': False, 'message': 'A valid status is required.'}, status=400)
+
+    results = _bulk_update(
+        visibility.actionable_complaints(request.user), complaint_ids, 'C', {'status': new_status},
+        lambda row: transition_error(Complaint, row['status'], new_status)
+    )
+    return _bulk_response(results, '{updated} of {total} complaints updated.')
+
+
+@login_required
+@role_required(['staff', 'provost', 'dsw', 'exam_controller'])
+@require_POST
+def bulk_update_application_status(request):
+    """Update the status of many applications at once"""
+    try:
+        data, application_ids = _bulk_request(request, 'application_ids')
+    except ValueError as e:
+        return JsonResponse({'success': False, 'message': str(e)}, status=400)
+
+    new_status = data.get('status')
+    if new_status not in dict(Application.STATUS_CHOICES):
+        return JsonResponse({'success': False, 'message': 'A valid status is required.'}, status=400)
+
+    results = _bulk_update(
+        visibility.actionable_applications(request.user), application_ids, 'A', {'status': new_status},
+        lambda row: transition_error(Application, row['status'], new_status)
+    )
+    return _bulk_response(results, '{updated} of {total} applications updated.')
+
+
+@login_required
+@role_required(['provost'])
+@require_POST
+def bulk_verify_applications(request):
+    """Verify many applications at once (provost only)"""
+    try:
+        _, application_ids = _bulk_request(request, 'application_ids')
+    except ValueError as e:
+        return JsonResponse({'success': False, 'message': str(e)}, status=400)
+
+    # Looked up beyond the verification queue, so repeats report "already verified"
+    results = _bulk_update(
+        visibility.actionable_applications(request.user), application_ids, 'A', {'verified': True},
+        lambda row: 'Application is already verified.' if row['verified'] else None
+    )
+    return _bulk_response(results, '{updated} of {total} applications verified.')
+
+
+def _readable_row(readable, user, fields, pk):
+    """
+    (values() row, archived) for an item the user may read. Closed items move
+    to the archive after ARCHIVE_AFTER_DAYS, so look there before giving up.
+    """
+    try:
+        return readable(user).values(*fields).get(id=pk), False
+    except ObjectDoesNotExist:
+        return _archived_values(readable(user, archived=True), fields).get(id=pk), True
+
+
+def _row_validators(kind, row, archived):
+    """Validators over the whole row; it is already loaded, so only serialization is saved"""
+    return conditional.validators(kind, archived, *row.values(), modified=row['updated_at'])
+
+
+@role_required([role for role, _ in CustomUser.ROLE_CHOICES])
+@replica_reads
+async def complaint_details(request, complaint_id):
     """Return detailed information for a specific complaint"""
     try:
         # Remove 'C' prefix if present
         if isinstance(complaint_id, str) and complaint_id.startswith('C'):
             complaint_id = int(complaint_id[1:])
 
-        complaint = Complaint.objects.select_related('student').get(id=complaint_id)
-
-        # Check permissions: students can only view their own complaints
-        if request.user.role == 'student' and complaint.student != request.user:
-            return JsonResponse({
-                'success': False,
-                'message': 'You do not have permission to view this complaint.'
-            })
+        # Students only find their own complaints; anyone else's reads as not found
+        complaint, archived = await sync_to_async(_readable_row)(
+            visibility.readable_complaints, request.user, serializers.COMPLAINT_FIELDS, complaint_id
+        )
+        validators = _row_validators('complaint', complaint, archived)
+        response = conditional.not_modified(request, validators)
+        if response is not None:
+            return response
 
-        complaint_data = {
-            'id': f'C{complaint.id:03d}',
-            'title': complaint.title,
-            'description': complaint.description,
-            'category': complaint.category.replace('-', ' ').title(),
-            'department': complaint.department.replace('_', ' ').title(),
-            'hall': complaint.hall.replace('-', ' ').title(),
-            'priority': complaint.priority.title(),
-            'status': complaint.status,
-            'student_name': f"{complaint.student.first_name} {complaint.student.last_name}",
-            'student_id': complaint.student.college_id,
-            'date': complaint.created_at.strftime('%Y-%m-%d'),
-            'updated_at': complaint.updated_at.strftime('%Y-%m-%d %H:%M:%S')
-        }
-
-        return JsonResponse({
+        return conditional.set_validators(serializers.json_response({
             'success': True,
-            'complaint': complaint_data
-        })
+            'complaint': serializers.complaint_detail(complaint, archived)
+        }), validators)
 
-    except Complaint.DoesNotExist:
+    except (ArchivedComplaint.DoesNotExist, Complaint.DoesNotExist):
         return JsonResponse({
             'success': False,
             'message': 'Complaint not found.'
@@ -511,42 +816,30 @@ def complaint_details(request, complaint_id):
         })
 
 
-@login_required
-def application_details(request, application_id):
+@role_required([role for role, _ in CustomUser.ROLE_CHOICES])
+@replica_reads
+async def application_details(request, application_id):
     """Return detailed information for a specific application"""
     try:
         # Remove 'A' prefix if present
         if isinstance(application_id, str) and application_id.startswith('A'):
             application_id = int(application_id[1:])
 
-        application = Application.objects.select_related('student').get(id=application_id)
+        # Students only find their own applications; anyone else's reads as not found
+        application, archived = await sync_to_async(_readable_row)(
+            visibility.readable_applications, request.user, serializers.APPLICATION_FIELDS, application_id
+        )
+        validators = _row_validators('application', application, archived)
+        response = conditional.not_modified(request, validators)
+        if response is not None:
+            return response
 
-        # Check permissions: students can only view their own applications
-        if request.user.role == 'student' and application.student != request.user:
-            return JsonResponse({
-                'success': False,
-                'message': 'You do not have permission to view this application.'
-            })
-
-        application_data = {
-            'id': f'A{application.id:03d}',
-            'title': application.title,
-            'description': application.description,
-            'application_type': application.application_type.replace('-', ' ').title(),
-            'department': application.department.replace('_', ' ').title(),
-            'status': application.status,
-            'student_name': f"{application.student.first_name} {application.student.last_name}",
-            'student_id': application.student.college_id,
-            'date': application.created_at.strftime('%Y-%m-%d'),
-            'updated_at': application.updated_at.strftime('%Y-%m-%d %H:%M:%S')
-        }
-
-        return JsonResponse({
+        return conditional.set_validators(serializers.json_response({
             'success': True,
-            'application': application_data
-        })
+            'application': serializers.application_detail(application, archived)
+        }), validators)
 
-    except Application.DoesNotExist:
+    except (ArchivedApplication.DoesNotExist, Application.DoesNotExist):
         return JsonResponse({
             'success': False,
             'message': 'Application not found.'
@@ -592,14 +885,16 @@ def delete_complaint(request):
                 'message': 'You can only delete pending complaints.'
             })
 
-        complaint.delete()
+        with transaction.atomic():
+            Tombstone.record(complaint)
+            complaint.delete()
 
         return JsonResponse({
             'success': True,
             'message': 'Complaint deleted successfully.'
         })
 
-    except Complaint.DoesNotExist:
+    except (ArchivedComplaint.DoesNotExist, Complaint.DoesNotExist):
         return JsonResponse({
             'success': False,
             'message': 'Complaint not found.'
@@ -645,14 +940,16 @@ def delete_application(request):
                 'message': 'You can only delete pending applications.'
             })
 
-        application.delete()
+        with transaction.atomic():
+            Tombstone.record(application)
+            application.delete()
 
         return JsonResponse({
             'success': True,
             'message': 'Application deleted successfully.'
         })
 
-    except Application.DoesNotExist:
+    except (ArchivedApplication.DoesNotExist, Application.DoesNotExist):
         return JsonResponse({
             'success': False,
             'message': 'Application not found.'
@@ -662,3 +959,120 @@ def delete_application(request):
             'success': False,
             'message': 'An error occurred while deleting the application.'
         })
+
+
+@login_required
+@role_required(['student'])
+@replica_reads
+def notification_list(request):
+    """Return one keyset page of the student's notifications, newest first (?unread=1 for unread only)"""
+    notifications = visibility.notification_queue(request.user)
+    if request.GET.get('unread') in ('1', 'true'):
+        notifications = notifications.filter(is_read=False)
+
+    try:
+        page = paginate(notifications.values(*serializers.NOTIFICATION_FIELDS), request.GET)
+    except InvalidQuery as e:
+        return JsonResponse({
+            'success': False,
+            'message': str(e)
+        }, status=400)
+
+    return serializers.json_response({
+        'success': True,
+        'notifications': [serializers.notification(notification) for notification in page.rows],
+        'next_cursor': page.next_cursor,
+        'prev_cursor': page.prev_cursor,
+        'unread_count': unread_count(request.user)
+    })
+
+
+@login_required
+@role_required(['student'])
+@require_POST
+def mark_notifications_read(request):
+    """Mark the listed notifications read, or all of them when no IDs are sent"""
+    try:
+        data = json.loads(request.body or '{}')
+    except ValueError:
+        return JsonResponse({
+            'success': False,
+            'message': 'Invalid request body.'
+        }, status=400)
+
+    ids = data.get('notification_ids')
+    if ids is not None and (
+        not isinstance(ids, list) or len(ids) > BULK_MAX_IDS
+        or not all(isinstance(pk, int) and not isinstance(pk, bool) for pk in ids)
+    ):
+        return JsonResponse({
+            'success': False,
+            'message': f'notification_ids must be a list of at most {BULK_MAX_IDS} IDs.'
+        }, status=400)
+
+    # One UPDATE however many there are; the counter drops by exactly the rows changed
+    marked = mark_read(request.user, ids)
+    return JsonResponse({
+        'success': True,
+        'marked': marked,
+        'unread_count': unread_count(request.user)
+    })
+
+
+@login_required
+@role_required(['student', 'staff', 'provost', 'dsw', 'exam_controller'])
+def sync_changes(request):
+    """Return complaints, applications and notifications changed since a sync token"""
+    sync_token = new_token()
+    try:
+        since = decode_token(request.GET.get('token', ''))
+    except InvalidSyncToken:
+        # No usable token: the client must reload its lists and resume from here
+        return JsonResponse({
+            'success': True,
+            'reset': True,
+            'sync_token': sync_token
+        })
+
+    user = request.user
+    complaints = visibility.complaint_queue(user)
+    applications = visibility.application_queue(user)
+    notifications = visibility.notification_queue(user)
+    tombstones = visibility.tombstone_queue(user)
+    departed = [visibility.departed_applications(user)]
+
+    changes = changes_since(since, complaints, applications, notifications, tombstones, departed)
+
+    if user.role == 'student':
+        # The same shape and rows as the student's own lists, archived items included
+        complaint_fields, format_complaint = serializers.STUDENT_COMPLAINT_FIELDS, serializers.student_complaint
+        application_fields, format_application = (
+            serializers.STUDENT_APPLICATION_FIELDS, serializers.student_application
+        )
+        complaint_rows = visibility.with_archive(
+            changes.complaints, changed(visibility.complaint_queue(user, archived=True), since), complaint_fields
+        )
+        application_rows = visibility.with_archive(
+            changes.applications, changed(visibility.application_queue(user, archived=True), since),
+            application_fields
+        )
+    else:
+        complaint_fields, format_complaint = serializers.COMPLAINT_FIELDS, serializers.complaint
+        application_fields, format_application = serializers.APPLICATION_FIELDS, serializers.application
+        complaint_rows = changes.complaints.values(*complaint_fields)
+        application_rows = changes.applications.values(*application_fields)
+
+    notifications_data = [
+        serializers.notification(notification)
+        for notification in changes.notifications.values(*serializers.NOTIFICATION_FIELDS)
+    ]
+
+    return serializers.json_response({
+        'success': True,
+        'reset': False,
+        'sync_token': sync_token,
+        'complaints': [format_complaint(complaint) for complaint in complaint_rows],
+        'applications': [format_application(application) for application in application_rows],
+        'notifications': notifications_data,
+        'deleted': changes.deleted
+    })
@@ -0,0 +1,129 @@
+from .cache import DEPARTMENT_ROLES
+from .models import (
+    Application, ArchivedApplication, ArchivedComplaint, Complaint, Notification, StatusCounter, Tombstone,
+)
+
+# Every view starts from these querysets rather than filtering rows in Python,
+# so role rules are WHERE clauses and each list or lookup stays a single query.
+
+# Department queues that only receive applications once the provost has verified them
+VERIFIED_ONLY_ROLES = ['staff', 'exam_controller']
+
+
+def complaint_queue(user, archived=False):
+    """Complaints listed for a user: their own, their department's, or all"""
+    model = ArchivedComplaint if archived else Complaint
+    if user.role == 'student':
+        return model.objects.filter(student_id=user.pk)
+    if user.role in DEPARTMENT_ROLES:
+        return model.objects.filter(department=user.role)
+    # Provost and any other admin roles see every department
+    return model.objects.all()
+
+
+def application_queue(user, archived=False):
+    """Applications listed for a user"""
+    model = ArchivedApplication if archived else Application
+    if user.role == 'student':
+        return model.objects.filter(student_id=user.pk)
+    if user.role == 'provost':
+        # The provost works the verification queue
+        return model.objects.filter(verified=False)
+    if user.role in VERIFIED_ONLY_ROLES:
+        return model.objects.filter(department=user.role, verified=True)
+    if user.role in DEPARTMENT_ROLES:
+        return model.objects.filter(department=user.role)
+    return model.objects.all()
+
+
+def with_archive(queryset, archived, fields):
+    """
+    values(*fields) rows of a list and of its archived part in one UNION ALL
+    query, newest first. Students keep their closed items until they are purged.
+    """
+    return (
+        queryset.values(*fields).order_by()
+        .union(archived.values(*fields).order_by(), all=True)
+        .order_by('-created_at')
+    )
+
+
+def departed_applications(user):
+    """Applications that leave a user's queue without being deleted: the provost's, once verified"""
+    if user.role == 'provost':
+        return Application.objects.filter(verified=True)
+    return Application.objects.none()
+
+
+def readable_complaints(user, archived=False):
+    """Complaints a user may open by ID: students only their own"""
+    model = ArchivedComplaint if archived else Complaint
+    if user.role == 'student':
+        return model.objects.filter(student_id=user.pk)
+    return model.objects.all()
+
+
+def readable_applications(user, archived=False):
+    """Applications a user may open by ID: students only their own"""
+    model = ArchivedApplication if archived else Application
+    if user.role == 'student':
+        return model.objects.filter(student_id=user.pk)
+    return model.objects.all()
+
+
+def actionable_complaints(user):
+    """
+    Complaints a user may change. Wider than complaint_queue on purpose: the
+    write views' role checks decide who may act, not what a dashboard lists.
+    """
+    if user.role == 'student':
+        return Complaint.objects.none()
+    return Complaint.objects.all()
+
+
+def actionable_applications(user):
+    """Applications a user may change or verify; see actionable_complaints"""
+    if user.role == 'student':
+        return Application.objects.none()
+    return Application.objects.all()
+
+
+def notification_queue(user):
+    """Notifications a user receives; only students are notified"""
+    if user.role == 'student':
+        return Notification.objects.filter(student_id=user.pk)
+    return Notification.objects.none()
+
+
+def tombstone_queue(user):
+    """Deletion markers for the items in a user's queues"""
+    if user.role == 'student':
+        # Archived items stay in the student's lists, so only their purge deletes them
+        return Tombstone.objects.filter(student_id=user.pk).exclude(
+            record_type='complaint', record_id__in=ArchivedComplaint.objects.filter(student_id=user.pk).values('id')
+        ).exclude(
+            record_type='application', record_id__in=ArchivedApplication.objects.filter(student_id=user.pk).values('id')
+        )
+    if user.role in DEPARTMENT_ROLES:
+        return Tombstone.objects.filter(department=user.role)
+    return Tombstone.objects.all()
+
+
+def complaint_counters(user):
+    """Dashboard counters matching complaint_queue for staff-side roles"""
+    counters = StatusCounter.objects.filter(record_type='complaint')
+    if user.role in DEPARTMENT_ROLES:
+        return counters.filter(department=user.role)
+    return counters
+
+
+def application_counters(user):
+    """Dashboard counters matching application_queue for staff-side roles"""
+    counters = StatusCounter.objects.filter(record_type='application')
+    if user.role == 'provost':
+        return counters.filter(verified=False)
+    if user.role in VERIFIED_ONLY_ROLES:
+        return counters.filter(department=user.role, verified=True)
+    if user.role in DEPARTMENT_ROLES:
+        return counters.filter(department=user.role)
+    return counters
@@ -2,15 +2,87 @@
 ASGI config for cFix project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Requests to the Server-Sent Events path are answered by a long-lived async
+stream. Exports go through Django's WSGI handler in a worker thread, because
+Django 3.2 iterates streaming responses on the event loop, where their
+database queries are not allowed. Everything else goes to Django's ASGI handler.
+
+Every other request runs its sync code (middleware, the ORM calls of async
+views) on a thread borrowed from a fixed pool of ASGI_SYNC_THREADS. Without
+that, Django 3.2 runs every request's sync code on one shared thread. The
+threads outlive the requests, so each keeps its database connection for
+DB_CONN_MAX_AGE, as a WSGI worker's thread does.
+
+Run it with: gunicorn cFix.asgi:application -k uvicorn.workers.UvicornWorker
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
 
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 
+from asgiref.sync import SyncToAsync, ThreadSensitiveContext
+from asgiref.wsgi import WsgiToAsgi
+from django.conf import settings
 from django.core.asgi import get_asgi_application
+from django.core.wsgi import get_wsgi_application
+from django.urls import Resolver404, resolve
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'cFix.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+streaming_application = WsgiToAsgi(get_wsgi_application())
+
+# Imported after Django is set up, since it touches models and settings
+from accounts.sse import EVENTS_PATH, sse_application  # noqa: E402
+
+# Views whose streaming response reads the database, wherever accounts.urls is mounted
+STREAMING_VIEWS = {'export_items'}
+
+
+class PooledThreadContext(ThreadSensitiveContext):
+    """
+    ThreadSensitiveContext whose thread is borrowed from a fixed pool instead
+    of started (and its database connection opened) for every request. When
+    all threads are busy, a request waits for one.
+    """
+    _idle = None
+
+    async def __aenter__(self):
+        if PooledThreadContext._idle is None:
+            PooledThreadContext._idle = asyncio.Queue()
+            for _ in range(settings.ASGI_SYNC_THREADS):
+                PooledThreadContext._idle.put_nowait(ThreadPoolExecutor(max_workers=1))
+        self.executor = await self._idle.get()
+        await super().__aenter__()
+        SyncToAsync.context_to_thread_executor[self] = self.executor
+        return self
+
+    async def __aexit__(self, *exc_info):
+        # Taken back first, or the base class would shut the thread down
+        SyncToAsync.context_to_thread_executor.pop(self, None)
+        try:
+            await super().__aexit__(*exc_info)
+        finally:
+            self._idle.put_nowait(self.executor)
+
+
+def _streams_from_database(path):
+    try:
+        return resolve(path).url_name in STREAMING_VIEWS
+    except Resolver404:
+        return False
+
+
+async def application(scope, receive, send):
+    if scope['type'] == 'http' and scope['path'] == EVENTS_PATH:
+        # Long-lived, and only its brief authentication runs sync code; no thread of its own
+        await sse_application(scope, receive, send)
+        return
+    async with PooledThreadContext():
+        if scope['type'] == 'http' and _streams_from_database(scope['path']):
+            await streaming_application(scope, receive, send)
+        else:
+            await django_application(scope, receive, send)
@@ -1,8 +1,10 @@
 import os
 import dj_database_url
+from datetime import timedelta
 from pathlib import Path
 import certifi
 import dj_database_url
+from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 
 
@@ -39,9 +41,9 @@ TAILWIND_APP_NAME = 'theme'
 INTERNAL_IPS = ['127.0.0.1']
 
 AUTH_USER_MODEL = 'accounts.CustomUser'
+# One backend for college ID and email sign-in; it also provides ModelBackend's permissions
 AUTHENTICATION_BACKENDS = [
     'accounts.backends.CollegeIdBackend',
-    'django.contrib.auth.backends.ModelBackend',
 ]
 
 REST_FRAMEWORK = {
@@ -50,13 +52,22 @@ REST_FRAMEWORK = {
     ),
 }
 
+# /api/ requests may send `Authorization: Bearer <access>` from POST /api/token/;
+# the user is rebuilt from the token's claims (accounts/tokens.py)
+SIMPLE_JWT = {
+    'ACCESS_TOKEN_LIFETIME': timedelta(minutes=int(os.getenv('JWT_ACCESS_MINUTES', '15'))),
+    'REFRESH_TOKEN_LIFETIME': timedelta(days=int(os.getenv('JWT_REFRESH_DAYS', '7'))),
+}
+
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
+    'accounts.sessions.RefreshingSessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'accounts.tokens.JWTAuthenticationMiddleware',
+    'accounts.routers.ReplicaPinMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -80,53 +91,130 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'cFix.wsgi.application'
+ASGI_APPLICATION = 'cFix.asgi.application'
+# Threads per ASGI worker for sync code (middleware, ORM calls of async views). Each
+# keeps its own database connection, so this also caps a worker's connections.
+ASGI_SYNC_THREADS = int(os.getenv('ASGI_SYNC_THREADS', '8'))
 
-
-DATABASES = {
+# Local memory by default. Set CACHE_BACKEND=django.core.cache.backends.filebased.FileBasedCache
+# and CACHE_LOCATION to a shared directory so several gunicorn workers share the queue cache
+# and sessions.
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
-        'NAME': os.getenv('DB_NAME'),
-        'USER': os.getenv('DB_USER'),
-        'PASSWORD': os.getenv('DB_PASSWORD'),
-        'HOST': os.getenv('DB_HOST'),
-        'PORT': os.getenv('DB_PORT', '5432'),
-    }
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'cfix-default'),
+    },
+    # {% cache %} fragments of the dashboard shells. Per process on purpose: a deploy
+    # restarts the workers, so fragments never outlive the templates they came from.
+    'template_fragments': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'cfix-template-fragments',
+    },
 }
 
-# DATABASES = {
-#     'default': dj_database_url.config(
-#         default=os.getenv('DATABASE_URL'),
-#         conn_max_age=600,
-#         ssl_require=True
-#     )
-# }
-
-
-
-
-# if os.getenv('DATABASE_URL'):
-#     DATABASES = {
-#         'default': dj_database_url.config(
-#             default=os.getenv('DATABASE_URL'),
-#             conn_max_age=600,
-#             ssl_require=True
-#         )
-#     }
-# else:
-#     # Fallback to SQLite locally
-#     DATABASES = {
-#         'default': {
-#             'ENGINE': 'django.db.backends.sqlite3',
-#             'NAME': BASE_DIR / 'db.sqlite3',
-#         }
-#     }
+# Sessions are read from the cache and fall back to the database. An unchanged session
+# is only re-saved once less than SESSION_REFRESH_FRACTION of its age is left, so
+# dashboard polling does not write to django_session.
+SESSION_ENGINE = 'accounts.sessions'
+SESSION_COOKIE_AGE = 1209600  # 2 weeks
+SESSION_REFRESH_FRACTION = float(os.getenv('SESSION_REFRESH_FRACTION', '0.5'))
+
+# JSON_ENCODER: optional dotted path to a `data -> bytes` function for JSON responses;
+# unset, orjson (in requirements.txt) is used, or the standard library without it.
+
+# Serialized role-queue pages; invalidated by per-department versions (accounts/cache.py)
+QUEUE_CACHE_ALIAS = 'default'
+QUEUE_CACHE_TIMEOUT = int(os.getenv('QUEUE_CACHE_TIMEOUT', '300'))
+
+# Server-Sent Events fan-out. The in-process backend only reaches clients of the
+# same worker; use accounts.events.PostgresBroadcaster with several workers.
+EVENTS_BACKEND = os.getenv('EVENTS_BACKEND', 'accounts.events.InProcessBroadcaster')
+
+# Days a finished complaint/application or a read notification is kept (purge_expired)
+RETENTION_DAYS = int(os.getenv('RETENTION_DAYS', '10'))
+
+# Days a resolved/approved/rejected item stays in the hot tables, and in the department
+# queues, before archive_closed moves it; students keep seeing it until RETENTION_DAYS
+ARCHIVE_AFTER_DAYS = int(os.getenv('ARCHIVE_AFTER_DAYS', '7'))
+
+
+# Each worker keeps its connection for DB_CONN_MAX_AGE seconds instead of reconnecting
+# on every request (0 closes it after each request). With DB_HEALTH_CHECKS a reused
+# connection is pinged when a request starts and replaced if the server dropped it
+# (accounts/connections.py; Django 4.1+ reads the same CONN_HEALTH_CHECKS key itself).
+# Off by default: the ping is a round trip per open connection on every request, which
+# only pays off when the server or a pooler drops idle connections before CONN_MAX_AGE.
+DB_CONN_MAX_AGE = int(os.getenv('DB_CONN_MAX_AGE', '600'))
+DB_HEALTH_CHECKS = os.getenv('DB_HEALTH_CHECKS', 'False') == 'True'
+
+if os.getenv('DATABASE_URL'):
+    DATABASES = {
+        'default': dj_database_url.parse(
+            os.getenv('DATABASE_URL'),
+            conn_max_age=DB_CONN_MAX_AGE,
+            ssl_require=os.getenv('DB_SSL_REQUIRE', 'True') == 'True',
+        )
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.getenv('DB_NAME'),
+            'USER': os.getenv('DB_USER'),
+            'PASSWORD': os.getenv('DB_PASSWORD'),
+            'HOST': os.getenv('DB_HOST'),
+            'PORT': os.getenv('DB_PORT', '5432'),
+            'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+        }
+    }
+DATABASES['default']['CONN_HEALTH_CHECKS'] = DB_HEALTH_CHECKS
+
+# Read replicas: DATABASE_REPLICA_URLS is a comma-separated list of URLs, added as
+# replica1, replica2, ... GETs to the list and detail views read from a healthy one
+# (accounts/routers.py). A user who just wrote reads from the primary for
+# REPLICA_LAG_SECONDS, which should cover the replicas' usual replication lag.
+# That pin lives in the default cache, so replicas need a CACHE_BACKEND shared by all
+# workers; with a per-process cache the next request may land on a worker that never
+# saw the pin and read stale rows.
+DATABASE_REPLICAS = []
+for number, url in enumerate(filter(None, os.getenv('DATABASE_REPLICA_URLS', '').split(',')), start=1):
+    DATABASES[f'replica{number}'] = dj_database_url.parse(
+        url.strip(),
+        conn_max_age=DB_CONN_MAX_AGE,
+        ssl_require=os.getenv('DB_SSL_REQUIRE', 'True') == 'True',
+    )
+    DATABASES[f'replica{number}']['CONN_HEALTH_CHECKS'] = DB_HEALTH_CHECKS
+    DATABASE_REPLICAS.append(f'replica{number}')
+if DATABASE_REPLICAS and CACHES['default']['BACKEND'].endswith('LocMemCache'):
+    raise ImproperlyConfigured('DATABASE_REPLICA_URLS needs a shared CACHE_BACKEND for read-your-writes pins.')
+DATABASE_ROUTERS = ['accounts.routers.ReplicaRouter']
+REPLICA_LAG_SECONDS = int(os.getenv('REPLICA_LAG_SECONDS', '5'))
+
+# DB_POOLER=pgbouncer when connecting through PgBouncer in transaction pooling mode:
+# consecutive transactions may run on different server connections, so cursors that
+# outlive a transaction must be client-side. .iterator() then loads the whole result,
+# which is why exports page by keyset instead (accounts/export.py). LISTEN/NOTIFY
+# (EVENTS_BACKEND=PostgresBroadcaster) needs a direct connection in that mode.
+if os.getenv('DB_POOLER') == 'pgbouncer':
+    for database in DATABASES.values():
+        database['DISABLE_SERVER_SIDE_CURSORS'] = True
+
 
 # Password hashing
-PASSWORD_HASHERS = [
-    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
-    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
-    'django.contrib.auth.hashers.Argon2PasswordHasher',
-    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+# The first hasher hashes new passwords; a user whose stored hash used another one
+# (or other PBKDF2 iterations) is rehashed on their next successful login. Set
+# PASSWORD_HASHER to e.g. django.contrib.auth.hashers.Argon2PasswordHasher (needs
+# argon2-cffi) or tune PBKDF2_ITERATIONS; `manage.py benchmark_login` measures the cost.
+PASSWORD_HASHER = os.getenv('PASSWORD_HASHER', 'accounts.hashers.PBKDF2PasswordHasher')
+PBKDF2_ITERATIONS = int(os.getenv('PBKDF2_ITERATIONS', '260000'))
+PASSWORD_HASHERS = [PASSWORD_HASHER] + [
+    hasher for hasher in [
+        'accounts.hashers.PBKDF2PasswordHasher',
+        'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+        'django.contrib.auth.hashers.Argon2PasswordHasher',
+        'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    ]
+    if hasher != PASSWORD_HASHER
 ]
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -145,6 +233,9 @@ USE_TZ = True
 STATIC_URL = '/static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
 STATIC_ROOT = BASE_DIR / 'staticfiles'
+# collectstatic writes content-hashed, pre-compressed copies (e.g. js/dashboard/student.3f2a9c.js);
+# WhiteNoise serves those with a ten-year immutable Cache-Control, so browsers fetch each
+# version of the dashboard code once.
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
@@ -164,7 +255,4 @@ if not DEBUG:
     SECURE_SSL_REDIRECT = True
     SESSION_COOKIE_SECURE = True
     CSRF_COOKIE_SECURE = True
-    SESSION_ENGINE = "django.contrib.sessions.backends.db"
-    SESSION_SAVE_EVERY_REQUEST = True
     SESSION_EXPIRE_AT_BROWSER_CLOSE = False
-    SESSION_COOKIE_AGE = 1209600  # 2 weeks
@@ -1,12 +1,18 @@
 
 from django.contrib import admin
 from django.urls import path, include
+from rest_framework_simplejwt.views import TokenRefreshView
+
+from accounts.tokens import ClaimsTokenObtainPairView
 from . import views
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('', views.home, name = 'home'),
     path('api/', include([
+        # JWT access/refresh pair for API clients (email or college ID + password)
+        path('token/', ClaimsTokenObtainPairView.as_view(), name='token_obtain_pair'),
+        path('token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
         path('', include('seeFix.urls')),
         path('', include('accounts.urls')),
     ])),
@@ -0,0 +1,479 @@
+let allComplaints = [];
+let allApplications = [];
+let applicationsCursor = null;
+let syncToken = null;
+const SYNC_INTERVAL_MS = 30000;
+let csrfToken = document.querySelector('[name=csrfmiddlewaretoken]')?.value || '';
+
+// Initialize dashboard
+document.addEventListener('DOMContentLoaded', function() {
+    const bootstrap = takeBootstrap();
+    if (bootstrap) {
+        applyBootstrap(bootstrap);
+    } else {
+        loadDSWApplications();
+        loadAnalytics();
+    }
+    setupEventListeners();
+    startLiveUpdates();
+});
+
+function takeBootstrap() {
+    // First queue page and counters the server embedded in the page, used once
+    const element = document.getElementById('dashboard-bootstrap');
+    if (!element) return null;
+    element.remove();
+    return JSON.parse(element.textContent);
+}
+
+function applyBootstrap(data) {
+    allApplications = data.applications.rows;
+    applicationsCursor = data.applications.next_cursor;
+    syncToken = data.sync_token;
+    document.getElementById('appLoadMoreBtn').classList.toggle('hidden', !applicationsCursor);
+    renderDSWApplications(allApplications);
+    updateAnalytics(data.stats.applications);
+}
+
+function setupEventListeners() {
+    // Sidebar toggle
+    document.getElementById('sidebarToggle').addEventListener('click', function() {
+        const sidebar = document.getElementById('sidebar');
+        const overlay = document.getElementById('sidebarOverlay');
+        sidebar.classList.toggle('-translate-x-full');
+        overlay.classList.toggle('hidden');
+    });
+
+    // Sidebar overlay click
+    document.getElementById('sidebarOverlay').addEventListener('click', function() {
+        const sidebar = document.getElementById('sidebar');
+        const overlay = document.getElementById('sidebarOverlay');
+        sidebar.classList.add('-translate-x-full');
+        overlay.classList.add('hidden');
+    });
+
+    // Profile dropdown
+    document.getElementById('profileDropdown').addEventListener('click', function() {
+        document.getElementById('dropdownMenu').classList.toggle('hidden');
+    });
+
+    // Close dropdown when clicking outside
+    document.addEventListener('click', function(e) {
+        const dropdown = document.getElementById('profileDropdown');
+        const menu = document.getElementById('dropdownMenu');
+        if (!dropdown.contains(e.target) && !menu.contains(e.target)) {
+            menu.classList.add('hidden');
+        }
+    });
+
+    // Application filters and modal
+    document.getElementById('appStatusFilter').addEventListener('change', filterDSWApplications);
+    document.getElementById('appCategoryFilter').addEventListener('change', filterDSWApplications);
+    document.getElementById('appDepartmentFilter').addEventListener('change', filterDSWApplications);
+    document.getElementById('appRefreshBtn').addEventListener('click', () => loadDSWApplications());
+    document.getElementById('appLoadMoreBtn').addEventListener('click', () => loadDSWApplications(true));
+
+    // Application search
+    document.getElementById('applicationSearchButton').addEventListener('click', searchDSWApplications);
+    document.getElementById('applicationSearchInput').addEventListener('keypress', function(e) {
+        if (e.key === 'Enter') {
+            searchDSWApplications();
+        }
+    });
+
+    // Application modal close
+    document.getElementById('closeAppModal').addEventListener('click', function() {
+        document.getElementById('applicationModal').classList.add('hidden');
+    });
+
+    // Success modal close
+    document.getElementById('closeSuccessModal').addEventListener('click', function() {
+        document.getElementById('successModal').classList.add('hidden');
+    });
+}
+
+function applicationQuery(cursor) {
+    // Filters are applied server-side; the cursor continues the current result set
+    const params = new URLSearchParams();
+    const statusFilter = document.getElementById('appStatusFilter').value;
+    const categoryFilter = document.getElementById('appCategoryFilter').value;
+    const departmentFilter = document.getElementById('appDepartmentFilter').value;
+
+    if (statusFilter) params.set('status', statusFilter);
+    if (categoryFilter) params.set('category', categoryFilter);
+    if (departmentFilter) params.set('department', departmentFilter);
+    if (cursor) params.set('cursor', cursor);
+
+    return params.toString();
+}
+
+async function loadDSWApplications(append = false) {
+    try {
+        const response = await fetch(`/accounts/applications/?${applicationQuery(append ? applicationsCursor : null)}`, {
+            method: 'GET',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken
+            },
+            credentials: 'same-origin'
+        });
+
+        if (response.ok) {
+            const data = await response.json();
+            if (data.success) {
+                allApplications = append ? allApplications.concat(data.applications) : data.applications;
+                applicationsCursor = data.next_cursor;
+                // Keep the oldest token so nothing between loads is skipped
+                syncToken = syncToken || data.sync_token;
+                document.getElementById('appLoadMoreBtn').classList.toggle('hidden', !applicationsCursor);
+                renderDSWApplications(allApplications);
+            } else {
+                console.error('Failed to load applications:', data.message);
+                showMessage('Failed to load applications: ' + data.message, 'error');
+            }
+        } else {
+            console.error('HTTP error:', response.status);
+            showMessage('Failed to load applications. Please try again.', 'error');
+        }
+    } catch (error) {
+        console.error('Error loading applications:', error);
+        showMessage('An error occurred while loading applications.', 'error');
+    }
+}
+
+function renderDSWApplications(applications) {
+    const tbody = document.getElementById('applicationsTableBody');
+    tbody.innerHTML = '';
+
+    if (applications.length === 0) {
+        tbody.innerHTML = '<tr><td colspan="8" class="px-6 py-4 text-center text-gray-500">No DSW applications found</td></tr>';
+        return;
+    }
+
+    applications.forEach(application => {
+        const row = document.createElement('tr');
+        row.className = 'hover:bg-gray-50';
+
+        const statusClass = `status-${application.status}`;
+
+        row.innerHTML = `
+            <td class="px-6 py-4 whitespace-nowrap text-sm font-medium text-gray-900">${application.id}</td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-900">${application.title}</td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-500">${application.student_name} (${application.student_id})</td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-500">${application.category}</td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-500">${application.department}</td>
+            <td class="px-6 py-4 whitespace-nowrap">
+                <span class="px-2 inline-flex text-xs leading-5 font-semibold rounded-full ${statusClass}">
+                    ${application.status.toUpperCase()}
+                </span>
+            </td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-500">${application.date}</td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm font-medium">
+                <button onclick="viewApplication('${application.id}')" class="text-indigo-600 hover:text-indigo-900 mr-3">View</button>
+                <select onchange="updateApplicationStatus('${application.id}', this.value)" class="text-sm border border-gray-300 rounded px-2 py-1">
+                    <option value="">Change Status</option>
+                    <option value="pending" ${application.status === 'pending' ? 'selected' : ''}>Pending</option>
+                    <option value="approved" ${application.status === 'approved' ? 'selected' : ''}>Approved</option>
+                    <option value="rejected" ${application.status === 'rejected' ? 'selected' : ''}>Rejected</option>
+                </select>
+            </td>
+        `;
+
+        tbody.appendChild(row);
+    });
+}
+
+function filterDSWApplications() {
+    loadDSWApplications();
+}
+
+// Upsert changed rows by id and drop deleted ones; rows we don't hold are only
+// added when no server-side filter is active, since they may not match it
+function mergeRows(rows, changedRows, deletedIds, filtersActive) {
+    const merged = rows.filter(row => !deletedIds.includes(row.id));
+    changedRows.forEach(row => {
+        const index = merged.findIndex(existing => existing.id === row.id);
+        if (index >= 0) {
+            merged[index] = row;
+        } else if (!filtersActive) {
+            merged.unshift(row);
+        }
+    });
+    return merged;
+}
+
+function filtersActive(elementIds) {
+    return elementIds.some(id => document.getElementById(id).value);
+}
+
+function startLiveUpdates() {
+    // Push over the ASGI events stream when it is served, otherwise poll
+    let pollTimer = setInterval(syncChanges, SYNC_INTERVAL_MS);
+    if (!window.EventSource) return;
+
+    let pendingSync = null;
+    const source = new EventSource('/events/');
+    source.onopen = function() {
+        clearInterval(pollTimer);
+        pollTimer = null;
+        syncChanges(); // Catch up on anything missed while disconnected
+    };
+    source.onmessage = function() {
+        // Coalesce a burst of events into one delta fetch
+        if (!pendingSync) {
+            pendingSync = setTimeout(() => {
+                pendingSync = null;
+                syncChanges();
+            }, 250);
+        }
+    };
+    source.onerror = function() {
+        if (!pollTimer) {
+            pollTimer = setInterval(syncChanges, SYNC_INTERVAL_MS);
+        }
+    };
+}
+
+async function syncChanges() {
+    // Fetch only what changed since the last sync instead of reloading the queues
+    if (!syncToken) return;
+    try {
+        const response = await fetch(`/accounts/sync/?token=${encodeURIComponent(syncToken)}`, {
+            method: 'GET',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken
+            },
+            credentials: 'same-origin'
+        });
+        if (!response.ok) return;
+        const data = await response.json();
+        if (!data.success) return;
+        syncToken = data.sync_token;
+        if (data.reset) {
+            loadDSWApplications();
+            return;
+        }
+        if (data.applications.length || data.deleted.applications.length) {
+            const active = filtersActive(['appStatusFilter', 'appCategoryFilter', 'appDepartmentFilter']);
+            allApplications = mergeRows(allApplications, data.applications, data.deleted.applications, active);
+            renderDSWApplications(allApplications);
+        }
+    } catch (error) {
+        console.error('Error syncing changes:', error);
+    }
+}
+
+
+async function searchDSWApplications() {
+    const searchQuery = document.getElementById('applicationSearchInput').value.trim();
+
+    if (!searchQuery) {
+        renderDSWApplications(allApplications);
+        return;
+    }
+
+    // Student names and IDs are matched in the loaded rows; titles and descriptions
+    // are searched server-side so matches beyond the loaded pages are found too
+    const needle = searchQuery.toLowerCase();
+    const local = allApplications.filter(application =>
+        application.student_name.toLowerCase().includes(needle) ||
+        application.student_id.toString().includes(needle)
+    );
+
+    try {
+        const params = new URLSearchParams({type: 'applications', q: searchQuery});
+        const response = await fetch(`/accounts/search/?${params}`, {
+            method: 'GET',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken
+            },
+            credentials: 'same-origin'
+        });
+        const data = await response.json();
+        const found = data.success ? data.applications : [];
+        const ids = new Set(found.map(a => a.id));
+        renderDSWApplications(found.concat(local.filter(a => !ids.has(a.id))));
+    } catch (error) {
+        console.error('Error searching applications:', error);
+        renderDSWApplications(local);
+    }
+}
+
+async function viewApplication(applicationId) {
+    try {
+        const response = await fetch(`/accounts/applications/${applicationId}/`, {
+            method: 'GET',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken
+            },
+            credentials: 'same-origin'
+        });
+
+        if (response.ok) {
+            const data = await response.json();
+            if (data.success) {
+                showApplicationModal(data.application);
+            } else {
+                showMessage('Failed to load application details: ' + data.message, 'error');
+            }
+        } else {
+            showMessage('Failed to load application details.', 'error');
+        }
+    } catch (error) {
+        console.error('Error loading application details:', error);
+        showMessage('An error occurred while loading application details.', 'error');
+    }
+}
+
+function showApplicationModal(application) {
+    const modal = document.getElementById('applicationModal');
+    const title = document.getElementById('appModalTitle');
+    const content = document.getElementById('appModalContent');
+
+    title.textContent = `Application ${application.id} - ${application.title}`;
+
+    content.innerHTML = `
+        <div class="grid grid-cols-1 md:grid-cols-2 gap-4">
+            <div>
+                <h4 class="font-semibold text-gray-900 mb-2">Application Information</h4>
+                <p><strong>Title:</strong> ${application.title}</p>
+                <p><strong>Description:</strong> ${application.description}</p>
+                <p><strong>Category:</strong> ${application.application_type}</p>
+                <p><strong>Department:</strong> ${application.department}</p>
+                <p><strong>Status:</strong> <span class="status-${application.status} px-2 py-1 rounded text-xs font-semibold">${application.status.toUpperCase()}</span></p>
+            </div>
+            <div>
+                <h4 class="font-semibold text-gray-900 mb-2">Student Information</h4>
+                <p><strong>Name:</strong> ${application.student_name}</p>
+                <p><strong>College ID:</strong> ${application.student_id}</p>
+                <p><strong>Date Submitted:</strong> ${application.date}</p>
+                <p><strong>Last Updated:</strong> ${application.updated_at}</p>
+            </div>
+        </div>
+    `;
+
+    modal.classList.remove('hidden');
+}
+
+async function updateApplicationStatus(applicationId, newStatus) {
+    if (!newStatus) return;
+    const application = allApplications.find(a => a.id === applicationId);
+
+    try {
+        const response = await fetch('/accounts/applications/update-status/', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken
+            },
+            credentials: 'same-origin',
+            body: JSON.stringify({
+                application_id: applicationId,
+                status: newStatus,
+                version: application ? application.version : undefined
+            })
+        });
+
+        const data = await response.json();
+
+        if (data.success) {
+            showSuccessModal('Application status updated successfully!');
+            // Update the application in our local array
+            if (application) {
+                application.status = newStatus;
+                application.version = data.version;
+                application.updated_at = new Date().toISOString().slice(0, 19).replace('T', ' ');
+                renderDSWApplications(allApplications);
+            }
+        } else if (data.conflict) {
+            // Someone else changed it first; show their status and let the user decide again
+            if (application) {
+                application.status = data.status;
+                application.version = data.version;
+                renderDSWApplications(allApplications);
+            }
+            showMessage('This application was updated by someone else. Its current status is now shown.', 'error');
+        } else {
+            showMessage('Failed to update status: ' + data.message, 'error');
+        }
+    } catch (error) {
+        console.error('Error updating application status:', error);
+        showMessage('An error occurred while updating the status.', 'error');
+    }
+}
+
+function showSection(sectionName) {
+    // Hide all sections
+    const sections = ['applications', 'analytics', 'reports'];
+    sections.forEach(section => {
+        const element = document.getElementById(section);
+        if (element) {
+            element.style.display = 'none';
+        }
+    });
+
+    // Show the selected section
+    const selectedSection = document.getElementById(sectionName);
+    if (selectedSection) {
+        selectedSection.style.display = 'block';
+    }
+
+    // Update sidebar active state
+    const sidebarLinks = document.querySelectorAll('.sidebar-link');
+    sidebarLinks.forEach(link => {
+        link.classList.remove('bg-gray-200');
+    });
+    const clickedLink = event.target.closest('.sidebar-link');
+    if (clickedLink) {
+        clickedLink.classList.add('bg-gray-200');
+    }
+
+    // Load data for analytics section if selected
+    if (sectionName === 'analytics') {
+        loadAnalytics();
+    }
+}
+
+async function loadAnalytics() {
+    try {
+        // Header totals come from server-side counters, not from downloading every application
+        const response = await fetch('/accounts/stats/', {
+            method: 'GET',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken
+            },
+            credentials: 'same-origin'
+        });
+        const data = await response.json();
+        if (data.success) {
+            updateAnalytics(data.applications);
+        }
+    } catch (error) {
+        console.error('Error loading analytics:', error);
+    }
+}
+
+function updateAnalytics(applications) {
+    const byStatus = applications.by_status;
+    // Update total counts (only applications for DSW)
+    document.getElementById('totalComplaints').textContent = applications.total; // Total DSW applications
+    document.getElementById('totalApplications').textContent = byStatus.approved || 0; // Approved applications
+    document.getElementById('pendingItems').textContent = byStatus.pending || 0;
+    document.getElementById('rejectedItems').textContent = byStatus.rejected || 0;
+}
+
+function showMessage(message, type) {
+    // Simple alert for now - you can replace with a proper notification system
+    alert(message);
+}
+
+function showSuccessModal(message) {
+    const modal = document.getElementById('successModal');
+    const messageElement = document.getElementById('successMessage');
+    messageElement.textContent = message;
+    modal.classList.remove('hidden');
+}
@@ -0,0 +1,753 @@
+let allComplaints = [];
+let allApplications = [];
+let complaintsCursor = null;
+let applicationsCursor = null;
+let applicationsLoaded = false;
+let syncToken = null;
+const SYNC_INTERVAL_MS = 30000;
+let csrfToken = document.querySelector('[name=csrfmiddlewaretoken]')?.value || '';
+
+// Initialize dashboard
+document.addEventListener('DOMContentLoaded', function() {
+    const bootstrap = takeBootstrap();
+    if (bootstrap) {
+        applyBootstrap(bootstrap);
+    } else {
+        loadComplaints();
+    }
+    setupEventListeners();
+    startLiveUpdates();
+});
+
+function takeBootstrap() {
+    // First queue pages and counters the server embedded in the page, used once
+    const element = document.getElementById('dashboard-bootstrap');
+    if (!element) return null;
+    element.remove();
+    return JSON.parse(element.textContent);
+}
+
+function applyBootstrap(data) {
+    allComplaints = data.complaints.rows;
+    complaintsCursor = data.complaints.next_cursor;
+    allApplications = data.applications.rows;
+    applicationsCursor = data.applications.next_cursor;
+    applicationsLoaded = true;
+    syncToken = data.sync_token;
+    document.getElementById('loadMoreBtn').classList.toggle('hidden', !complaintsCursor);
+    document.getElementById('appLoadMoreBtn').classList.toggle('hidden', !applicationsCursor);
+    renderComplaints(allComplaints);
+    renderApplications(allApplications);
+    updateAnalytics(data.stats.complaints);
+}
+
+function setupEventListeners() {
+    // Sidebar toggle
+    document.getElementById('sidebarToggle').addEventListener('click', function() {
+        const sidebar = document.getElementById('sidebar');
+        const overlay = document.getElementById('sidebarOverlay');
+        sidebar.classList.toggle('-translate-x-full');
+        overlay.classList.toggle('hidden');
+    });
+
+    // Sidebar overlay click
+    document.getElementById('sidebarOverlay').addEventListener('click', function() {
+        const sidebar = document.getElementById('sidebar');
+        const overlay = document.getElementById('sidebarOverlay');
+        sidebar.classList.add('-translate-x-full');
+        overlay.classList.add('hidden');
+    });
+
+    // Profile dropdown
+    document.getElementById('profileDropdown').addEventListener('click', function() {
+        document.getElementById('dropdownMenu').classList.toggle('hidden');
+    });
+
+    // Close dropdown when clicking outside
+    document.addEventListener('click', function(e) {
+        const dropdown = document.getElementById('profileDropdown');
+        const menu = document.getElementById('dropdownMenu');
+        if (!dropdown.contains(e.target) && !menu.contains(e.target)) {
+            menu.classList.add('hidden');
+        }
+    });
+
+    // Filters
+    document.getElementById('statusFilter').addEventListener('change', filterComplaints);
+    document.getElementById('categoryFilter').addEventListener('change', filterComplaints);
+    document.getElementById('hallFilter').addEventListener('change', filterComplaints);
+    document.getElementById('refreshBtn').addEventListener('click', () => loadComplaints());
+    document.getElementById('exportBtn').addEventListener('click', () => {
+        // Streams every matching complaint, not just the loaded pages
+        const query = queueQuery({status: 'statusFilter', category: 'categoryFilter', hall: 'hallFilter'}, null);
+        window.location = `/accounts/export/complaints/?${query}`;
+    });
+    document.getElementById('loadMoreBtn').addEventListener('click', () => loadComplaints(true));
+
+    // Application filters and modal
+    document.getElementById('appStatusFilter').addEventListener('change', filterApplications);
+    document.getElementById('appCategoryFilter').addEventListener('change', filterApplications);
+    document.getElementById('appDepartmentFilter').addEventListener('change', filterApplications);
+    document.getElementById('appRefreshBtn').addEventListener('click', () => loadApplications());
+    document.getElementById('appLoadMoreBtn').addEventListener('click', () => loadApplications(true));
+
+    // Application search
+    document.getElementById('applicationSearchButton').addEventListener('click', searchApplications);
+    document.getElementById('applicationSearchInput').addEventListener('keypress', function(e) {
+        if (e.key === 'Enter') {
+            searchApplications();
+        }
+    });
+
+    // Modal close
+    document.getElementById('closeModal').addEventListener('click', function() {
+        document.getElementById('complaintModal').classList.add('hidden');
+    });
+
+    // Application modal close
+    document.getElementById('closeAppModal').addEventListener('click', function() {
+        document.getElementById('applicationModal').classList.add('hidden');
+    });
+
+    // Success modal close
+    document.getElementById('closeSuccessModal').addEventListener('click', function() {
+        document.getElementById('successModal').classList.add('hidden');
+    });
+}
+
+function queueQuery(filters, cursor) {
+    // Filters are applied server-side; the cursor continues the current result set
+    const params = new URLSearchParams();
+    Object.entries(filters).forEach(([param, elementId]) => {
+        const value = document.getElementById(elementId).value;
+        if (value) params.set(param, value);
+    });
+    if (cursor) params.set('cursor', cursor);
+    return params.toString();
+}
+
+async function loadComplaints(append = false) {
+    const query = queueQuery(
+        {status: 'statusFilter', category: 'categoryFilter', hall: 'hallFilter'},
+        append ? complaintsCursor : null
+    );
+    try {
+        const response = await fetch(`/accounts/complaints/?${query}`, {
+            method: 'GET',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken
+            },
+            credentials: 'same-origin'
+        });
+
+        if (response.ok) {
+            const data = await response.json();
+            if (data.success) {
+                allComplaints = append ? allComplaints.concat(data.complaints) : data.complaints;
+                complaintsCursor = data.next_cursor;
+                // Keep the oldest token so nothing between loads is skipped
+                syncToken = syncToken || data.sync_token;
+                document.getElementById('loadMoreBtn').classList.toggle('hidden', !complaintsCursor);
+                renderComplaints(allComplaints);
+            } else {
+                console.error('Failed to load complaints:', data.message);
+                showMessage('Failed to load complaints: ' + data.message, 'error');
+            }
+        } else {
+            console.error('HTTP error:', response.status);
+            showMessage('Failed to load complaints. Please try again.', 'error');
+        }
+    } catch (error) {
+        console.error('Error loading complaints:', error);
+        showMessage('An error occurred while loading complaints.', 'error');
+    }
+}
+
+function renderComplaints(complaints) {
+    const tbody = document.getElementById('complaintsTableBody');
+    tbody.innerHTML = '';
+
+    if (complaints.length === 0) {
+        tbody.innerHTML = '<tr><td colspan="8" class="px-6 py-4 text-center text-gray-500">No complaints found</td></tr>';
+        return;
+    }
+
+    complaints.forEach(complaint => {
+        const row = document.createElement('tr');
+        row.className = 'hover:bg-gray-50';
+
+        const statusClass = `status-${complaint.status.replace('-', '-')}`;
+
+        row.innerHTML = `
+            <td class="px-6 py-4 whitespace-nowrap text-sm font-medium text-gray-900">${complaint.id}</td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-900">${complaint.title}</td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-500">${complaint.student_name} (${complaint.student_id})</td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-500">${complaint.hall}</td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-500">${complaint.category}</td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-500">${complaint.priority}</td>
+            <td class="px-6 py-4 whitespace-nowrap">
+                <span class="px-2 inline-flex text-xs leading-5 font-semibold rounded-full ${statusClass}">
+                    ${complaint.status.replace('-', ' ').toUpperCase()}
+                </span>
+            </td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-500">${complaint.date}</td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm font-medium">
+                <button onclick="viewComplaint('${complaint.id}')" class="text-indigo-600 hover:text-indigo-900 mr-3">View</button>
+                <select onchange="updateComplaintStatus('${complaint.id}', this.value)" class="text-sm border border-gray-300 rounded px-2 py-1">
+                    <option value="">Change Status</option>
+                    <option value="pending" ${complaint.status === 'pending' ? 'selected' : ''}>Pending</option>
+                    <option value="in-progress" ${complaint.status === 'in-progress' ? 'selected' : ''}>In Progress</option>
+                    <option value="resolved" ${complaint.status === 'resolved' ? 'selected' : ''}>Resolved</option>
+                    <option value="rejected" ${complaint.status === 'rejected' ? 'selected' : ''}>Rejected</option>
+                </select>
+            </td>
+        `;
+
+        tbody.appendChild(row);
+    });
+}
+
+function filterComplaints() {
+    loadComplaints();
+}
+
+// Upsert changed rows by id and drop deleted ones; rows we don't hold are only
+// added when no server-side filter is active, since they may not match it
+function mergeRows(rows, changedRows, deletedIds, filtersActive) {
+    const merged = rows.filter(row => !deletedIds.includes(row.id));
+    changedRows.forEach(row => {
+        const index = merged.findIndex(existing => existing.id === row.id);
+        if (index >= 0) {
+            merged[index] = row;
+        } else if (!filtersActive) {
+            merged.unshift(row);
+        }
+    });
+    return merged;
+}
+
+function filtersActive(elementIds) {
+    return elementIds.some(id => document.getElementById(id).value);
+}
+
+function startLiveUpdates() {
+    // Push over the ASGI events stream when it is served, otherwise poll
+    let pollTimer = setInterval(syncChanges, SYNC_INTERVAL_MS);
+    if (!window.EventSource) return;
+
+    let pendingSync = null;
+    const source = new EventSource('/events/');
+    source.onopen = function() {
+        clearInterval(pollTimer);
+        pollTimer = null;
+        syncChanges(); // Catch up on anything missed while disconnected
+    };
+    source.onmessage = function() {
+        // Coalesce a burst of events into one delta fetch
+        if (!pendingSync) {
+            pendingSync = setTimeout(() => {
+                pendingSync = null;
+                syncChanges();
+            }, 250);
+        }
+    };
+    source.onerror = function() {
+        if (!pollTimer) {
+            pollTimer = setInterval(syncChanges, SYNC_INTERVAL_MS);
+        }
+    };
+}
+
+async function syncChanges() {
+    // Fetch only what changed since the last sync instead of reloading the queues
+    if (!syncToken) return;
+    try {
+        const response = await fetch(`/accounts/sync/?token=${encodeURIComponent(syncToken)}`, {
+            method: 'GET',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken
+            },
+            credentials: 'same-origin'
+        });
+        if (!response.ok) return;
+        const data = await response.json();
+        if (!data.success) return;
+        syncToken = data.sync_token;
+        if (data.reset) {
+            loadComplaints();
+            if (applicationsLoaded) loadApplications();
+            return;
+        }
+        if (data.complaints.length || data.deleted.complaints.length) {
+            const active = filtersActive(['statusFilter', 'categoryFilter', 'hallFilter']);
+            allComplaints = mergeRows(allComplaints, data.complaints, data.deleted.complaints, active);
+            renderComplaints(allComplaints);
+        }
+        if (applicationsLoaded && (data.applications.length || data.deleted.applications.length)) {
+            const active = filtersActive(['appStatusFilter', 'appCategoryFilter', 'appDepartmentFilter']);
+            allApplications = mergeRows(allApplications, data.applications, data.deleted.applications, active);
+            renderApplications(allApplications);
+        }
+    } catch (error) {
+        console.error('Error syncing changes:', error);
+    }
+}
+
+
+async function viewComplaint(complaintId) {
+    try {
+        const response = await fetch(`/accounts/complaints/${complaintId}/`, {
+            method: 'GET',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken
+            },
+            credentials: 'same-origin'
+        });
+
+        if (response.ok) {
+            const data = await response.json();
+            if (data.success) {
+                showComplaintModal(data.complaint);
+            } else {
+                showMessage('Failed to load complaint details: ' + data.message, 'error');
+            }
+        } else {
+            showMessage('Failed to load complaint details.', 'error');
+        }
+    } catch (error) {
+        console.error('Error loading complaint details:', error);
+        showMessage('An error occurred while loading complaint details.', 'error');
+    }
+}
+
+function showComplaintModal(complaint) {
+    const modal = document.getElementById('complaintModal');
+    const title = document.getElementById('modalTitle');
+    const content = document.getElementById('modalContent');
+
+    title.textContent = `Complaint ${complaint.id} - ${complaint.title}`;
+
+    content.innerHTML = `
+        <div class="grid grid-cols-1 md:grid-cols-2 gap-4">
+            <div>
+                <h4 class="font-semibold text-gray-900 mb-2">Complaint Information</h4>
+                <p><strong>Title:</strong> ${complaint.title}</p>
+                <p><strong>Description:</strong> ${complaint.description}</p>
+                <p><strong>Category:</strong> ${complaint.category}</p>
+                <p><strong>Hall:</strong> ${complaint.hall}</p>
+                <p><strong>Priority:</strong> ${complaint.priority}</p>
+                <p><strong>Status:</strong> <span class="status-${complaint.status.replace('-', '-')} px-2 py-1 rounded text-xs font-semibold">${complaint.status.replace('-', ' ').toUpperCase()}</span></p>
+            </div>
+            <div>
+                <h4 class="font-semibold text-gray-900 mb-2">Student Information</h4>
+                <p><strong>Name:</strong> ${complaint.student_name}</p>
+                <p><strong>College ID:</strong> ${complaint.student_id}</p>
+                <p><strong>Date Submitted:</strong> ${complaint.date}</p>
+                <p><strong>Last Updated:</strong> ${complaint.updated_at}</p>
+            </div>
+        </div>
+    `;
+
+    modal.classList.remove('hidden');
+}
+
+async function updateComplaintStatus(complaintId, newStatus) {
+    if (!newStatus) return;
+    const complaint = allComplaints.find(c => c.id === complaintId);
+
+    try {
+        const response = await fetch('/accounts/complaints/update-status/', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken
+            },
+            credentials: 'same-origin',
+            body: JSON.stringify({
+                complaint_id: complaintId,
+                status: newStatus,
+                version: complaint ? complaint.version : undefined
+            })
+        });
+
+        const data = await response.json();
+
+        if (data.success) {
+            showMessage('Complaint status updated successfully!', 'success');
+            // Update the complaint in our local array
+            if (complaint) {
+                complaint.status = newStatus;
+                complaint.version = data.version;
+                complaint.updated_at = new Date().toISOString().slice(0, 19).replace('T', ' ');
+                renderComplaints(allComplaints);
+            }
+        } else if (data.conflict) {
+            // Someone else changed it first; show their status and let the user decide again
+            if (complaint) {
+                complaint.status = data.status;
+                complaint.version = data.version;
+                renderComplaints(allComplaints);
+            }
+            showMessage('This complaint was updated by someone else. Its current status is now shown.', 'error');
+        } else {
+            showMessage('Failed to update status: ' + data.message, 'error');
+        }
+    } catch (error) {
+        console.error('Error updating status:', error);
+        showMessage('An error occurred while updating the status.', 'error');
+    }
+}
+
+function showMessage(message, type) {
+    const successModal = document.getElementById('successModal');
+    const successMessage = document.getElementById('successMessage');
+
+    if (type === 'success') {
+        successMessage.textContent = message;
+        successModal.classList.remove('hidden');
+    } else {
+        alert(message); // Fallback for error messages
+    }
+}
+
+function showSection(sectionName) {
+    // Hide all sections
+    const sections = ['complaints', 'applications', 'analytics'];
+    sections.forEach(section => {
+        const element = document.getElementById(section);
+        if (element) {
+            element.style.display = 'none';
+        }
+    });
+
+    // Remove active class from all sidebar links
+    const sidebarLinks = document.querySelectorAll('.sidebar-link');
+    sidebarLinks.forEach(link => {
+        link.classList.remove('bg-gray-200');
+    });
+
+    // Show selected section
+    const selectedSection = document.getElementById(sectionName);
+    if (selectedSection) {
+        selectedSection.style.display = 'block';
+    }
+
+    // Add active class to clicked link
+    const clickedLink = document.querySelector(`[onclick="showSection('${sectionName}')"]`);
+    if (clickedLink) {
+        clickedLink.classList.add('bg-gray-200');
+    }
+
+    // Load data for respective sections
+    if (sectionName === 'analytics') {
+        loadAnalytics();
+    } else if (sectionName === 'applications' && !applicationsLoaded) {
+        // Once loaded, live updates keep the list current
+        loadApplications();
+    }
+}
+
+async function loadAnalytics() {
+    try {
+        // Header totals come from server-side counters, not from downloading every complaint
+        const response = await fetch('/accounts/stats/', {
+            method: 'GET',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken
+            },
+            credentials: 'same-origin'
+        });
+        const data = await response.json();
+        if (data.success) {
+            updateAnalytics(data.complaints);
+        }
+    } catch (error) {
+        console.error('Error loading analytics:', error);
+    }
+}
+
+function updateAnalytics(complaints) {
+    const byStatus = complaints.by_status;
+    // Update total counts (only complaints for Provost)
+    document.getElementById('totalComplaints').textContent = complaints.total; // Total Provost complaints
+    document.getElementById('totalApplications').textContent = byStatus.resolved || 0; // Resolved complaints
+    document.getElementById('pendingItems').textContent = byStatus.pending || 0;
+    document.getElementById('rejectedItems').textContent = byStatus.rejected || 0;
+}
+
+async function loadApplications(append = false) {
+    const query = queueQuery(
+        {status: 'appStatusFilter', category: 'appCategoryFilter', department: 'appDepartmentFilter'},
+        append ? applicationsCursor : null
+    );
+    try {
+        const response = await fetch(`/accounts/applications/?${query}`, {
+            method: 'GET',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken
+            },
+            credentials: 'same-origin'
+        });
+
+        if (response.ok) {
+            const data = await response.json();
+            if (data.success) {
+                allApplications = append ? allApplications.concat(data.applications) : data.applications;
+                applicationsCursor = data.next_cursor;
+                applicationsLoaded = true;
+                syncToken = syncToken || data.sync_token;
+                document.getElementById('appLoadMoreBtn').classList.toggle('hidden', !applicationsCursor);
+                renderApplications(allApplications);
+            } else {
+                console.error('Failed to load applications:', data.message);
+                showMessage('Failed to load applications: ' + data.message, 'error');
+            }
+        } else {
+            console.error('HTTP error:', response.status);
+            showMessage('Failed to load applications. Please try again.', 'error');
+        }
+    } catch (error) {
+        console.error('Error loading applications:', error);
+        showMessage('An error occurred while loading applications.', 'error');
+    }
+}
+
+function renderApplications(applications) {
+    const tbody = document.getElementById('applicationsTableBody');
+    tbody.innerHTML = '';
+
+    if (applications.length === 0) {
+        tbody.innerHTML = '<tr><td colspan="8" class="px-6 py-4 text-center text-gray-500">No applications found</td></tr>';
+        return;
+    }
+
+    applications.forEach(application => {
+        const row = document.createElement('tr');
+        row.className = 'hover:bg-gray-50';
+
+        const statusClass = `status-${application.status}`;
+
+        row.innerHTML = `
+            <td class="px-6 py-4 whitespace-nowrap text-sm font-medium text-gray-900">${application.id}</td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-900">${application.title}</td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-500">${application.student_name} (${application.student_id})</td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-500">${application.category}</td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-500">${application.department}</td>
+            <td class="px-6 py-4 whitespace-nowrap">
+                <span class="px-2 inline-flex text-xs leading-5 font-semibold rounded-full ${statusClass}">
+                    ${application.status.toUpperCase()}
+                </span>
+            </td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-500">${application.date}</td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-500">
+                ${application.verified ? '<span class="text-green-600 font-semibold">✓ Verified</span>' : '<span class="text-red-600 font-semibold">✗ Not Verified</span>'}
+            </td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm font-medium">
+                <button onclick="viewApplication('${application.id}')" class="text-indigo-600 hover:text-indigo-900 mr-3">View</button>
+                ${!application.verified ? `<button onclick="verifyApplication('${application.id}')" class="bg-green-500 text-white px-3 py-1 rounded text-sm hover:bg-green-600 mr-3">Verify</button>` : ''}
+                <select onchange="updateApplicationStatus('${application.id}', this.value)" class="text-sm border border-gray-300 rounded px-2 py-1">
+                    <option value="">Change Status</option>
+                    <option value="pending" ${application.status === 'pending' ? 'selected' : ''}>Pending</option>
+                    <option value="approved" ${application.status === 'approved' ? 'selected' : ''}>Approved</option>
+                    <option value="rejected" ${application.status === 'rejected' ? 'selected' : ''}>Rejected</option>
+                </select>
+            </td>
+        `;
+
+        tbody.appendChild(row);
+    });
+}
+
+function filterApplications() {
+    loadApplications();
+}
+
+async function searchApplications() {
+    const searchTerm = document.getElementById('applicationSearchInput').value.trim();
+
+    if (!searchTerm) {
+        renderApplications(allApplications);
+        return;
+    }
+
+    // Student names and IDs are matched in the loaded rows; titles and descriptions
+    // are searched server-side so matches beyond the loaded pages are found too
+    const needle = searchTerm.toLowerCase();
+    const local = allApplications.filter(application =>
+        application.student_name.toLowerCase().includes(needle) ||
+        application.student_id.toLowerCase().includes(needle) ||
+        application.id.toLowerCase().includes(needle)
+    );
+
+    try {
+        const params = new URLSearchParams({type: 'applications', q: searchTerm});
+        const response = await fetch(`/accounts/search/?${params}`, {
+            method: 'GET',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken
+            },
+            credentials: 'same-origin'
+        });
+        const data = await response.json();
+        const found = data.success ? data.applications : [];
+        const ids = new Set(found.map(a => a.id));
+        renderApplications(found.concat(local.filter(a => !ids.has(a.id))));
+    } catch (error) {
+        console.error('Error searching applications:', error);
+        renderApplications(local);
+    }
+}
+
+async function viewApplication(applicationId) {
+    try {
+        const response = await fetch(`/accounts/applications/${applicationId}/`, {
+            method: 'GET',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken
+            },
+            credentials: 'same-origin'
+        });
+
+        if (response.ok) {
+            const data = await response.json();
+            if (data.success) {
+                showApplicationModal(data.application);
+            } else {
+                showMessage('Failed to load application details: ' + data.message, 'error');
+            }
+        } else {
+            showMessage('Failed to load application details.', 'error');
+        }
+    } catch (error) {
+        console.error('Error loading application details:', error);
+        showMessage('An error occurred while loading application details.', 'error');
+    }
+}
+
+function showApplicationModal(application) {
+    const modal = document.getElementById('applicationModal');
+    const title = document.getElementById('appModalTitle');
+    const content = document.getElementById('appModalContent');
+
+    title.textContent = `Application ${application.id} - ${application.title}`;
+
+    content.innerHTML = `
+        <div class="grid grid-cols-1 md:grid-cols-2 gap-4">
+            <div>
+                <h4 class="font-semibold text-gray-900 mb-2">Application Information</h4>
+                <p><strong>Title:</strong> ${application.title}</p>
+                <p><strong>Description:</strong> ${application.description}</p>
+                <p><strong>Category:</strong> ${application.application_type}</p>
+                <p><strong>Department:</strong> ${application.department}</p>
+                <p><strong>Status:</strong> <span class="status-${application.status} px-2 py-1 rounded text-xs font-semibold">${application.status.toUpperCase()}</span></p>
+            </div>
+            <div>
+                <h4 class="font-semibold text-gray-900 mb-2">Student Information</h4>
+                <p><strong>Name:</strong> ${application.student_name}</p>
+                <p><strong>College ID:</strong> ${application.student_id}</p>
+                <p><strong>Date Submitted:</strong> ${application.date}</p>
+                <p><strong>Last Updated:</strong> ${application.updated_at}</p>
+            </div>
+        </div>
+    `;
+
+    modal.classList.remove('hidden');
+}
+
+async function verifyApplication(applicationId) {
+    const application = allApplications.find(a => a.id === applicationId);
+
+    try {
+        const response = await fetch('/accounts/applications/verify/', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken
+            },
+            credentials: 'same-origin',
+            body: JSON.stringify({
+                application_id: applicationId,
+                version: application ? application.version : undefined
+            })
+        });
+
+        const data = await response.json();
+
+        if (data.success) {
+            showMessage('Application verified successfully!', 'success');
+            // Update the application in our local array
+            if (application) {
+                application.verified = true;
+                application.version = data.version;
+                renderApplications(allApplications);
+            }
+        } else if (data.conflict) {
+            if (application) {
+                application.status = data.status;
+                application.verified = data.verified;
+                application.version = data.version;
+                renderApplications(allApplications);
+            }
+            showMessage('This application was updated by someone else. Its current state is now shown.', 'error');
+        } else {
+            showMessage('Failed to verify application: ' + data.message, 'error');
+        }
+    } catch (error) {
+        console.error('Error verifying application:', error);
+        showMessage('An error occurred while verifying the application.', 'error');
+    }
+}
+
+async function updateApplicationStatus(applicationId, newStatus) {
+    if (!newStatus) return;
+    const application = allApplications.find(a => a.id === applicationId);
+
+    try {
+        const response = await fetch('/accounts/applications/update-status/', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken
+            },
+            credentials: 'same-origin',
+            body: JSON.stringify({
+                application_id: applicationId,
+                status: newStatus,
+                version: application ? application.version : undefined
+            })
+        });
+
+        const data = await response.json();
+
+        if (data.success) {
+            showMessage('Application status updated successfully!', 'success');
+            // Update the application in our local array
+            if (application) {
+                application.status = newStatus;
+                application.version = data.version;
+                application.updated_at = new Date().toISOString().slice(0, 19).replace('T', ' ');
+                renderApplications(allApplications);
+            }
+        } else if (data.conflict) {
+            if (application) {
+                application.status = data.status;
+                application.verified = data.verified;
+                application.version = data.version;
+                renderApplications(allApplications);
+            }
+            showMessage('This application was updated by someone else. Its current status is now shown.', 'error');
+        } else {
+            showMessage('Failed to update status: ' + data.message, 'error');
+        }
+    } catch (error) {
+        console.error('Error updating status:', error);
+        showMessage('An error occurred while updating the status.', 'error');
+    }
+}
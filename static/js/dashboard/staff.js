@@ -0,0 +1,362 @@
+let allComplaints = [];
+let nextCursor = null;
+let syncToken = null;
+const SYNC_INTERVAL_MS = 30000;
+let csrfToken = document.querySelector('[name=csrfmiddlewaretoken]')?.value || '';
+
+// Initialize dashboard
+document.addEventListener('DOMContentLoaded', function() {
+    const bootstrap = takeBootstrap();
+    if (bootstrap) {
+        applyBootstrap(bootstrap);
+    } else {
+        loadComplaints();
+    }
+    setupEventListeners();
+    startLiveUpdates();
+});
+
+function takeBootstrap() {
+    // First queue page and counters the server embedded in the page, used once
+    const element = document.getElementById('dashboard-bootstrap');
+    if (!element) return null;
+    element.remove();
+    return JSON.parse(element.textContent);
+}
+
+function applyBootstrap(data) {
+    allComplaints = data.complaints.rows;
+    nextCursor = data.complaints.next_cursor;
+    syncToken = data.sync_token;
+    document.getElementById('loadMoreBtn').classList.toggle('hidden', !nextCursor);
+    renderComplaints(allComplaints);
+}
+
+function setupEventListeners() {
+    // Sidebar toggle
+    document.getElementById('sidebarToggle').addEventListener('click', function() {
+        const sidebar = document.getElementById('sidebar');
+        const overlay = document.getElementById('sidebarOverlay');
+        sidebar.classList.toggle('-translate-x-full');
+        overlay.classList.toggle('hidden');
+    });
+
+    // Sidebar overlay click
+    document.getElementById('sidebarOverlay').addEventListener('click', function() {
+        const sidebar = document.getElementById('sidebar');
+        const overlay = document.getElementById('sidebarOverlay');
+        sidebar.classList.add('-translate-x-full');
+        overlay.classList.add('hidden');
+    });
+
+    // Profile dropdown
+    document.getElementById('profileDropdown').addEventListener('click', function() {
+        document.getElementById('dropdownMenu').classList.toggle('hidden');
+    });
+
+    // Close dropdown when clicking outside
+    document.addEventListener('click', function(e) {
+        const dropdown = document.getElementById('profileDropdown');
+        const menu = document.getElementById('dropdownMenu');
+        if (!dropdown.contains(e.target) && !menu.contains(e.target)) {
+            menu.classList.add('hidden');
+        }
+    });
+
+    // Filters
+    document.getElementById('statusFilter').addEventListener('change', filterComplaints);
+    document.getElementById('categoryFilter').addEventListener('change', filterComplaints);
+    document.getElementById('refreshBtn').addEventListener('click', () => loadComplaints());
+    document.getElementById('exportBtn').addEventListener('click', () => {
+        // Streams every matching complaint, not just the loaded pages
+        window.location = `/accounts/export/complaints/?${complaintQuery(null)}`;
+    });
+    document.getElementById('loadMoreBtn').addEventListener('click', () => loadComplaints(true));
+
+    // Modal close
+    document.getElementById('closeModal').addEventListener('click', function() {
+        document.getElementById('complaintModal').classList.add('hidden');
+    });
+}
+
+function complaintQuery(cursor) {
+    // Filters are applied server-side; the cursor continues the current result set
+    const params = new URLSearchParams();
+    const statusFilter = document.getElementById('statusFilter').value;
+    const categoryFilter = document.getElementById('categoryFilter').value;
+
+    if (statusFilter) params.set('status', statusFilter);
+    if (categoryFilter) params.set('category', categoryFilter);
+    if (cursor) params.set('cursor', cursor);
+
+    return params.toString();
+}
+
+async function loadComplaints(append = false) {
+    try {
+        const response = await fetch(`/api/complaints/?${complaintQuery(append ? nextCursor : null)}`, {
+            method: 'GET',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken
+            },
+            credentials: 'same-origin'
+        });
+
+        if (response.ok) {
+            const data = await response.json();
+            if (data.success) {
+                allComplaints = append ? allComplaints.concat(data.complaints) : data.complaints;
+                nextCursor = data.next_cursor;
+                // Keep the oldest token so nothing between loads is skipped
+                syncToken = syncToken || data.sync_token;
+                document.getElementById('loadMoreBtn').classList.toggle('hidden', !nextCursor);
+                renderComplaints(allComplaints);
+            } else {
+                console.error('Failed to load complaints:', data.message);
+                showMessage('Failed to load complaints: ' + data.message, 'error');
+            }
+        } else {
+            console.error('HTTP error:', response.status);
+            showMessage('Failed to load complaints. Please try again.', 'error');
+        }
+    } catch (error) {
+        console.error('Error loading complaints:', error);
+        showMessage('An error occurred while loading complaints.', 'error');
+    }
+}
+
+function renderComplaints(complaints) {
+    const tbody = document.getElementById('complaintsTableBody');
+    tbody.innerHTML = '';
+
+    if (complaints.length === 0) {
+        tbody.innerHTML = '<tr><td colspan="8" class="px-6 py-4 text-center text-gray-500">No complaints found</td></tr>';
+        return;
+    }
+
+    complaints.forEach(complaint => {
+        const row = document.createElement('tr');
+        row.className = 'hover:bg-gray-50';
+
+        const statusClass = `status-${complaint.status.replace('-', '-')}`;
+
+        row.innerHTML = `
+            <td class="px-6 py-4 whitespace-nowrap text-sm font-medium text-gray-900">${complaint.id}</td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-900">${complaint.title}</td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-500">${complaint.student_name} (${complaint.student_id})</td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-500">${complaint.category}</td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-500">${complaint.priority}</td>
+            <td class="px-6 py-4 whitespace-nowrap">
+                <span class="px-2 inline-flex text-xs leading-5 font-semibold rounded-full ${statusClass}">
+                    ${complaint.status.replace('-', ' ').toUpperCase()}
+                </span>
+            </td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-500">${complaint.date}</td>
+            <td class="px-6 py-4 whitespace-nowrap text-sm font-medium">
+                <button onclick="viewComplaint('${complaint.id}')" class="text-indigo-600 hover:text-indigo-900 mr-3">View</button>
+                <select onchange="updateStatus('${complaint.id}', this.value)" class="text-sm border border-gray-300 rounded px-2 py-1">
+                    <option value="">Change Status</option>
+                    <option value="pending" ${complaint.status === 'pending' ? 'selected' : ''}>Pending</option>
+                    <option value="in-progress" ${complaint.status === 'in-progress' ? 'selected' : ''}>In Progress</option>
+                    <option value="resolved" ${complaint.status === 'resolved' ? 'selected' : ''}>Resolved</option>
+                    <option value="rejected" ${complaint.status === 'rejected' ? 'selected' : ''}>Rejected</option>
+                </select>
+            </td>
+        `;
+
+        tbody.appendChild(row);
+    });
+}
+
+function filterComplaints() {
+    loadComplaints();
+}
+
+// Upsert changed rows by id and drop deleted ones; rows we don't hold are only
+// added when no server-side filter is active, since they may not match it
+function mergeRows(rows, changedRows, deletedIds, filtersActive) {
+    const merged = rows.filter(row => !deletedIds.includes(row.id));
+    changedRows.forEach(row => {
+        const index = merged.findIndex(existing => existing.id === row.id);
+        if (index >= 0) {
+            merged[index] = row;
+        } else if (!filtersActive) {
+            merged.unshift(row);
+        }
+    });
+    return merged;
+}
+
+function filtersActive(elementIds) {
+    return elementIds.some(id => document.getElementById(id).value);
+}
+
+function startLiveUpdates() {
+    // Push over the ASGI events stream when it is served, otherwise poll
+    let pollTimer = setInterval(syncChanges, SYNC_INTERVAL_MS);
+    if (!window.EventSource) return;
+
+    let pendingSync = null;
+    const source = new EventSource('/events/');
+    source.onopen = function() {
+        clearInterval(pollTimer);
+        pollTimer = null;
+        syncChanges(); // Catch up on anything missed while disconnected
+    };
+    source.onmessage = function() {
+        // Coalesce a burst of events into one delta fetch
+        if (!pendingSync) {
+            pendingSync = setTimeout(() => {
+                pendingSync = null;
+                syncChanges();
+            }, 250);
+        }
+    };
+    source.onerror = function() {
+        if (!pollTimer) {
+            pollTimer = setInterval(syncChanges, SYNC_INTERVAL_MS);
+        }
+    };
+}
+
+async function syncChanges() {
+    // Fetch only what changed since the last sync instead of reloading the queues
+    if (!syncToken) return;
+    try {
+        const response = await fetch(`/api/sync/?token=${encodeURIComponent(syncToken)}`, {
+            method: 'GET',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken
+            },
+            credentials: 'same-origin'
+        });
+        if (!response.ok) return;
+        const data = await response.json();
+        if (!data.success) return;
+        syncToken = data.sync_token;
+        if (data.reset) {
+            loadComplaints();
+            return;
+        }
+        if (data.complaints.length || data.deleted.complaints.length) {
+            const active = filtersActive(['statusFilter', 'categoryFilter']);
+            allComplaints = mergeRows(allComplaints, data.complaints, data.deleted.complaints, active);
+            renderComplaints(allComplaints);
+        }
+    } catch (error) {
+        console.error('Error syncing changes:', error);
+    }
+}
+
+
+async function viewComplaint(complaintId) {
+    try {
+        const response = await fetch(`/api/complaints/${complaintId}/`, {
+            method: 'GET',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken
+            },
+            credentials: 'same-origin'
+        });
+
+        if (response.ok) {
+            const data = await response.json();
+            if (data.success) {
+                showComplaintModal(data.complaint);
+            } else {
+                showMessage('Failed to load complaint details: ' + data.message, 'error');
+            }
+        } else {
+            showMessage('Failed to load complaint details.', 'error');
+        }
+    } catch (error) {
+        console.error('Error loading complaint details:', error);
+        showMessage('An error occurred while loading complaint details.', 'error');
+    }
+}
+
+function showComplaintModal(complaint) {
+    const modal = document.getElementById('complaintModal');
+    const title = document.getElementById('modalTitle');
+    const content = document.getElementById('modalContent');
+
+    title.textContent = `Complaint ${complaint.id} - ${complaint.title}`;
+
+    content.innerHTML = `
+        <div class="grid grid-cols-1 md:grid-cols-2 gap-4">
+            <div>
+                <h4 class="font-semibold text-gray-900 mb-2">Complaint Information</h4>
+                <p><strong>Title:</strong> ${complaint.title}</p>
+                <p><strong>Description:</strong> ${complaint.description}</p>
+                <p><strong>Category:</strong> ${complaint.category}</p>
+                <p><strong>Hall:</strong> ${complaint.hall}</p>
+                <p><strong>Priority:</strong> ${complaint.priority}</p>
+                <p><strong>Status:</strong> <span class="status-${complaint.status.replace('-', '-')} px-2 py-1 rounded text-xs font-semibold">${complaint.status.replace('-', ' ').toUpperCase()}</span></p>
+            </div>
+            <div>
+                <h4 class="font-semibold text-gray-900 mb-2">Student Information</h4>
+                <p><strong>Name:</strong> ${complaint.student_name}</p>
+                <p><strong>College ID:</strong> ${complaint.student_id}</p>
+                <p><strong>Date Submitted:</strong> ${complaint.date}</p>
+                <p><strong>Last Updated:</strong> ${complaint.updated_at}</p>
+            </div>
+        </div>
+    `;
+
+    modal.classList.remove('hidden');
+}
+
+async function updateStatus(complaintId, newStatus) {
+    if (!newStatus) return;
+    const complaint = allComplaints.find(c => c.id === complaintId);
+
+    try {
+        const response = await fetch('/accounts/complaints/update-status/', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken
+            },
+            credentials: 'same-origin',
+            body: JSON.stringify({
+                complaint_id: complaintId,
+                status: newStatus,
+                version: complaint ? complaint.version : undefined
+            })
+        });
+
+        const data = await response.json();
+
+        if (data.success) {
+            showMessage('Complaint status updated successfully!', 'success');
+            // Update the complaint in our local array
+            if (complaint) {
+                complaint.status = newStatus;
+                complaint.version = data.version;
+                complaint.updated_at = new Date().toISOString().slice(0, 19).replace('T', ' ');
+                renderComplaints(allComplaints);
+            }
+        } else if (data.conflict) {
+            // Someone else changed it first; show their status and let the user decide again
+            if (complaint) {
+                complaint.status = data.status;
+                complaint.version = data.version;
+                renderComplaints(allComplaints);
+            }
+            showMessage('This complaint was updated by someone else. Its current status is now shown.', 'error');
+        } else {
+            showMessage('Failed to update status: ' + data.message, 'error');
+        }
+    } catch (error) {
+        console.error('Error updating status:', error);
+        showMessage('An error occurred while updating the status.', 'error');
+    }
+}
+
+function showMessage(message, type) {
+    // Simple alert for now - you can replace with a proper notification system
+    alert(message);
+}